@@ -6,96 +6,116 @@ from discord.ext import commands
 from discord import app_commands
 from typing import Optional
 import asyncio
+import logging
+import re
+import sqlite3
+
+logger = logging.getLogger(__name__)
+
+# Every placeholder plus literal "\n" sequences, matched in a single pass over the message
+_PLACEHOLDER_RE = re.compile(r"\{(thread|user|guild|channel|reply|ln|line)\}|\\n")
+
+# Placeholder -> (getter, fallback), getters only run for placeholders present in the message
+_THREAD_PLACEHOLDERS = {
+    "thread": (lambda thread: thread.name, "**#thread**"),
+    "user": (lambda thread: thread.owner.mention, "**@user**"),
+    "guild": (lambda thread: thread.guild.name, "**#guild**"),
+    "channel": (lambda thread: thread.parent.name if thread.parent else "**#channel**", "**#channel**"),
+}
 
 class AutoMessage(commands.GroupCog, name="automsg"):
     def __init__(self, bot):
         self.bot = bot
         self.db = bot.db
-        self._create_table()
+        # guild_id -> (channel_id, message_content), or None when the guild has no config
+        self._cfg_cache: dict[int, Optional[tuple]] = {}
+    
+    async def cog_load(self):
+        await self.bot.run_db(self._create_table)
     
     def _create_table(self):
         """Create the forum_auto_messages table if it doesn't exist."""
         try:
-            cursor = self.db.cursor()
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS forum_auto_messages (
-                    guild_id INTEGER PRIMARY KEY,
-                    channel_id INTEGER NOT NULL,
-                    message_content TEXT NOT NULL
-                )
-            ''')
-            self.db.commit()
-            cursor.close()
-        except Exception as e:
-            print(f"Error creating forum_auto_messages table: {e}")
+            with self.db:
+                self.db.execute('''
+                    CREATE TABLE IF NOT EXISTS forum_auto_messages (
+                        guild_id INTEGER PRIMARY KEY,
+                        channel_id INTEGER NOT NULL,
+                        message_content TEXT NOT NULL
+                    )
+                ''')
+        except sqlite3.Error:
+            logger.exception("Error creating forum_auto_messages table")
     
+    def _fetch_forum_auto_message(self, guild_id: int) -> Optional[tuple]:
+        row = self.db.execute(
+            'SELECT channel_id, message_content FROM forum_auto_messages WHERE guild_id = ?',
+            (guild_id,)
+        ).fetchone()
+        return tuple(row) if row else None
+
+    def _store_forum_auto_message(self, guild_id: int, channel_id: int, message_content: str):
+        self.db.execute('''
+            INSERT INTO forum_auto_messages (guild_id, channel_id, message_content)
+            VALUES (?, ?, ?)
+            ON CONFLICT(guild_id) DO UPDATE SET
+                channel_id = excluded.channel_id,
+                message_content = excluded.message_content
+        ''', (guild_id, channel_id, message_content))
+        self.db.commit()
+
+    def _delete_forum_auto_message(self, guild_id: int):
+        self.db.execute(
+            'DELETE FROM forum_auto_messages WHERE guild_id = ?',
+            (guild_id,)
+        )
+        self.db.commit()
+
     async def _get_forum_auto_message(self, guild_id: int) -> Optional[tuple]:
         """Get the auto-message configuration for a guild."""
+        if guild_id in self._cfg_cache:
+            return self._cfg_cache[guild_id]
         try:
-            cursor = self.db.cursor()
-            cursor.execute(
-                'SELECT channel_id, message_content FROM forum_auto_messages WHERE guild_id = ?',
-                (guild_id,)
-            )
-            result = cursor.fetchone()
-            cursor.close()
+            result = await self.bot.run_db(self._fetch_forum_auto_message, guild_id)
+            self._cfg_cache[guild_id] = result
             return result
-        except Exception as e:
-            print(f"Error getting forum auto-message: {e}")
+        except sqlite3.Error:
+            logger.exception(f"Error getting forum auto-message for guild {guild_id}")
             return None
-    
+
     async def _set_forum_auto_message(self, guild_id: int, channel_id: int, message_content: str) -> bool:
         """Set or update the auto-message configuration for a guild."""
         try:
-            cursor = self.db.cursor()
-            cursor.execute('''
-                INSERT INTO forum_auto_messages (guild_id, channel_id, message_content)
-                VALUES (?, ?, ?)
-                ON CONFLICT(guild_id) DO UPDATE SET
-                    channel_id = excluded.channel_id,
-                    message_content = excluded.message_content
-            ''', (guild_id, channel_id, message_content))
-            self.db.commit()
-            cursor.close()
+            await self.bot.run_db(self._store_forum_auto_message, guild_id, channel_id, message_content)
+            self._cfg_cache[guild_id] = (channel_id, message_content)
             return True
-        except Exception as e:
-            print(f"Error setting forum auto-message: {e}")
+        except sqlite3.Error:
+            logger.exception(f"Error setting forum auto-message for guild {guild_id}")
             return False
 
-    async def _format_auto_message(self, message: str, thread: discord.Thread) -> str:
+    def _format_auto_message(self, message: str, thread: discord.Thread) -> str:
         """Format the auto-message with thread information."""
-        formatted_message = message
-        
-        # Safely replace thread placeholders with fallbacks
-        try:
-            formatted_message = formatted_message.replace("{thread}", thread.name)
-        except (AttributeError, TypeError):
-            formatted_message = formatted_message.replace("{thread}", "**#thread**")
-            
-        try:
-            formatted_message = formatted_message.replace("{user}", thread.owner.mention)
-        except (AttributeError, TypeError):
-            formatted_message = formatted_message.replace("{user}", "**@user**")
-            
-        try:
-            formatted_message = formatted_message.replace("{guild}", thread.guild.name)
-        except (AttributeError, TypeError):
-            formatted_message = formatted_message.replace("{guild}", "**#guild**")
-            
-        try:
-            formatted_message = formatted_message.replace("{channel}", thread.parent.name if thread.parent else "**#channel**")
-        except (AttributeError, TypeError):
-            formatted_message = formatted_message.replace("{channel}", "**#channel**")
-        
-        # Remove {reply} placeholder if it's in the message
-        formatted_message = formatted_message.replace("{reply}", "")
-        
-        # Handle newline placeholders
-        formatted_message = formatted_message.replace("\\n", "\n")
-        formatted_message = formatted_message.replace("{ln}", "\n")
-        formatted_message = formatted_message.replace("{line}", "\n")
-        
-        return formatted_message
+        resolved = {}
+
+        def replace(match: re.Match) -> str:
+            key = match.group(1)
+            if key not in resolved:
+                if key is None or key in ("ln", "line"):
+                    resolved[key] = "\n"
+                elif key == "reply":
+                    # Remove {reply} placeholder, it only decides how the message is sent
+                    resolved[key] = ""
+                else:
+                    # Safely resolve thread placeholders with fallbacks
+                    getter, fallback = _THREAD_PLACEHOLDERS[key]
+                    try:
+                        value = getter(thread)
+                    except (AttributeError, TypeError):
+                        value = fallback
+                    resolved[key] = value if isinstance(value, str) else fallback
+            return resolved[key]
+
+        return _PLACEHOLDER_RE.sub(replace, message)
     
     @app_commands.command(name="set", description="Set an auto-message for new forum posts in a channel")
     @app_commands.describe(
@@ -105,14 +125,15 @@ class AutoMessage(commands.GroupCog, name="automsg"):
     @app_commands.checks.has_permissions(manage_guild=True)
     async def set_forum_message(self, interaction: discord.Interaction, channel: discord.ForumChannel, message: str):
         """Set an auto-message for new forum posts in the specified channel."""
+        await interaction.response.defer(ephemeral=True)
         if not isinstance(channel, discord.ForumChannel):
-            await interaction.response.send_message("Please select a forum channel.", ephemeral=True)
+            await interaction.followup.send("Please select a forum channel.", ephemeral=True)
             return
         
         success = await self._set_forum_auto_message(interaction.guild_id, channel.id, message)
         if success:
-            formatted_message = await self._format_auto_message(message, channel)
-            await interaction.response.send_message(
+            formatted_message = self._format_auto_message(message, channel)
+            await interaction.followup.send(
                 f"✅ Auto-message set for forum channel {channel.mention}. "
                 f"This message will be posted in all new forum posts.\n\n"
                 "> Formatted Preview\n-# Please be aware some formatted text is not shown such as the {reply} placeholder\n"
@@ -120,7 +141,7 @@ class AutoMessage(commands.GroupCog, name="automsg"):
                 ephemeral=True
             )
         else:   
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 "❌ Failed to set auto-message. Please try again later.",
                 ephemeral=True
             )
@@ -132,26 +153,27 @@ class AutoMessage(commands.GroupCog, name="automsg"):
     @app_commands.checks.has_permissions(manage_guild=True)
     async def get_forum_message(self, interaction: discord.Interaction, channel: discord.ForumChannel):
         """View the auto-message configuration for a specific forum channel."""
+        await interaction.response.defer(ephemeral=True)
         if not isinstance(channel, discord.ForumChannel):
-            await interaction.response.send_message("Please select a forum channel.", ephemeral=True)
+            await interaction.followup.send("Please select a forum channel.", ephemeral=True)
             return
             
         config = await self._get_forum_auto_message(interaction.guild_id)
         if config:
             channel_id, message = config
             if channel.id == channel_id:
-                await interaction.response.send_message(
+                await interaction.followup.send(
                     f"📝 **Auto-Message Configuration for {channel.mention}**\n"
                     f"**Message:**\n{message}",
                     ephemeral=True
                 )
             else:
-                await interaction.response.send_message(
+                await interaction.followup.send(
                     f"ℹ️ No auto-message is configured for {channel.mention}.",
                     ephemeral=True
                 )
         else:
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 "ℹ️ No auto-messages have been configured for any channels in this server yet.",
                 ephemeral=True
             )
@@ -163,34 +185,30 @@ class AutoMessage(commands.GroupCog, name="automsg"):
     @app_commands.checks.has_permissions(manage_guild=True)
     async def clear_forum_message(self, interaction: discord.Interaction, channel: discord.ForumChannel):
         """Remove the auto-message configuration for a specific forum channel."""
+        await interaction.response.defer(ephemeral=True)
         if not isinstance(channel, discord.ForumChannel):
-            await interaction.response.send_message("Please select a forum channel.", ephemeral=True)
+            await interaction.followup.send("Please select a forum channel.", ephemeral=True)
             return
             
         try:
             # First check if there's a configuration for this channel
             config = await self._get_forum_auto_message(interaction.guild_id)
             if not config or config[0] != channel.id:
-                await interaction.response.send_message(
+                await interaction.followup.send(
                     f"ℹ️ No auto-message is configured for {channel.mention}.",
                     ephemeral=True
                 )
                 return
                 
-            cursor = self.db.cursor()
-            cursor.execute(
-                'DELETE FROM forum_auto_messages WHERE guild_id = ?',
-                (interaction.guild_id,)
-            )
-            self.db.commit()
-            cursor.close()
-            await interaction.response.send_message(
+            await self.bot.run_db(self._delete_forum_auto_message, interaction.guild_id)
+            self._cfg_cache[interaction.guild_id] = None
+            await interaction.followup.send(
                 f"✅ Auto-message configuration for {channel.mention} has been removed.",
                 ephemeral=True
             )
-        except Exception as e:
-            print(f"Error clearing forum auto-message: {e}")
-            await interaction.response.send_message(
+        except sqlite3.Error:
+            logger.exception(f"Error clearing forum auto-message for guild {interaction.guild_id}")
+            await interaction.followup.send(
                 "❌ Failed to remove auto-message configuration. Please try again later.",
                 ephemeral=True
             )
@@ -198,7 +216,9 @@ class AutoMessage(commands.GroupCog, name="automsg"):
     @commands.Cog.listener()
     async def on_thread_create(self, thread: discord.Thread):
         """Send the auto-message when a new forum post is created."""
-        if not thread.parent or not isinstance(thread.parent, discord.ForumChannel):
+        # thread.parent is a channel lookup on every access, resolve it once
+        parent = thread.parent
+        if not isinstance(parent, discord.ForumChannel):
             return
         
         config = await self._get_forum_auto_message(thread.guild.id)
@@ -206,23 +226,28 @@ class AutoMessage(commands.GroupCog, name="automsg"):
             return
         
         channel_id, message = config
-        if thread.parent.id != channel_id:
+        if parent.id != channel_id:
             return
         
         try:
-            formatted_message = await self._format_auto_message(message, thread)
+            formatted_message = self._format_auto_message(message, thread)
             if "{reply}" in message:
                 await asyncio.sleep(2)
                 try:
                     starter_message = await thread.fetch_message(thread.starter_message.id)
                     await starter_message.reply(formatted_message)
-                except:
+                except (AttributeError, discord.HTTPException):
                     await thread.send(formatted_message)
             else:
                 await thread.send(formatted_message)
                 
-        except Exception as e:
-            print(f"Error sending auto-message to thread {thread.id}: {e}")
+        except discord.HTTPException:
+            logger.exception(f"Error sending auto-message to thread {thread.id}")
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild):
+        """Drop the cached config, the guild's rows are cleaned up by the bot."""
+        self._cfg_cache.pop(guild.id, None)
 
 async def setup(bot):
     await bot.add_cog(AutoMessage(bot))
@@ -2,11 +2,20 @@
 # https://discord.com/oauth2/authorize?client_id=1297132007964540958
 
 import discord
-from discord.ext import commands, tasks
+from discord.ext import commands
 from discord import app_commands
 import asyncio
+import logging
 from typing import Literal, Dict, Any
 
+logger = logging.getLogger(__name__)
+
+# How many posts a mass tagging task edits at once
+MAX_CONCURRENT_EDITS = 5
+# Starting and minimum pause in seconds between a worker's edits
+EDIT_DELAY_START = 0.2
+EDIT_DELAY_MIN = 0.1
+
 # A view for the stop button
 class MassTagView(discord.ui.View):
     def __init__(self):
@@ -19,26 +28,29 @@ class MassTagView(discord.ui.View):
         button.disabled = True
         button.label = "🛑 Stopping..."
         await interaction.response.edit_message(view=self)
-        await interaction.followup.send("🛑 Stop requested. The task will stop after the current post.", ephemeral=True)
+        await interaction.followup.send("🛑 Stop requested. The task will stop once the posts in progress are done.", ephemeral=True)
 
 class MassTagger(commands.GroupCog, name="postman"):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
         self.tag_queue = asyncio.Queue()
         self.active_tasks: Dict[int, Dict[str, Any]] = {}
-        self.queue_processor.start()
+        # forum_id -> {tag name: tag}, dropped whenever the forum's tags change
+        self._tag_index: Dict[int, Dict[str, discord.ForumTag]] = {}
+        self.queue_processor_task = self.bot.loop.create_task(self.queue_processor())
 
     def cog_unload(self):
-        self.queue_processor.cancel()
+        self.queue_processor_task.cancel()
 
-    @tasks.loop(seconds=2)
     async def queue_processor(self):
-        if not self.tag_queue.empty():
+        # Sleeps on the queue until a task is submitted, then runs tasks one at a time
+        while True:
             interaction, forum, tag_to_modify, action, filter_name, filter_tag, filter_no_tags, view, queued_message = await self.tag_queue.get()
             try:
                 await self._process_tagging_task(interaction, forum, tag_to_modify, action, filter_name, filter_tag, filter_no_tags, view, queued_message)
-            except Exception as e:
-                print(f"Error processing tagging task: {e}")
+            except Exception:
+                # Keep the processor alive for the next queued task, whatever went wrong with this one
+                logger.exception(f"Error processing tagging task for forum {forum.id}")
             finally:
                 self.tag_queue.task_done()
 
@@ -51,12 +63,28 @@ class MassTagger(commands.GroupCog, name="postman"):
         if not isinstance(forum_channel, discord.ForumChannel):
             return []
 
+        current_lower = current.lower()
         return [
-            app_commands.Choice(name=tag.name, value=tag.name)
-            for tag in forum_channel.available_tags
-            if current.lower() in tag.name.lower()
+            app_commands.Choice(name=name, value=name)
+            for name in self._get_tag_index(forum_channel)
+            if current_lower in name.lower()
         ][:25]
 
+    def _get_tag_index(self, forum: discord.ForumChannel) -> Dict[str, discord.ForumTag]:
+        index = self._tag_index.get(forum.id)
+        if index is None:
+            index = self._tag_index[forum.id] = {tag.name: tag for tag in forum.available_tags}
+        return index
+
+    @commands.Cog.listener()
+    async def on_guild_channel_update(self, before: discord.abc.GuildChannel, after: discord.abc.GuildChannel):
+        if isinstance(after, discord.ForumChannel):
+            self._tag_index.pop(after.id, None)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel):
+        self._tag_index.pop(channel.id, None)
+
     @app_commands.command(name="modify", description="Mass add|remove the tags on forum posts, includes filters.")
     @app_commands.checks.has_permissions(administrator=True)
     @app_commands.describe(
@@ -75,7 +103,7 @@ class MassTagger(commands.GroupCog, name="postman"):
             await interaction.followup.send("❌ You cannot use `filter_tag` and `filter_no_tags` at the same time.", ephemeral=True)
             return
 
-        target_tag = discord.utils.get(forum.available_tags, name=tag)
+        target_tag = self._get_tag_index(forum).get(tag)
         if not target_tag:
             await interaction.followup.send(f"❌ Tag `{tag}` not found in the forum `{forum.name}`.", ephemeral=True)
             return
@@ -111,7 +139,7 @@ class MassTagger(commands.GroupCog, name="postman"):
 
     async def _process_tagging_task(self, interaction: discord.Interaction, forum: discord.ForumChannel, tag_to_modify: discord.ForumTag, action: str, filter_name: str | None, filter_tag: str | None, filter_no_tags: bool, view: MassTagView, status_msg: discord.WebhookMessage):
 
-        self.active_tasks[interaction.id] = {
+        data = self.active_tasks[interaction.id] = {
             'view': view,
             'status_msg': status_msg,
             'success': 0,
@@ -123,67 +151,106 @@ class MassTagger(commands.GroupCog, name="postman"):
         await status_msg.edit(content="⏳ Starting mass tagging task...", view=view)
 
         try:
-            all_threads = [thread async for thread in forum.archived_threads(limit=None)] + forum.threads
-
-            threads_to_process = []
-            filter_tag_obj = discord.utils.get(forum.available_tags, name=filter_tag) if filter_tag else None
+            filter_name_lower = filter_name.lower() if filter_name else None
+            filter_tag_obj = self._get_tag_index(forum).get(filter_tag) if filter_tag else None
 
-            for thread in all_threads:
+            def _matches(thread: discord.Thread) -> bool:
                 # Name filter
-                if filter_name and filter_name.lower() not in thread.name.lower():
-                    continue
+                if filter_name_lower and filter_name_lower not in thread.name.lower():
+                    return False
                 # Tag filter
                 if filter_tag_obj and filter_tag_obj not in thread.applied_tags:
-                    continue
+                    return False
                 # No-tags filter
                 if filter_no_tags and thread.applied_tags:
-                    continue
-                threads_to_process.append(thread)
-
-            threads = threads_to_process
-            self.active_tasks[interaction.id]['total'] = len(threads)
-
-            for i, thread in enumerate(threads):
+                    return False
+                return True
+
+            # Filter archived posts page by page as they arrive instead of holding every archived post first
+            threads = [thread async for thread in forum.archived_threads(limit=None) if _matches(thread)]
+            threads.extend(thread for thread in forum.threads if _matches(thread))
+            data['total'] = len(threads)
+
+            # A fixed set of workers takes posts from the queue and pauses after each post for a delay they share
+            pending: asyncio.Queue[discord.Thread] = asyncio.Queue()
+            for thread in threads:
+                pending.put_nowait(thread)
+            # The pause after each edit shrinks while edits go through and backs off when Discord returns a 429
+            pacing = {'delay': EDIT_DELAY_START, 'streak': 0}
+
+            async def _send(thread: discord.Thread, **changes):
+                # Waits out a 429 and sends the same request once more, a second failure counts against the post
+                try:
+                    await thread.edit(**changes)
+                except discord.HTTPException as e:
+                    if e.status != 429:
+                        raise
+                    retry_after = e.response.headers.get('Retry-After') if e.response is not None else None
+                    pacing['delay'] = float(retry_after) if retry_after else pacing['delay'] * 2
+                    pacing['streak'] = 0
+                    await asyncio.sleep(pacing['delay'])
+                    await thread.edit(**changes)
+
+            async def _apply(thread: discord.Thread):
                 if view.stop_requested:
-                    break
+                    return
 
                 try:
-                    current_tags = list(thread.applied_tags)
-                    should_update = False
-                    was_archived = thread.archived
-
-                    if action == 'add' and tag_to_modify not in current_tags:
-                        current_tags.append(tag_to_modify)
-                        should_update = True
-                    elif action == 'remove' and tag_to_modify in current_tags:
-                        current_tags.remove(tag_to_modify)
-                        should_update = True
-                    elif action == 'clear' and current_tags:
-                        current_tags = []
-                        should_update = True
-
-                    if should_update:
-                        if was_archived:
-                            await thread.edit(archived=False)
-                        
-                        await thread.edit(applied_tags=current_tags)
-
-                        if was_archived:
-                            await thread.edit(archived=True)
-                            
-                        self.active_tasks[interaction.id]['success'] += 1
+                    current_tags = thread.applied_tags
+                    if action == 'add':
+                        new_tags = current_tags if tag_to_modify in current_tags else current_tags + [tag_to_modify]
+                    elif action == 'remove':
+                        new_tags = [t for t in current_tags if t != tag_to_modify]
+                    else:
+                        new_tags = []
+
+                    if set(new_tags) == set(current_tags):
+                        data['skipped'] += 1
+                        return
+
+                    # Discord rejects edits to archived threads, so the tags go out with the unarchive
+                    # and only archived threads need a second request to close them again.
+                    # Each request is retried on its own, so a 429 on the close never resends the tags
+                    if thread.archived:
+                        await _send(thread, archived=False, applied_tags=new_tags)
+                        await _send(thread, archived=True)
                     else:
-                        self.active_tasks[interaction.id]['skipped'] += 1
+                        await _send(thread, applied_tags=new_tags)
 
-                except discord.Forbidden:
-                    self.active_tasks[interaction.id]['failed'] += 1
+                    data['success'] += 1
+                    pacing['streak'] += 1
+                    if pacing['streak'] % 5 == 0:
+                        pacing['delay'] = max(EDIT_DELAY_MIN, pacing['delay'] * 0.8)
+
+                except discord.HTTPException:
+                    data['failed'] += 1
                 except Exception:
-                    self.active_tasks[interaction.id]['failed'] += 1
-                
-                if (i + 1) % 5 == 0:
-                    await self._update_progress(interaction.id, i + 1)
-                
-                await asyncio.sleep(1.5) # Rate limit
+                    logger.exception(f"Unexpected error tagging thread {thread.id}")
+                    data['failed'] += 1
+
+                await asyncio.sleep(pacing['delay'])
+
+            processed = 0
+
+            async def _worker():
+                nonlocal processed
+                while not view.stop_requested:
+                    try:
+                        thread = pending.get_nowait()
+                    except asyncio.QueueEmpty:
+                        return
+                    await _apply(thread)
+                    processed += 1
+                    if processed % 5 == 0 and not view.stop_requested:
+                        await self._update_progress(interaction.id, processed)
+
+            workers = [asyncio.create_task(_worker()) for _ in range(min(MAX_CONCURRENT_EDITS, len(threads)))]
+            try:
+                await asyncio.gather(*workers)
+            finally:
+                # Nothing outlives the task if it is cancelled or a worker fails
+                for worker in workers:
+                    worker.cancel()
 
         finally:
             await self._finalize_task(interaction.id, view.stop_requested)
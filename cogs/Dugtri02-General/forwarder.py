@@ -7,7 +7,9 @@ class Envelope(commands.GroupCog, name="forwarder"):
     def __init__(self, bot):
         self.bot = bot
         self.db = bot.db
-        self._create_table()
+    
+    async def cog_load(self):
+        await self.bot.run_db(self._create_table)
     
     def _create_table(self):
         """Create the message_forwards table if it doesn't exist"""
@@ -26,6 +28,114 @@ class Envelope(commands.GroupCog, name="forwarder"):
         ''')
         self.db.commit()
     
+    def _add_forward(self, guild_id: int, from_id: int, to_id: int, keyword: str, detect_type: str) -> Optional[int]:
+        """Insert a forwarding rule, returns the source's rule count or None if the rule already exists"""
+        with self.db:
+            cursor = self.db.cursor()
+            # Check if this exact rule already exists
+            cursor.execute('''
+                SELECT id FROM message_forwards 
+                WHERE guild_id = ? AND from_channel_id = ? AND to_channel_id = ? 
+                AND keyword = ? AND detect_type = ?
+            ''', (guild_id, from_id, to_id, keyword, detect_type))
+            
+            if cursor.fetchone() is not None:
+                return None
+            
+            # Insert the new forwarding rule
+            cursor.execute('''
+                INSERT INTO message_forwards 
+                (guild_id, from_channel_id, to_channel_id, keyword, detect_type)
+                VALUES (?, ?, ?, ?, ?)
+            ''', (guild_id, from_id, to_id, keyword, detect_type))
+        
+            # Get the count of rules for this from_channel
+            cursor.execute('''
+                SELECT COUNT(*) FROM message_forwards 
+                WHERE guild_id = ? AND from_channel_id = ?
+            ''', (guild_id, from_id))
+            return cursor.fetchone()[0]
+    
+    def _fetch_from_channels(self, guild_id: int) -> list:
+        cursor = self.db.cursor()
+        cursor.execute('''
+            SELECT DISTINCT from_channel_id 
+            FROM message_forwards 
+            WHERE guild_id = ?
+            ORDER BY from_channel_id
+        ''', (guild_id,))
+        return cursor.fetchall()
+    
+    def _fetch_keywords(self, guild_id: int, from_channel_id: int) -> list:
+        cursor = self.db.cursor()
+        cursor.execute('''
+            SELECT DISTINCT keyword 
+            FROM message_forwards 
+            WHERE guild_id = ? AND from_channel_id = ?
+            ORDER BY keyword
+        ''', (guild_id, from_channel_id))
+        return cursor.fetchall()
+    
+    def _remove_forwards(self, guild_id: int, channel_id: int, keyword: str) -> list:
+        """Delete the matching rules, returning them for the confirmation"""
+        with self.db:
+            cursor = self.db.cursor()
+            
+            # First, get all matching rules to show in the confirmation
+            cursor.execute('''
+                SELECT id, to_channel_id, detect_type 
+                FROM message_forwards 
+                WHERE guild_id = ? AND from_channel_id = ? AND keyword = ?
+            ''', (guild_id, channel_id, keyword))
+            
+            rules = cursor.fetchall()
+            
+            if rules:
+                # Delete all matching rules
+                cursor.execute('''
+                    DELETE FROM message_forwards 
+                    WHERE guild_id = ? AND from_channel_id = ? AND keyword = ?
+                ''', (guild_id, channel_id, keyword))
+            return rules
+    
+    def _fetch_forwards_page(self, guild_id: int, limit: int, offset: int):
+        """Get the guild's rule count and one page of its rules"""
+        cursor = self.db.cursor()
+        
+        # Get total count for pagination
+        cursor.execute('''
+            SELECT COUNT(*) FROM message_forwards 
+            WHERE guild_id = ?
+        ''', (guild_id,))
+        total_rules = cursor.fetchone()[0]
+        
+        if total_rules == 0:
+            return 0, []
+        
+        # Get paginated results with channel names for grouping
+        cursor.execute('''
+            SELECT 
+                from_channel_id, 
+                to_channel_id, 
+                keyword, 
+                detect_type,
+                (SELECT name FROM sqlite_master WHERE type='table' AND name='message_forwards' AND sql LIKE '%id INTEGER PRIMARY KEY%') as has_id_column
+            FROM message_forwards 
+            WHERE guild_id = ?
+            ORDER BY from_channel_id, keyword, to_channel_id
+            LIMIT ? OFFSET ?
+        ''', (guild_id, limit, offset))
+        return total_rules, cursor.fetchall()
+    
+    def _fetch_rules(self, guild_id: int, from_channel_id: int) -> list:
+        cursor = self.db.cursor()
+        cursor.execute('''
+            SELECT to_channel_id, keyword, detect_type 
+            FROM message_forwards 
+            WHERE guild_id = ? AND from_channel_id = ?
+        ''', (guild_id, from_channel_id))
+        return cursor.fetchall()
+    
     @app_commands.command(name="set", description="Set up message forwarding from one channel to another based on a keyword")
     @app_commands.checks.has_permissions(administrator=True)
     @app_commands.describe(
@@ -83,36 +193,14 @@ class Envelope(commands.GroupCog, name="forwarder"):
             return
             
         try:
-            with self.db:
-                cursor = self.db.cursor()
-                # Check if this exact rule already exists
-                cursor.execute('''
-                    SELECT id FROM message_forwards 
-                    WHERE guild_id = ? AND from_channel_id = ? AND to_channel_id = ? 
-                    AND keyword = ? AND detect_type = ?
-                ''', (interaction.guild_id, from_id, to_id, keyword, detect_type))
-                
-                if cursor.fetchone() is not None:
-                    await interaction.response.send_message(
-                        f"ℹ️ A forwarding rule already exists from {from_channel.mention} to {to_channel.mention} "
-                        f"for keyword: `{keyword}` with detect_type: `{detect_type}`",
-                        ephemeral=True
-                    )
-                    return
-                
-                # Insert the new forwarding rule
-                cursor.execute('''
-                    INSERT INTO message_forwards 
-                    (guild_id, from_channel_id, to_channel_id, keyword, detect_type)
-                    VALUES (?, ?, ?, ?, ?)
-                ''', (interaction.guild_id, from_id, to_id, keyword, detect_type))
-            
-                # Get the count of rules for this from_channel
-                cursor.execute('''
-                    SELECT COUNT(*) FROM message_forwards 
-                    WHERE guild_id = ? AND from_channel_id = ?
-                ''', (interaction.guild_id, from_id))
-                rule_count = cursor.fetchone()[0]
+            rule_count = await self.bot.run_db(self._add_forward, interaction.guild_id, from_id, to_id, keyword, detect_type)
+            if rule_count is None:
+                await interaction.response.send_message(
+                    f"ℹ️ A forwarding rule already exists from {from_channel.mention} to {to_channel.mention} "
+                    f"for keyword: `{keyword}` with detect_type: `{detect_type}`",
+                    ephemeral=True
+                )
+                return
             
             await interaction.response.send_message(
                 f"✅ Set up forwarding from {from_channel.mention} to {to_channel.mention} "
@@ -131,16 +219,8 @@ class Envelope(commands.GroupCog, name="forwarder"):
     async def from_channel_autocomplete(self, interaction: discord.Interaction, current: str) -> List[app_commands.Choice[str]]:
         """Autocomplete for source channels that have forwarding rules"""
         
-        cursor = self.db.cursor()
-        cursor.execute('''
-            SELECT DISTINCT from_channel_id 
-            FROM message_forwards 
-            WHERE guild_id = ?
-            ORDER BY from_channel_id
-        ''', (interaction.guild.id,))
-        
         channels = []
-        for row in cursor.fetchall():
+        for row in await self.bot.run_db(self._fetch_from_channels, interaction.guild.id):
             channel_id = row[0]
             channel = interaction.guild.get_channel_or_thread(channel_id)
             if channel:
@@ -176,15 +256,7 @@ class Envelope(commands.GroupCog, name="forwarder"):
             return []
             
         try:
-            cursor = self.db.cursor()
-            cursor.execute('''
-                SELECT DISTINCT keyword 
-                FROM message_forwards 
-                WHERE guild_id = ? AND from_channel_id = ?
-                ORDER BY keyword
-            ''', (interaction.guild.id, from_channel_id))
-            
-            keywords = cursor.fetchall()
+            keywords = await self.bot.run_db(self._fetch_keywords, interaction.guild.id, from_channel_id)
             
             return [
                 app_commands.Choice(name=row[0], value=row[0])
@@ -221,43 +293,27 @@ class Envelope(commands.GroupCog, name="forwarder"):
         from_channel = interaction.guild.get_channel_or_thread(channel_id)
         channel_mention = f"<#{channel_id}>" if from_channel else f"channel/thread {channel_id}"
         
-        with self.db:
-            cursor = self.db.cursor()
-            
-            # First, get all matching rules to show in the confirmation
-            cursor.execute('''
-                SELECT id, to_channel_id, detect_type 
-                FROM message_forwards 
-                WHERE guild_id = ? AND from_channel_id = ? AND keyword = ?
-            ''', (interaction.guild.id, channel_id, keyword))
-            
-            rules = cursor.fetchall()
-            
-            if not rules:
-                await interaction.response.send_message(
-                    f"❌ No forwarding rules found from {channel_mention} with keyword: `{keyword}`",
-                    ephemeral=True
-                )
-                return
-                
-            # Delete all matching rules
-            cursor.execute('''
-                DELETE FROM message_forwards 
-                WHERE guild_id = ? AND from_channel_id = ? AND keyword = ?
-            ''', (interaction.guild.id, channel_id, keyword))
-            
-            # Format the rule details for the response
-            rule_details = []
-            for rule_id, to_channel_id, detect_type in rules:
-                to_channel = interaction.guild.get_channel_or_thread(to_channel_id)
-                to_mention = f"<#{to_channel_id}>" if to_channel else f"channel/thread {to_channel_id}"
-                rule_details.append(f"- To: {to_mention} (detect_type: `{detect_type}`)")
-            
+        rules = await self.bot.run_db(self._remove_forwards, interaction.guild.id, channel_id, keyword)
+        
+        if not rules:
             await interaction.response.send_message(
-                f"✅ Removed {len(rules)} forwarding rule(s) from {channel_mention} for keyword: `{keyword}`\n"
-                "\n".join(rule_details),
+                f"❌ No forwarding rules found from {channel_mention} with keyword: `{keyword}`",
                 ephemeral=True
             )
+            return
+        
+        # Format the rule details for the response
+        rule_details = []
+        for rule_id, to_channel_id, detect_type in rules:
+            to_channel = interaction.guild.get_channel_or_thread(to_channel_id)
+            to_mention = f"<#{to_channel_id}>" if to_channel else f"channel/thread {to_channel_id}"
+            rule_details.append(f"- To: {to_mention} (detect_type: `{detect_type}`)")
+        
+        await interaction.response.send_message(
+            f"✅ Removed {len(rules)} forwarding rule(s) from {channel_mention} for keyword: `{keyword}`\n"
+            "\n".join(rule_details),
+            ephemeral=True
+        )
     
     @app_commands.command(name="list", description="List all message forwarding rules")
     @app_commands.checks.has_permissions(administrator=True)
@@ -272,14 +328,7 @@ class Envelope(commands.GroupCog, name="forwarder"):
         items_per_page = 5
         offset = (page - 1) * items_per_page
         
-        cursor = self.db.cursor()
-        
-        # Get total count for pagination
-        cursor.execute('''
-            SELECT COUNT(*) FROM message_forwards 
-            WHERE guild_id = ?
-        ''', (interaction.guild.id,))
-        total_rules = cursor.fetchone()[0]
+        total_rules, rules = await self.bot.run_db(self._fetch_forwards_page, interaction.guild.id, items_per_page, offset)
         
         if total_rules == 0:
             await interaction.response.send_message(
@@ -288,22 +337,6 @@ class Envelope(commands.GroupCog, name="forwarder"):
             )
             return
         
-        # Get paginated results with channel names for grouping
-        cursor.execute('''
-            SELECT 
-                from_channel_id, 
-                to_channel_id, 
-                keyword, 
-                detect_type,
-                (SELECT name FROM sqlite_master WHERE type='table' AND name='message_forwards' AND sql LIKE '%id INTEGER PRIMARY KEY%') as has_id_column
-            FROM message_forwards 
-            WHERE guild_id = ?
-            ORDER BY from_channel_id, keyword, to_channel_id
-            LIMIT ? OFFSET ?
-        ''', (interaction.guild.id, items_per_page, offset))
-        
-        rules = cursor.fetchall()
-        
         if not rules and page > 1:
             await interaction.response.send_message(
                 f"No rules found on page {page}. Try a lower page number.",
@@ -404,14 +437,7 @@ class Envelope(commands.GroupCog, name="forwarder"):
         if message.is_system():
             return
             
-        cursor = self.db.cursor()
-        cursor.execute('''
-            SELECT to_channel_id, keyword, detect_type 
-            FROM message_forwards 
-            WHERE guild_id = ? AND from_channel_id = ?
-        ''', (message.guild.id, message.channel.id))
-        
-        rules = cursor.fetchall()
+        rules = await self.bot.run_db(self._fetch_rules, message.guild.id, message.channel.id)
         
         for to_channel_id, keyword, detect_type in rules:
             # Skip if message doesn't match detect_type
@@ -2,22 +2,189 @@
 
 import discord; from discord import app_commands, File; from discord.ext import commands
 from typing import Dict, List, Optional, Union, Any, Tuple
-import time, json, io; from datetime import datetime, timedelta
+import time, json, io, asyncio, tempfile; from datetime import datetime, timedelta
+from collections import OrderedDict; from itertools import chain, islice
+
+# Every permission name, in discord.py's order
+_ALL_PERM_NAMES = tuple(name for name, _ in discord.Permissions())
+# Permission name -> position, reports list permissions in this order
+_PERM_ORDER = {name: index for index, name in enumerate(_ALL_PERM_NAMES)}
+# Permission name -> title-cased label, in the alphabetical order view_permissions lists them
+_PERM_DISPLAY = {name: name.replace('_', ' ').title() for name in sorted(_ALL_PERM_NAMES)}
+
+# Permission change reports bigger than this many bytes are written to disk while they're built
+REPORT_SPOOL_SIZE = 64 * 1024
+
+# Seconds a member's channel permissions are reused across autocomplete keystrokes, and how many members are kept
+MEMBER_PERMS_TTL = 3
+MEMBER_PERMS_MAX_ENTRIES = 4096
+
+# How many view reports are built in worker threads at once
+MAX_CONCURRENT_REPORTS = 4
+# View reports up to this many bytes are shown in the embed instead of attached (embed descriptions cap at 4096 characters)
+INLINE_REPORT_SIZE = 3800
+
+# Static decorations for the permission changes file, built once
+_RULE = b"=" * 80 + b"\n"
+_ENTITY_END = b"\n" + b"-" * 50 + b"\n\n"
+_DASHES = "-" * 256  # Sliced to underline entity names
+
+# Permission state -> bucket index (allowed, denied, neutral)
+_BUCKET = {True: 0, False: 1, None: 2}
+
+# Channel class -> (cache bucket, source type, autocomplete prefix)
+_CHANNEL_TYPES = {
+    discord.TextChannel: ("text_channels", "text", "#"),
+    discord.VoiceChannel: ("voice_channels", "voice", "🔊"),
+    discord.CategoryChannel: ("categories", "category", "📁"),
+    discord.StageChannel: ("stages", "stages", "🎤"),
+    discord.ForumChannel: ("forums", "forums", "📝"),
+}
+
+# Both bits autocomplete needs to list a channel, checked with one mask instead of two attribute reads
+_VIEW_MANAGE = discord.Permissions(view_channel=True, manage_channels=True).value
+_MANAGE_CHANNELS = discord.Permissions(manage_channels=True).value
+
+def _channel_type(channel) -> Optional[Tuple[str, str, str]]:
+    # Exact classes hit on the first lookup, subclasses fall back to their bases
+    for cls in type(channel).__mro__:
+        info = _CHANNEL_TYPES.get(cls)
+        if info is not None:
+            return info
+    return None
+
+def _perm_lines(perms) -> List[str]:
+    """Bullet lines for the given permission names, in _PERM_DISPLAY's order."""
+    # Walking the fixed display order with set lookups replaces a sort per block
+    perms = set(perms)
+    return [f"• {label}" for name, label in _PERM_DISPLAY.items() if name in perms]
+
+def _split_perms(permissions) -> Tuple[List[str], List[str], List[str]]:
+    """Split (name, value) pairs into allowed, denied and neutral names in one pass."""
+    buckets = ([], [], [])
+    for perm, value in permissions:
+        buckets[_BUCKET[value]].append(perm)
+    return buckets
+
+
+def _channel_report_lines(channel_name: str, type_name: str, channel_id: int, default_perms, overwrites) -> List[str]:
+    """Body of a channel's view report, from (name, value) pairs so it doesn't touch discord objects."""
+    lines = [
+        f"Channel: #{channel_name}",
+        f"Type: {type_name}",
+        f"ID: {channel_id}",
+        "",
+        # Add channel-wide permissions
+        "CHANNEL PERMISSIONS",
+        "=" * 40
+    ]
+    append = lines.append
+    extend = lines.extend
+
+    allowed, denied, _ = _split_perms(default_perms)
+
+    if allowed:
+        append("✅ ALLOWED")
+        extend(_perm_lines(allowed))
+
+    if denied:
+        append("\n❌ DENIED")
+        extend(_perm_lines(denied))
+
+    # Add permission overwrites
+    if overwrites:
+        append("\nPERMISSION OVERRIDES")
+        append("=" * 40)
+
+        for name, overwrite in overwrites:
+            append(f"\n{name}")
+
+            # Format allowed, denied, and neutral permissions
+            allowed, denied, neutral = _split_perms(overwrite)
+
+            if allowed:
+                append("✅ ALLOWED")
+                extend(_perm_lines(allowed))
+
+            if denied:
+                append("\n❌ DENIED")
+                extend(_perm_lines(denied))
+
+            if neutral:
+                append("\n➖ NEUTRAL")
+                extend(_perm_lines(neutral))
+
+    return lines
+
+def _role_report_lines(role_name: str, color: str, position: int, role_id: int, permissions) -> List[str]:
+    """Body of a role's view report, from (name, value) pairs so it doesn't touch discord objects."""
+    allowed_perms, denied_perms, _ = _split_perms(permissions)
+    lines = [
+        f"Role: @{role_name}",
+        f"Color: {color}",
+        f"Position: {position}",
+        f"ID: {role_id}",
+        ""
+    ]
+
+    if allowed_perms:
+        lines.append("✅ ALLOWED PERMISSIONS")
+        lines.append("=" * 40)
+        lines.extend(_perm_lines(allowed_perms))
+
+    if denied_perms:
+        lines.append("\n❌ DENIED PERMISSIONS")
+        lines.append("=" * 40)
+        lines.extend(_perm_lines(denied_perms))
+
+    return lines
+
+def _build_view_report(title: str, guild_name: str, build_lines, *args) -> bytes:
+    """Header plus the body from build_lines(*args), joined once and encoded for the report file."""
+    header = [
+        "=" * 80,
+        title.upper(),
+        f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        f"Server: {guild_name}",
+        "=" * 80,
+        ""
+    ]
+    return "\n".join(chain(header, build_lines(*args))).encode('utf-8')
 
 class PermissionCache:
     def __init__(self):
-        self.cache: Dict[int, Dict[str, Any]] = {}
-        self.cache_time: Dict[int, float] = {}
-        self.CACHE_DURATION = 60  # 1 minute in seconds
+        # guild_id -> (cached at, data), least recently used first
+        self.cache: OrderedDict[int, Tuple[float, Dict[str, Any]]] = OrderedDict()
+        # Channel and role events invalidate entries, the expiry is only a fallback
+        self.CACHE_DURATION = 3600  # 1 hour in seconds
+        self.MAX_ENTRIES = 512
 
     def get_cache(self, guild_id: int) -> Optional[Dict[str, Any]]:
-        if guild_id in self.cache and time.time() - self.cache_time.get(guild_id, 0) < self.CACHE_DURATION:
-            return self.cache[guild_id]
-        return None
+        entry = self.cache.get(guild_id)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] >= self.CACHE_DURATION:
+            # Expired entries are dropped when they are next looked up
+            del self.cache[guild_id]
+            return None
+        self.cache.move_to_end(guild_id)
+        return entry[1]
 
     def update_cache(self, guild_id: int, data: Dict[str, Any]):
-        self.cache[guild_id] = data
-        self.cache_time[guild_id] = time.time()
+        self.cache[guild_id] = (time.monotonic(), data)
+        self.cache.move_to_end(guild_id)
+        while len(self.cache) > self.MAX_ENTRIES:
+            self.cache.popitem(last=False)
+
+    def invalidate(self, guild_id: int):
+        self.cache.pop(guild_id, None)
+
+def is_guild_owner():
+    """Check if the user is the server owner"""
+    def predicate(interaction: discord.Interaction) -> bool:
+        # owner_id is on the guild itself, no member lookup needed
+        return interaction.user.id == interaction.guild.owner_id
+    return app_commands.check(predicate)
 
 class Pencil(commands.GroupCog, name="perm_editor"):
     def __init__(self, bot: commands.Bot):
@@ -25,6 +192,10 @@ class Pencil(commands.GroupCog, name="perm_editor"):
         self.db = bot.db
         self.cache = PermissionCache()
         self.source_type: Dict[int, str] = {}
+        # (guild_id, member_id) -> (computed at, guild data it was computed for, permission group -> value),
+        # least recently used first
+        self._perms_cache: OrderedDict[Tuple[int, int], Tuple[float, Dict[str, Any], Dict[Tuple[int, str], int]]] = OrderedDict()
+        self._report_semaphore = asyncio.Semaphore(MAX_CONCURRENT_REPORTS)
 
     async def _format_permission_changes(
         self,
@@ -32,150 +203,207 @@ class Pencil(commands.GroupCog, name="perm_editor"):
         description: str,
         changes: List[Tuple[str, List[Tuple[str, bool]]]],
         color: discord.Color = discord.Color.green()
-    ) -> Tuple[discord.Embed, File]:
-        """Format permission changes into a text file with all changes."""
-        # Count total changes for summary
-        total_allowed = 0
-        total_denied = 0
-        total_neutral = 0
-        
-        # First pass to count all permission states
-        for _, perm_changes in changes:
+    ) -> Tuple[discord.Embed, Optional[File]]:
+        """Format permission changes into a text file with all changes, the file is None when nothing changed."""
+        if not changes:
+            embed = discord.Embed(
+                title=title,
+                description=f"{description}\n\nNo permission changes were needed (permissions were already set as requested)",
+                color=color
+            )
+            return embed, None
+
+        # Group each entity's permissions by state (allowed/denied/neutral) and count them in the same pass
+        totals = [0, 0, 0]
+        grouped = []
+        for entity_name, perm_changes in changes:
+            buckets = ([], [], [])
             for perm, value in perm_changes:
-                if value is True:
-                    total_allowed += 1
-                elif value is False:
-                    total_denied += 1
-                else:  # None/Neutral
-                    total_neutral += 1
-        
-        # Create header for the text file
-        header = [
-            "=" * 80,
-            f"PERMISSION CHANGES - {title.upper()}",
-            f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-            "=" * 80,
-            "",
-            description,
-            "",
-            f"Total Items Modified: {len(changes)}\n"
-            f"Total Permissions Allowed: {total_allowed}\n"
-            f"Total Permissions Denied: {total_denied}\n"
-            f"Total Permissions Set to Neutral: {total_neutral}",
-            "=" * 80,
-            ""
-        ]
+                index = _BUCKET[value]
+                buckets[index].append(perm)
+                totals[index] += 1
+            grouped.append((entity_name, buckets))
+        total_allowed, total_denied, total_neutral = totals
+
+        # One timestamp for the file header, the filename and the embed
+        now = datetime.now()
+
+        # Write the text file straight into the buffer instead of joining a list of lines,
+        # large reports spill over to a temporary file instead of staying in memory
+        buffer = tempfile.SpooledTemporaryFile(max_size=REPORT_SPOOL_SIZE)
+        try:
+            w = buffer.write
+
+            # Header for the text file
+            w(_RULE)
+            w(f"PERMISSION CHANGES - {title.upper()}\n".encode('utf-8'))
+            w(f"Generated: {now.strftime('%Y-%m-%d %H:%M:%S')}\n".encode('utf-8'))
+            w(_RULE)
+            w(b"\n")
+            w(f"{description}\n\n".encode('utf-8'))
+            w(
+                f"Total Items Modified: {len(changes)}\n"
+                f"Total Permissions Allowed: {total_allowed}\n"
+                f"Total Permissions Denied: {total_denied}\n"
+                f"Total Permissions Set to Neutral: {total_neutral}\n".encode('utf-8')
+            )
+            w(_RULE)
+            w(b"\n")
         
-        # Process all changes
-        text_lines = []
-        for entity_name, perm_changes in changes:
-            # Group permissions by their state (allowed/denied/neutral)
-            allowed = [perm for perm, value in perm_changes if value is True]
-            denied = [perm for perm, value in perm_changes if value is False]
-            neutral = [perm for perm, value in perm_changes if value is None]
+            # Process all changes
+            for entity_name, (allowed, denied, neutral) in grouped:
+                # Format for text file
+                w(f"[ {entity_name} ]\n{_DASHES[:len(entity_name) + 4]}\n".encode('utf-8'))
             
-            # Format for text file
-            text_lines.extend([
-                f"[ {entity_name} ]",
-                "-" * (len(entity_name) + 4)
-            ])
-            
-            if allowed:
-                text_lines.append("✅ Allowed Permissions:")
-                for perm in sorted(allowed):
-                    text_lines.append(f"  • {perm}")
-            
-            if denied:
                 if allowed:
-                    text_lines.append("")  # Add a blank line between sections
-                text_lines.append("❌ Denied Permissions:")
-                for perm in sorted(denied):
-                    text_lines.append(f"  • {perm}")
-                
-            if neutral:
-                if allowed or denied:
-                    text_lines.append("")  # Add a blank line between sections
-                text_lines.append("➖ Neutral/Default Permissions:")
-                for perm in sorted(neutral):
-                    text_lines.append(f"  • {perm}")
+                    w("✅ Allowed Permissions:\n".encode('utf-8'))
+                    allowed.sort(key=_PERM_ORDER.__getitem__)
+                    for perm in allowed:
+                        w(f"  • {perm}\n".encode('utf-8'))
             
-            text_lines.append("\n" + ("-" * 50) + "\n")
-        
-        # Create the file
-        full_text = "\n".join(header + text_lines)
-        buffer = io.BytesIO(full_text.encode('utf-8'))
-        file = File(buffer, filename=f"permission_changes_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt")
-        
-        # Create a simple embed for the file
-        file_embed = discord.Embed(
-            title=f"{title} - Permission Changes",
-            description=(
-                f"{description}\n\n"
-                f"**Total Changes:** {len(changes)}\n"
-                f"**✅ Allowed:** {total_allowed}\n"
-                f"**❌ Denied:** {total_denied}\n"
-                f"**➖ Neutral:** {total_neutral}\n\n"
-                "All changes have been saved to the attached file."
-            ),
-            color=color,
-            timestamp=datetime.now()
-        )
-        
+                if denied:
+                    if allowed:
+                        w(b"\n")  # Add a blank line between sections
+                    w("❌ Denied Permissions:\n".encode('utf-8'))
+                    denied.sort(key=_PERM_ORDER.__getitem__)
+                    for perm in denied:
+                        w(f"  • {perm}\n".encode('utf-8'))
+                
+                if neutral:
+                    if allowed or denied:
+                        w(b"\n")  # Add a blank line between sections
+                    w("➖ Neutral/Default Permissions:\n".encode('utf-8'))
+                    neutral.sort(key=_PERM_ORDER.__getitem__)
+                    for perm in neutral:
+                        w(f"  • {perm}\n".encode('utf-8'))
+            
+                w(_ENTITY_END)
+
+            # Create the file, _send_report closes the buffer once it is sent
+            buffer.seek(0)
+            file = File(buffer, filename=f"permission_changes_{now.strftime('%Y%m%d_%H%M%S')}.txt")
+
+            # Create a simple embed for the file
+            file_embed = discord.Embed(
+                title=f"{title} - Permission Changes",
+                description=(
+                    f"{description}\n\n"
+                    f"**Total Changes:** {len(changes)}\n"
+                    f"**✅ Allowed:** {total_allowed}\n"
+                    f"**❌ Denied:** {total_denied}\n"
+                    f"**➖ Neutral:** {total_neutral}\n\n"
+                    "All changes have been saved to the attached file."
+                ),
+                color=color,
+                timestamp=now
+            )
+        except BaseException:
+            # Nothing will send the report, so nothing else would close its buffer
+            buffer.close()
+            raise
+
         return file_embed, file
 
+    async def _send_report(self, interaction: discord.Interaction, embed: discord.Embed, file: Optional[File]):
+        """Send a formatted report, attaching its file when there is one."""
+        # followup.send treats file=None as a file, so only pass it when there is one
+        if file is None:
+            await interaction.followup.send(embed=embed, ephemeral=True)
+            return
+        try:
+            await interaction.followup.send(embed=embed, file=file, ephemeral=True)
+        finally:
+            # File stubs out fp.close until its own close() runs, only then does closing the buffer take effect
+            file.close()
+            file.fp.close()
+
     async def cache_guild_data(self, guild: discord.Guild) -> Dict[str, Any]:
         """Cache guild channels and roles for autocomplete."""
         cached = self.cache.get_cache(guild.id)
         if cached is not None:
             return cached
 
-        data = {
-            'text_channels': [],
-            'voice_channels': [],
-            'categories': [],
-            'stages': [],
-            'forums': [],
-            'roles': []
-        }
-
-        # Cache channels
+        # Bucket channels by type (text, voice, categories, stages, forums) with the type info
+        # resolved once per channel, the buckets set the order autocomplete lists them in
+        buckets = {bucket: [] for bucket, _, _ in _CHANNEL_TYPES.values()}
         for channel in guild.channels:
-            if isinstance(channel, discord.TextChannel):
-                data['text_channels'].append(channel)
-            elif isinstance(channel, discord.VoiceChannel):
-                data['voice_channels'].append(channel)
-            elif isinstance(channel, discord.CategoryChannel):
-                data['categories'].append(channel)
-            elif isinstance(channel, discord.StageChannel):
-                data['stages'].append(channel)
-            elif isinstance(channel, discord.ForumChannel):
-                data['forums'].append(channel)
-
+            info = _channel_type(channel)
+            if info is not None:
+                buckets[info[0]].append((channel, info))
+
+        data = {}
+        # id -> (entity, type, display name, lowercased display name, id string)
+        # so lookups and autocomplete don't rescan every list or rebuild strings per keystroke
+        by_id = data['by_id'] = {}
+        for channel, (_, source_type, prefix) in chain.from_iterable(buckets.values()):
+            display_name = f"{prefix} {channel.name}"
+            by_id[channel.id] = (channel, source_type, display_name, display_name.lower(), str(channel.id))
         # Cache roles (excluding @everyone)
-        data['roles'] = [role for role in guild.roles if not role.is_default()]
+        for role in guild.roles:
+            if role.is_default():
+                continue
+            display_name = f"👔 {role.name}"
+            by_id[role.id] = (role, 'role', display_name, display_name.lower(), str(role.id))
+
+        # Channels of one type synced to their category share its overwrites, so they share a permission group
+        # (the type is part of the key because voice channels drop manage_channels without connect)
+        data['perm_groups'] = {
+            channel.id: (channel.category_id if getattr(channel, 'permissions_synced', False) else channel.id, entity_type)
+            for channel, entity_type, *_ in by_id.values()
+            if entity_type != 'role'
+        }
 
         self.cache.update_cache(guild.id, data)
         return data
 
+    def _channel_perms(self, data: Dict[str, Any], member: discord.Member):
+        """Return a lookup of the member's permission value per channel, computed once per permission group."""
+        perm_groups = data['perm_groups']
+
+        # Consecutive keystrokes share the values, until they expire, the guild's cached data is rebuilt
+        # or on_member_update sees the member's roles change
+        key = (member.guild.id, member.id)
+        now = time.monotonic()
+        entry = self._perms_cache.get(key)
+        if entry is not None and entry[1] is data and now - entry[0] < MEMBER_PERMS_TTL:
+            computed = entry[2]
+            self._perms_cache.move_to_end(key)
+        else:
+            computed = {}
+            self._perms_cache[key] = (now, data, computed)
+            self._perms_cache.move_to_end(key)
+            while len(self._perms_cache) > MEMBER_PERMS_MAX_ENTRIES:
+                self._perms_cache.popitem(last=False)
+
+        def lookup(channel) -> int:
+            group = perm_groups[channel.id]
+            value = computed.get(group)
+            if value is None:
+                value = computed[group] = channel.permissions_for(member).value
+            return value
+
+        return lookup
+
+    def _autocomplete_choices(self, data: Dict[str, Any], current: str, permitted) -> List[app_commands.Choice[str]]:
+        """Return up to 25 cached entries matching the input that pass permitted, stopping at the 25th.
+
+        An empty input matches everything, so the first 25 permitted entries are listed when the field is focused.
+        """
+        # Names were lowercased when cached and the cheap name check runs before the permission check
+        needle = current.lower()
+        matches = (
+            app_commands.Choice(name=display_name, value=id_str)
+            for entity, entity_type, display_name, name_lower, id_str in data['by_id'].values()
+            if needle in name_lower and permitted(entity, entity_type, id_str)
+        )
+        return list(islice(matches, 25))  # Limit to 25 choices
+
     async def get_source_type(self, guild: discord.Guild, source_id: int) -> Optional[str]:
         """Get the type of the source (text, voice, category, stage, forum, role)."""
         data = await self.cache_guild_data(guild)
-        
-        for channel_type in ['text_channels', 'voice_channels', 'categories', 'stages', 'forums']:
-            if any(channel.id == source_id for channel in data[channel_type]):
-                return channel_type.replace('_channels', '').replace('categories', 'category')
-                
-        if any(role.id == source_id for role in data['roles']):
-            return 'role'
-            
-        return None
+        entry = data['by_id'].get(source_id)
+        return entry[1] if entry else None
 
-    def is_guild_owner():
-        """Check if the user is the server owner"""
-        def predicate(interaction: discord.Interaction) -> bool:
-            return interaction.user == interaction.guild.owner
-        return app_commands.check(predicate)
-    
 
     @app_commands.command(name="copy", description="Copy permissions from one channel|role to another (text|voice|category|stage|forum)")
     @is_guild_owner()
@@ -292,57 +520,56 @@ class Pencil(commands.GroupCog, name="perm_editor"):
 
                 # Get the permission differences
                 old_overwrites = target_channel.overwrites
-                await target_channel.edit(overwrites=source_channel.overwrites)
-                new_overwrites = target_channel.overwrites
-                
-                # Find changed permissions
+                source_overwrites = source_channel.overwrites
                 changed_perms = []
-                all_entities = set(old_overwrites.keys()) | set(new_overwrites.keys())
                 
-                for entity in all_entities:
-                    old_perm = old_overwrites.get(entity, discord.PermissionOverwrite())
-                    new_perm = new_overwrites.get(entity, discord.PermissionOverwrite())
+                # Identical overwrites need neither the request nor the diff
+                if source_overwrites != old_overwrites:
+                    await target_channel.edit(overwrites=source_overwrites)
+                    new_overwrites = target_channel.overwrites
                     
-                    # Get permission changes
-                    perm_changes = []
-                    for perm, value in new_perm:
-                        old_value = getattr(old_perm, perm, None)
-                        if old_value != value:  # Changed to include None values
-                            perm_changes.append((perm, value))  # Now includes None/neutral values
+                    # Find changed permissions
+                    all_entities = old_overwrites.keys() | new_overwrites.keys()
                     
-                    if perm_changes:
-                        if isinstance(entity, discord.Role):
-                            name = f"@{entity.name}"
+                    for entity in all_entities:
+                        old_perm = old_overwrites.get(entity, discord.PermissionOverwrite())
+                        new_perm = new_overwrites.get(entity, discord.PermissionOverwrite())
+                        
+                        # Get permission changes
+                        if hasattr(old_perm, '_values') and hasattr(new_perm, '_values'):
+                            # Overwrites only store their explicitly set permissions, so only those can differ
+                            old_values = old_perm._values
+                            new_values = new_perm._values
+                            perm_changes = [
+                                (perm, new_values.get(perm))  # Includes None/neutral values
+                                for perm in old_values.keys() | new_values.keys()
+                                if old_values.get(perm) != new_values.get(perm)
+                            ]
                         else:
-                            name = f"{entity.name} ({entity.id})"
-                        changed_perms.append((name, perm_changes))
+                            perm_changes = []
+                            for perm, value in new_perm:
+                                old_value = getattr(old_perm, perm, None)
+                                if old_value != value:  # Changed to include None values
+                                    perm_changes.append((perm, value))  # Now includes None/neutral values
+                        
+                        if perm_changes:
+                            if isinstance(entity, discord.Role):
+                                name = f"@{entity.name}"
+                            else:
+                                name = f"{entity.name} ({entity.id})"
+                            changed_perms.append((name, perm_changes))
                 
                 # Format the message
                 title = f"✅ Copied Permissions"
                 description = f"From: {source_channel.mention}\nTo: {target_channel.mention}"
                 
-                if changed_perms:
-                    result = await self._format_permission_changes(
-                        title=title,
-                        description=description,
-                        changes=changed_perms,
-                        color=discord.Color.green()
-                    )
-                else:
-                    embed = discord.Embed(
-                        title=title,
-                        description=f"{description}\n\nNo permission changes were needed (permissions were already set as requested)",
-                        color=discord.Color.green()
-                    )
-                    result = embed
-                
-                if isinstance(result, tuple):
-                    await interaction.followup.send(embed=result[0], file=result[1], ephemeral=True)
-                elif isinstance(result, list):
-                    for embed in result:
-                        await interaction.followup.send(embed=embed, ephemeral=True)
-                else:
-                    await interaction.followup.send(embed=result, ephemeral=True)
+                embed, file = await self._format_permission_changes(
+                    title=title,
+                    description=description,
+                    changes=changed_perms,
+                    color=discord.Color.green()
+                )
+                await self._send_report(interaction, embed, file)
 
             else:  # role-to-role copying
                 source_role = interaction.guild.get_role(source_id)
@@ -359,15 +586,16 @@ class Pencil(commands.GroupCog, name="perm_editor"):
                 old_permissions = target_role.permissions
                 new_permissions = source_role.permissions
                 
-                # Find changed permissions
+                # Find changed permissions, identical permissions need neither the diff nor the request
                 perm_changes = []
-                for perm, value in new_permissions:
-                    old_value = getattr(old_permissions, perm, None)
-                    if old_value != value:  # This will now include None/neutral values
-                        perm_changes.append((perm, value))  # Includes None/neutral values
-                
-                # Apply new permissions
-                await target_role.edit(permissions=new_permissions)
+                if new_permissions.value != old_permissions.value:
+                    for perm, value in new_permissions:
+                        old_value = getattr(old_permissions, perm, None)
+                        if old_value != value:  # This will now include None/neutral values
+                            perm_changes.append((perm, value))  # Includes None/neutral values
+                    
+                    # Apply new permissions
+                    await target_role.edit(permissions=new_permissions)
                 
                 # Copy role position if possible
                 position_changed = False
@@ -386,28 +614,13 @@ class Pencil(commands.GroupCog, name="perm_editor"):
                 if position_changed:
                     description += f"\n📌 Updated role position to {source_role.position}"
                 
-                if perm_changes:
-                    result = await self._format_permission_changes(
-                        title=title,
-                        description=description,
-                        changes=[("Permission Changes", perm_changes)],
-                        color=discord.Color.green()
-                    )
-                else:
-                    embed = discord.Embed(
-                        title=title,
-                        description=f"{description}\n\nNo permission changes were needed (permissions were already set as requested)",
-                        color=discord.Color.green()
-                    )
-                    result = embed
-                
-                if isinstance(result, tuple):
-                    await interaction.followup.send(embed=result[0], file=result[1], ephemeral=True)
-                elif isinstance(result, list):
-                    for embed in result:
-                        await interaction.followup.send(embed=embed, ephemeral=True)
-                else:
-                    await interaction.followup.send(embed=result, ephemeral=True)
+                embed, file = await self._format_permission_changes(
+                    title=title,
+                    description=description,
+                    changes=[("Permission Changes", perm_changes)] if perm_changes else [],
+                    color=discord.Color.green()
+                )
+                await self._send_report(interaction, embed, file)
 
         except Exception as e:
             await interaction.followup.send(f"❌ An error occurred: {str(e)}", ephemeral=True)
@@ -427,42 +640,24 @@ class Pencil(commands.GroupCog, name="perm_editor"):
             source_type = getattr(interaction.namespace, 'source_type', None)
             data = await self.cache_guild_data(interaction.guild)
             
-            all_items = []
             member = interaction.user
+            channel_perms = self._channel_perms(data, member)
             
             # If source_type is not set or is 'channel', include channels
-            if source_type != 'role':
-                for channel in data['text_channels'] + data['voice_channels'] + data['categories'] + data['stages'] + data['forums']:
-                    # Check if user can view and manage the channel
-                    if channel.permissions_for(member).view_channel and channel.permissions_for(member).manage_channels:
-                        if isinstance(channel, discord.TextChannel):
-                            prefix = "#"
-                        elif isinstance(channel, discord.VoiceChannel):
-                            prefix = "🔊"
-                        elif isinstance(channel, discord.CategoryChannel):
-                            prefix = "📁"
-                        elif isinstance(channel, discord.StageChannel):
-                            prefix = "🎤"
-                        else:  # ForumChannel
-                            prefix = "📝"
-                        all_items.append((f"{prefix} {channel.name}", str(channel.id)))
-            
+            include_channels = source_type != 'role'
             # If source_type is 'role' or not set, and user has manage_roles permission, include roles
-            if source_type != 'channel' and member.guild_permissions.manage_roles:
-                # Only show roles lower than the user's highest role
-                highest_role = member.top_role
-                for role in data['roles']:
-                    if role < highest_role or member.guild_permissions.administrator:
-                        all_items.append((f"👔 {role.name}", str(role.id)))
-            
-            # Filter based on current input
-            filtered = [
-                app_commands.Choice(name=name, value=item_id)
-                for name, item_id in all_items
-                if current.lower() in name.lower()
-            ][:25]  # Limit to 25 choices
+            include_roles = source_type != 'channel' and member.guild_permissions.manage_roles
+            highest_role = member.top_role
+            is_admin = member.guild_permissions.administrator
+
+            def permitted(entity, entity_type: str, id_str: str) -> bool:
+                if entity_type == 'role':
+                    # Only show roles lower than the user's highest role
+                    return include_roles and (is_admin or entity < highest_role)
+                # Check if user can view and manage the channel
+                return include_channels and (channel_perms(entity) & _VIEW_MANAGE) == _VIEW_MANAGE
             
-            return filtered
+            return self._autocomplete_choices(data, current, permitted)
             
         except Exception as e:
             print(f"Error in source_id_autocomplete: {e}")
@@ -484,42 +679,26 @@ class Pencil(commands.GroupCog, name="perm_editor"):
             source_id = getattr(interaction.namespace, 'source_id', None)
             data = await self.cache_guild_data(interaction.guild)
             member = interaction.user
-            
-            all_items = []
+            channel_perms = self._channel_perms(data, member)
             
             # If source is a role, show only roles as potential targets
             if source_type == 'role' and source_id:
-                if member.guild_permissions.manage_roles:
-                    # Only show roles lower than the user's highest role
-                    highest_role = member.top_role
-                    for role in data['roles']:
-                        if (str(role.id) != str(source_id) and 
-                            (role < highest_role or member.guild_permissions.administrator)):
-                            all_items.append((f"👔 {role.name}", str(role.id)))
+                if not member.guild_permissions.manage_roles:
+                    return []
+                # Only show roles lower than the user's highest role
+                highest_role = member.top_role
+                is_admin = member.guild_permissions.administrator
+                source_id = str(source_id)
+
+                def permitted(entity, entity_type: str, id_str: str) -> bool:
+                    return (entity_type == 'role' and id_str != source_id and 
+                            (is_admin or entity < highest_role))
             else:
                 # For channels, check view and manage permissions
-                for channel in data['text_channels'] + data['voice_channels'] + data['categories'] + data['stages'] + data['forums']:
-                    if channel.permissions_for(member).view_channel and channel.permissions_for(member).manage_channels:
-                        if isinstance(channel, discord.TextChannel):
-                            prefix = "#"
-                        elif isinstance(channel, discord.VoiceChannel):
-                            prefix = "🔊"
-                        elif isinstance(channel, discord.CategoryChannel):
-                            prefix = "📁"
-                        elif isinstance(channel, discord.StageChannel):
-                            prefix = "🎤"
-                        else:  # ForumChannel
-                            prefix = "📝"
-                        all_items.append((f"{prefix} {channel.name}", str(channel.id)))
+                def permitted(entity, entity_type: str, id_str: str) -> bool:
+                    return entity_type != 'role' and (channel_perms(entity) & _VIEW_MANAGE) == _VIEW_MANAGE
             
-            # Filter based on current input
-            filtered = [
-                app_commands.Choice(name=name, value=item_id)
-                for name, item_id in all_items
-                if current.lower() in name.lower()
-            ][:25]  # Limit to 25 choices
-            
-            return filtered
+            return self._autocomplete_choices(data, current, permitted)
             
         except Exception as e:
             print(f"Error in target_id_autocomplete: {e}")
@@ -585,44 +764,19 @@ class Pencil(commands.GroupCog, name="perm_editor"):
                 if not channel.permissions_for(member).manage_channels:
                     return await interaction.followup.send("❌ You don't have permission to manage this channel.", ephemeral=True)
 
-                # Get all permissions
-                perms = channel.overwrites
-                changes = []
-                
                 # Get all permission targets (including @everyone)
-                targets = list(perms.items())
+                targets = list(channel.overwrites)
                 # Add @everyone if not already in the list
-                if interaction.guild.default_role not in [t[0] for t in targets]:
-                    targets.append((interaction.guild.default_role, None))
+                if interaction.guild.default_role not in targets:
+                    targets.append(interaction.guild.default_role)
                 
-                for target, overwrite in targets:
-                    # Create new permission overwrite
-                    new_perms = discord.PermissionOverwrite()
-                    
-                    # If there are existing permissions, use them as a base
-                    existing_perms = {}
-                    if overwrite is not None:
-                        existing_perms = {perm: value for perm, value in overwrite}
-                    
-                    # Get all possible permissions for the target
-                    all_perms = list(discord.Permissions())
-                    
-                    # Set all permissions based on state
-                    for perm, _ in all_perms:
-                        if state == 'on':
-                            setattr(new_perms, perm, True)
-                        elif state == 'off':
-                            setattr(new_perms, perm, False)
-                        # For neutral, we'll delete the overwrite
-                    
-                    changes.append((target, new_perms))
+                # Every target gets the same overwrite, so build it once (for neutral, we'll delete the overwrites)
+                new_perms = discord.PermissionOverwrite(**dict.fromkeys(_ALL_PERM_NAMES, state == 'on'))
+                changes = [(target, new_perms) for target in targets]
                 
-                # Apply changes
-                for target, new_perms in changes:
-                    if state == 'neutral':
-                        await channel.set_permissions(target, overwrite=None)
-                    else:
-                        await channel.set_permissions(target, overwrite=new_perms)
+                # Apply all changes in one request, an empty mapping clears every overwrite for neutral
+                new_overwrites = {} if state == 'neutral' else dict(changes)
+                await channel.edit(overwrites=new_overwrites)
                 
                 await interaction.followup.send(f"✅ Updated all permissions for {channel.mention} to '{state}'", ephemeral=True)
                 
@@ -639,12 +793,8 @@ class Pencil(commands.GroupCog, name="perm_editor"):
                 if role >= member.top_role and not member.guild_permissions.administrator:
                     return await interaction.followup.send("❌ You can only edit roles below your highest role.", ephemeral=True)
                 
-                # Create new permissions
-                new_perms = discord.Permissions()
-                
-                # Set all permissions based on state
-                for perm, _ in role.permissions:
-                    setattr(new_perms, perm, state == 'on')
+                # Create new permissions with every permission set based on state
+                new_perms = discord.Permissions(**dict.fromkeys(_ALL_PERM_NAMES, state == 'on'))
                 
                 # Update role permissions
                 await role.edit(permissions=new_perms)
@@ -672,42 +822,24 @@ class Pencil(commands.GroupCog, name="perm_editor"):
             item_type = getattr(interaction.namespace, 'item_type', None)
             data = await self.cache_guild_data(interaction.guild)
             
-            all_items = []
             member = interaction.user
+            channel_perms = self._channel_perms(data, member)
             
             # If item_type is channel or not set, include channels
-            if item_type != 'role':
-                for channel in data['text_channels'] + data['voice_channels'] + data['categories'] + data['stages'] + data['forums']:
-                    # Check if user can manage the channel
-                    if channel.permissions_for(member).manage_channels:
-                        if isinstance(channel, discord.TextChannel):
-                            prefix = "#"
-                        elif isinstance(channel, discord.VoiceChannel):
-                            prefix = "🔊"
-                        elif isinstance(channel, discord.CategoryChannel):
-                            prefix = "📁"
-                        elif isinstance(channel, discord.StageChannel):
-                            prefix = "🎤"
-                        else:  # ForumChannel
-                            prefix = "📝"
-                        all_items.append((f"{prefix} {channel.name}", str(channel.id)))
-            
+            include_channels = item_type != 'role'
             # If item_type is role or not set, and user has manage_roles permission, include roles
-            if item_type != 'channel' and member.guild_permissions.manage_roles:
-                # Only show roles lower than the user's highest role
-                highest_role = member.top_role
-                for role in data['roles']:
-                    if role < highest_role or member.guild_permissions.administrator:
-                        all_items.append((f"👔 {role.name}", str(role.id)))
-            
-            # Filter based on current input
-            filtered = [
-                app_commands.Choice(name=name, value=item_id)
-                for name, item_id in all_items
-                if current.lower() in name.lower()
-            ][:25]  # Limit to 25 choices
+            include_roles = item_type != 'channel' and member.guild_permissions.manage_roles
+            highest_role = member.top_role
+            is_admin = member.guild_permissions.administrator
+
+            def permitted(entity, entity_type: str, id_str: str) -> bool:
+                if entity_type == 'role':
+                    # Only show roles lower than the user's highest role
+                    return include_roles and (is_admin or entity < highest_role)
+                # Check if user can manage the channel
+                return include_channels and bool(channel_perms(entity) & _MANAGE_CHANNELS)
             
-            return filtered
+            return self._autocomplete_choices(data, current, permitted)
             
         except Exception as e:
             print(f"Error in edit_item_id_autocomplete: {e}")
@@ -752,68 +884,14 @@ class Pencil(commands.GroupCog, name="perm_editor"):
                 if not channel.permissions_for(interaction.user).view_channel:
                     return await interaction.followup.send("❌ You don't have permission to view this channel.", ephemeral=True)
 
-                # Get all permission overwrites
-                overwrites = []
-                for target, overwrite in channel.overwrites.items():
-                    if isinstance(target, discord.Role):
-                        name = f"@{target.name}"
-                    else:
-                        name = f"{target.name} ({target.id})"
-                    
-                    # Format allowed, denied, and neutral permissions
-                    allowed = [perm for perm, value in overwrite if value is True]
-                    denied = [perm for perm, value in overwrite if value is False]
-                    neutral = [perm for perm, value in overwrite if value is None]
-                    
-                    if allowed or denied or neutral:
-                        overwrites.append((name, allowed, denied, neutral))
-
-                # Create a formatted message
+                # Snapshot the permissions as plain pairs, the report itself is built off the event loop
                 title = f"🔍 Channel Permissions: #{channel.name}"
-                description = [
-                    f"Channel: #{channel.name}",
-                    f"Type: {channel.type.name}",
-                    f"ID: {channel.id}",
-                    ""
+                default_perms = list(channel.permissions_for(interaction.guild.default_role))
+                overwrites = [
+                    (f"@{target.name}" if isinstance(target, discord.Role) else f"{target.name} ({target.id})", list(overwrite))
+                    for target, overwrite in channel.overwrites.items()
                 ]
-                
-                # Add channel-wide permissions
-                description.append("CHANNEL PERMISSIONS")
-                description.append("=" * 40)
-                
-                default_perms = channel.permissions_for(interaction.guild.default_role)
-                allowed = [p.replace('_', ' ').title() for p, v in default_perms if v]
-                denied = [p.replace('_', ' ').title() for p, v in default_perms if not v]
-                
-                if allowed:
-                    description.append("✅ ALLOWED")
-                    description.extend(f"• {p}" for p in sorted(allowed))
-                
-                if denied:
-                    description.append("\n❌ DENIED")
-                    description.extend(f"• {p}" for p in sorted(denied))
-                
-                # Add permission overwrites
-                if overwrites:
-                    description.append("\nPERMISSION OVERRIDES")
-                    description.append("=" * 40)
-                    
-                    for name, allowed, denied, neutral in overwrites:
-                        description.append(f"\n{name}")
-                        
-                        if allowed:
-                            description.append("✅ ALLOWED")
-                            description.extend(f"• {p.replace('_', ' ').title()}" for p in sorted(allowed))
-                        
-                        if denied:
-                            description.append("\n❌ DENIED")
-                            description.extend(f"• {p.replace('_', ' ').title()}" for p in sorted(denied))
-                            
-                        if neutral:
-                            description.append("\n➖ NEUTRAL")
-                            description.extend(f"• {p.replace('_', ' ').title()}" for p in sorted(neutral))
-                
-                description = "\n".join(description)
+                report_args = (_channel_report_lines, channel.name, channel.type.name, channel.id, default_perms, overwrites)
 
             else:  # role
                 # Handle role permissions
@@ -825,49 +903,30 @@ class Pencil(commands.GroupCog, name="perm_editor"):
                 if not interaction.user.guild_permissions.manage_roles:
                     return await interaction.followup.send("❌ You need 'Manage Roles' permission to view role permissions.", ephemeral=True)
 
-                # Get role permissions
-                permissions = role.permissions
-                allowed_perms = [p.replace('_', ' ').title() for p, v in permissions if v]
-                denied_perms = [p.replace('_', ' ').title() for p, v in permissions if not v]
-
-                # Create a formatted message
                 title = f"👔 Role Permissions: {role.name}"
-                description = [
-                    f"Role: @{role.name}",
-                    f"Color: {str(role.color)}",
-                    f"Position: {role.position}",
-                    f"ID: {role.id}",
-                    ""
-                ]
-                
-                if allowed_perms:
-                    description.append("✅ ALLOWED PERMISSIONS")
-                    description.append("=" * 40)
-                    description.extend(f"• {p}" for p in sorted(allowed_perms))
-                
-                if denied_perms:
-                    description.append("\n❌ DENIED PERMISSIONS")
-                    description.append("=" * 40)
-                    description.extend(f"• {p}" for p in sorted(denied_perms))
-                
-                description = "\n".join(description)
+                report_args = (_role_report_lines, role.name, str(role.color), role.position, role.id, list(role.permissions))
+
+            # Formatting a busy channel's overwrites runs in a worker thread so other interactions aren't held up,
+            # a burst of reports queues here instead of taking every thread in the default executor
+            async with self._report_semaphore:
+                content = await asyncio.get_running_loop().run_in_executor(
+                    None, _build_view_report, title, interaction.guild.name, *report_args
+                )
+
+            # Small reports go in a code block in the embed, skipping the attachment upload
+            # (a stray ``` from a channel or role name would end the block early, so those are attached)
+            if len(content) <= INLINE_REPORT_SIZE and b"```" not in content:
+                embed = discord.Embed(
+                    title=title,
+                    description=f"```\n{content.decode('utf-8')}\n```",
+                    color=discord.Color.blue()
+                )
+                return await interaction.followup.send(embed=embed, ephemeral=True)
 
             # Create a text file with the permissions
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"{'channel' if item_type == 'channel' else 'role'}_permissions_{timestamp}.txt"
-            
-            # Create file content with a header
-            header = [
-                "=" * 80,
-                title.upper(),
-                f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-                f"Server: {interaction.guild.name}",
-                "=" * 80,
-                ""
-            ]
-            
-            full_content = "\n".join(header) + "\n" + description
-            buffer = io.BytesIO(full_content.encode('utf-8'))
+            buffer = io.BytesIO(content)
             file = File(buffer, filename=filename)
             
             # Create an embed for the response
@@ -899,47 +958,64 @@ class Pencil(commands.GroupCog, name="perm_editor"):
             item_type = getattr(interaction.namespace, 'item_type', None)
             data = await self.cache_guild_data(interaction.guild)
             
-            all_items = []
             member = interaction.user
+            channel_perms = self._channel_perms(data, member)
             
             if item_type == 'role':
                 # For roles, check if user has manage_roles permission
-                if member.guild_permissions.manage_roles:
-                    # Only show roles lower than the user's highest role
-                    highest_role = member.top_role
-                    for role in data['roles']:
-                        if role < highest_role or member.guild_permissions.administrator:
-                            all_items.append((f"👔 {role.name}", str(role.id)))
+                if not member.guild_permissions.manage_roles:
+                    return []
+                # Only show roles lower than the user's highest role
+                highest_role = member.top_role
+                is_admin = member.guild_permissions.administrator
+
+                def permitted(entity, entity_type: str, id_str: str) -> bool:
+                    return entity_type == 'role' and (is_admin or entity < highest_role)
             else:  # Default to showing channels if no type or type is channel
                 # For channels, check view and manage permissions
-                for channel in data['text_channels'] + data['voice_channels'] + data['categories'] + data['stages'] + data['forums']:
-                    if isinstance(channel, discord.TextChannel):
-                        prefix = "#"
-                    elif isinstance(channel, discord.VoiceChannel):
-                        prefix = "🔊"
-                    elif isinstance(channel, discord.CategoryChannel):
-                        prefix = "📁"
-                    elif isinstance(channel, discord.StageChannel):
-                        prefix = "🎤"
-                    else:  # ForumChannel
-                        prefix = "📝"
-                    
-                    # Check if user can view and manage the channel
-                    if channel.permissions_for(member).view_channel and channel.permissions_for(member).manage_channels:
-                        all_items.append((f"{prefix} {channel.name}", str(channel.id)))
-            
-            # Filter based on current input
-            filtered = [
-                app_commands.Choice(name=name, value=item_id)
-                for name, item_id in all_items
-                if current.lower() in name.lower()
-            ][:25]  # Limit to 25 choices
+                def permitted(entity, entity_type: str, id_str: str) -> bool:
+                    return entity_type != 'role' and (channel_perms(entity) & _VIEW_MANAGE) == _VIEW_MANAGE
             
-            return filtered
+            return self._autocomplete_choices(data, current, permitted)
             
         except Exception as e:
             print(f"Error in view_item_id_autocomplete: {e}")
             return []
 
+    # Channel and role changes drop the guild's cached data so autocomplete never lists stale entries
+    @commands.Cog.listener()
+    async def on_guild_channel_create(self, channel: discord.abc.GuildChannel):
+        self.cache.invalidate(channel.guild.id)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_update(self, before: discord.abc.GuildChannel, after: discord.abc.GuildChannel):
+        self.cache.invalidate(after.guild.id)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel):
+        self.cache.invalidate(channel.guild.id)
+
+    @commands.Cog.listener()
+    async def on_guild_role_create(self, role: discord.Role):
+        self.cache.invalidate(role.guild.id)
+
+    @commands.Cog.listener()
+    async def on_guild_role_update(self, before: discord.Role, after: discord.Role):
+        self.cache.invalidate(after.guild.id)
+
+    @commands.Cog.listener()
+    async def on_guild_role_delete(self, role: discord.Role):
+        self.cache.invalidate(role.guild.id)
+
+    # A member's own role or timeout change alters their channel permissions without touching the guild's data
+    @commands.Cog.listener()
+    async def on_member_update(self, before: discord.Member, after: discord.Member):
+        if before.roles != after.roles or before.timed_out_until != after.timed_out_until:
+            self._perms_cache.pop((after.guild.id, after.id), None)
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild):
+        self.cache.invalidate(guild.id)
+
 async def setup(bot: commands.Bot) -> None:
     await bot.add_cog(Pencil(bot))
\ No newline at end of file
@@ -1,10 +1,138 @@
 import discord
+import re
+import time
+from dataclasses import dataclass
 from discord import app_commands
 from discord.ext import commands
 
+# Seconds a guild's member and channel counts are reused before they're counted again
+COUNTS_TTL = 60
+
+# Every placeholder listed by /format, replaced in a single pass over the message
+_PLACEHOLDER_RE = re.compile(
+    r"\{(ln|server|servers|members|bots|users|channels|voice|categories|stage|rules|afk|system"
+    r"|forums|roles|emojis|boosts|boosters|owner|@owner)\}"
+)
+
+# A bare message ID, or the ID at the end of a message link
+_MSG_REF_RE = re.compile(r"(?:^|/)(\d{15,21})$")
+
+@dataclass
+class AggregateCounts:
+    bots: int
+    boosters: int
+    channels: int
+    voice: int
+    categories: int
+    stage: int
+    forums: int
+
+# Placeholder -> getter(cog, guild, value), value resolves another placeholder so {users} can reuse {bots}
+_PLACEHOLDERS = {
+    'ln': lambda cog, guild, value: '\n',
+    'server': lambda cog, guild, value: guild.name,
+    'servers': lambda cog, guild, value: len(cog.bot.guilds),
+    'members': lambda cog, guild, value: guild.member_count,
+    'bots': lambda cog, guild, value: cog._get_counts(guild).bots,
+    'users': lambda cog, guild, value: guild.member_count - value('bots'),
+    'channels': lambda cog, guild, value: cog._get_counts(guild).channels,
+    'voice': lambda cog, guild, value: cog._get_counts(guild).voice,
+    'categories': lambda cog, guild, value: cog._get_counts(guild).categories,
+    'stage': lambda cog, guild, value: cog._get_counts(guild).stage,
+    'rules': lambda cog, guild, value: guild.rules_channel.mention if guild.rules_channel else 'rules',
+    'afk': lambda cog, guild, value: guild.afk_channel.mention if guild.afk_channel else 'afk',
+    'system': lambda cog, guild, value: guild.system_channel.mention if guild.system_channel else 'system',
+    'forums': lambda cog, guild, value: cog._get_counts(guild).forums,
+    'roles': lambda cog, guild, value: len(guild.roles),
+    'emojis': lambda cog, guild, value: len(guild.emojis),
+    'boosts': lambda cog, guild, value: guild.premium_subscription_count,
+    'boosters': lambda cog, guild, value: cog._get_counts(guild).boosters,
+    'owner': lambda cog, guild, value: guild.owner,
+    # owner_id mentions the owner even when they aren't in the member cache
+    '@owner': lambda cog, guild, value: f'<@{guild.owner_id}>',
+}
+
 class Speaker(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
+        # guild_id -> (monotonic time counted, counts), dropped by the member and channel listeners below
+        self._agg_cache: dict[int, tuple[float, AggregateCounts]] = {}
+
+    def _get_counts(self, guild: discord.Guild) -> AggregateCounts:
+        """Get the guild's member and channel counts, recounting once they're older than COUNTS_TTL"""
+        now = time.monotonic()
+        cached = self._agg_cache.get(guild.id)
+        if cached and now - cached[0] < COUNTS_TTL:
+            return cached[1]
+
+        # One pass over the members counts bots and boosters together
+        bots = boosters = 0
+        for member in guild.members:
+            bots += member.bot
+            boosters += member.premium_since is not None
+
+        counts = AggregateCounts(
+            bots=bots,
+            boosters=boosters,
+            channels=len(guild.text_channels),
+            voice=len(guild.voice_channels),
+            categories=len(guild.categories),
+            stage=len(guild.stage_channels),
+            forums=len(guild.forums),
+        )
+        self._agg_cache[guild.id] = (now, counts)
+        return counts
+
+    def format_message(self, interaction: discord.Interaction, message: str) -> str:
+        """Replace the formatting placeholders in a message"""
+        if '{' not in message:
+            return message
+
+        guild = interaction.guild
+        resolved = {}
+
+        def value(key: str):
+            # Each placeholder is computed at most once, and only if the message uses it
+            if key not in resolved:
+                resolved[key] = _PLACEHOLDERS[key](self, guild, value)
+            return resolved[key]
+
+        return _PLACEHOLDER_RE.sub(lambda match: str(value(match.group(1))), message)
+
+    def _forget_counts(self, guild: discord.Guild):
+        self._agg_cache.pop(guild.id, None)
+
+    @commands.Cog.listener()
+    async def on_member_join(self, member: discord.Member):
+        self._forget_counts(member.guild)
+
+    @commands.Cog.listener()
+    async def on_member_remove(self, member: discord.Member):
+        self._forget_counts(member.guild)
+
+    @commands.Cog.listener()
+    async def on_member_update(self, before: discord.Member, after: discord.Member):
+        # Only a boost starting or ending changes the counts
+        if before.premium_since != after.premium_since:
+            self._forget_counts(after.guild)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_create(self, channel: discord.abc.GuildChannel):
+        self._forget_counts(channel.guild)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_update(self, before: discord.abc.GuildChannel, after: discord.abc.GuildChannel):
+        # Renames and permission edits don't change the counts, only a change of channel type does
+        if type(before) is not type(after):
+            self._forget_counts(after.guild)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel):
+        self._forget_counts(channel.guild)
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild):
+        self._forget_counts(guild)
 
     # Slash command checks
     def slash_is_owner():
@@ -48,36 +176,8 @@ class Speaker(commands.Cog):
             if not target_channel:
                 return
 
-            # Convert {ln} to newlines in the message
-            formatted_message = message.replace('{ln}', '\n')
-            formatted_message = formatted_message.replace('{server}', f'{interaction.guild.name}')
-            formatted_message = formatted_message.replace('{servers}', f'{len(self.bot.guilds)}')
-            formatted_message = formatted_message.replace('{members}', f'{interaction.guild.member_count}')
-            formatted_message = formatted_message.replace('{bots}', f'{len([m for m in interaction.guild.members if m.bot])}')
-            formatted_message = formatted_message.replace('{users}', f'{interaction.guild.member_count - len([m for m in interaction.guild.members if m.bot])}')
-            formatted_message = formatted_message.replace('{channels}', f'{len(interaction.guild.text_channels)}')
-            formatted_message = formatted_message.replace('{voice}', f'{len(interaction.guild.voice_channels)}')
-            formatted_message = formatted_message.replace('{categories}', f'{len(interaction.guild.categories)}')
-            formatted_message = formatted_message.replace('{stage}', f'{len(interaction.guild.stage_channels)}')
-            if interaction.guild.rules_channel:
-                formatted_message = formatted_message.replace('{rules}', f'{interaction.guild.rules_channel.mention}')
-            else:
-                formatted_message = formatted_message.replace('{rules}', 'rules')
-            if interaction.guild.afk_channel:
-                formatted_message = formatted_message.replace('{afk}', f'{interaction.guild.afk_channel.mention}')
-            else:
-                formatted_message = formatted_message.replace('{afk}', 'afk')
-            if interaction.guild.system_channel:
-                formatted_message = formatted_message.replace('{system}', f'{interaction.guild.system_channel.mention}')
-            else:
-                formatted_message = formatted_message.replace('{system}', 'system')
-            formatted_message = formatted_message.replace('{forums}', f'{len(interaction.guild.forums)}')
-            formatted_message = formatted_message.replace('{roles}', f'{len(interaction.guild.roles)}')
-            formatted_message = formatted_message.replace('{emojis}', f'{len(interaction.guild.emojis)}')
-            formatted_message = formatted_message.replace('{boosts}', f'{interaction.guild.premium_subscription_count}')
-            formatted_message = formatted_message.replace('{boosters}', f'{len([m for m in interaction.guild.members if m.premium_since])}')
-            formatted_message = formatted_message.replace('{owner}', f'{interaction.guild.owner}')
-            formatted_message = formatted_message.replace('{@owner}', f'{interaction.guild.owner.mention}')
+            # Replace the formatting placeholders
+            formatted_message = self.format_message(interaction, message)
 
             # Prepare the send kwargs
             send_kwargs = {}
@@ -140,36 +240,7 @@ class Speaker(commands.Cog):
                 return
             
             # Get the message content and apply replacements
-            formatted_message = new_content
-            formatted_message = formatted_message.replace('{ln}', '\n')
-            formatted_message = formatted_message.replace('{server}', f'{interaction.guild.name}')
-            formatted_message = formatted_message.replace('{servers}', f'{len(self.bot.guilds)}')
-            formatted_message = formatted_message.replace('{members}', f'{interaction.guild.member_count}')
-            formatted_message = formatted_message.replace('{bots}', f'{len([m for m in interaction.guild.members if m.bot])}')
-            formatted_message = formatted_message.replace('{users}', f'{interaction.guild.member_count - len([m for m in interaction.guild.members if m.bot])}')
-            formatted_message = formatted_message.replace('{channels}', f'{len(interaction.guild.text_channels)}')
-            formatted_message = formatted_message.replace('{voice}', f'{len(interaction.guild.voice_channels)}')
-            formatted_message = formatted_message.replace('{categories}', f'{len(interaction.guild.categories)}')
-            formatted_message = formatted_message.replace('{stage}', f'{len(interaction.guild.stage_channels)}')
-            if interaction.guild.rules_channel:
-                formatted_message = formatted_message.replace('{rules}', f'{interaction.guild.rules_channel.mention}')
-            else:
-                formatted_message = formatted_message.replace('{rules}', 'rules')
-            if interaction.guild.afk_channel:
-                formatted_message = formatted_message.replace('{afk}', f'{interaction.guild.afk_channel.mention}')
-            else:
-                formatted_message = formatted_message.replace('{afk}', 'afk')
-            if interaction.guild.system_channel:
-                formatted_message = formatted_message.replace('{system}', f'{interaction.guild.system_channel.mention}')
-            else:
-                formatted_message = formatted_message.replace('{system}', 'system')
-            formatted_message = formatted_message.replace('{forums}', f'{len(interaction.guild.forums)}')
-            formatted_message = formatted_message.replace('{roles}', f'{len(interaction.guild.roles)}')
-            formatted_message = formatted_message.replace('{emojis}', f'{len(interaction.guild.emojis)}')
-            formatted_message = formatted_message.replace('{boosts}', f'{interaction.guild.premium_subscription_count}')
-            formatted_message = formatted_message.replace('{boosters}', f'{len([m for m in interaction.guild.members if m.premium_since])}')
-            formatted_message = formatted_message.replace('{owner}', f'{interaction.guild.owner}')
-            formatted_message = formatted_message.replace('{@owner}', f'{interaction.guild.owner.mention}')
+            formatted_message = self.format_message(interaction, new_content)
                 
             await message.edit(content=formatted_message)
             await interaction.followup.send(
@@ -261,15 +332,15 @@ async def extract_message_id(interaction: discord.Interaction, message_ref: str)
     """Helper function to extract a message from a reference (ID or URL)"""
     try:
         # Try to extract message ID from URL
-        if '/' in message_ref:
-            message_id = int(message_ref.split('/')[-1])
-        else:
-            message_id = int(message_ref)
+        match = _MSG_REF_RE.search(message_ref.strip())
+        if not match:
+            raise ValueError(message_ref)
+        message_id = int(match.group(1))
             
         # Try to get the message
         message = await interaction.channel.fetch_message(message_id)
         return message
-    except (ValueError, IndexError):
+    except ValueError:
         await interaction.followup.send("❌ Invalid message reference. Please provide a valid message ID or URL.", ephemeral=True)
         return None
     except discord.NotFound:
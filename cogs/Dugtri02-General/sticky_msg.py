@@ -17,7 +17,9 @@ class StickyMsg(commands.GroupCog, name="stickymsg"):
         self.db = bot.db
         self.last_sticky_messages = {}  # Store last sticky message IDs by channel ID
         self.pending_stickies = {}  # Track pending sticky updates by channel ID
-        self.create_tables()
+    
+    async def cog_load(self):
+        await self.bot.run_db(self.create_tables)
     
     def create_tables(self):
         c = self.db.cursor()
@@ -41,6 +43,52 @@ class StickyMsg(commands.GroupCog, name="stickymsg"):
         """, (guild_id,))
         return c.fetchone()[0] or 0
 
+    def set_sticky(self, guild_id: int, channel_id: int, message: str, limit_new: bool) -> bool:
+        """Store a sticky message, returns False when a new one would go over the guild's limit"""
+        c = self.db.cursor()
+        # Check if this is a new sticky message (not an update to existing one)
+        c.execute("""
+        SELECT COUNT(*) FROM sticky_msg 
+        WHERE guild_id = ? AND channel_id = ?
+        """, (guild_id, channel_id))
+        is_update = c.fetchone()[0] > 0
+        
+        # Check message limit if not an update and guild is not in unlimited list
+        if not is_update and limit_new:
+            if self.get_guild_sticky_count(guild_id) >= self.MAX_STICKY_MESSAGES:
+                return False
+        
+        # Use INSERT OR REPLACE to handle updates to existing sticky messages
+        c.execute("""
+        INSERT OR REPLACE INTO sticky_msg (guild_id, channel_id, message_content)
+        VALUES (?, ?, ?)
+        """, (guild_id, channel_id, message))
+        self.db.commit()
+        return True
+
+    def delete_sticky(self, guild_id: int, channel_id: int):
+        c = self.db.cursor()
+        c.execute("""
+        DELETE FROM sticky_msg
+        WHERE guild_id = ? AND channel_id = ?
+        """, (guild_id, channel_id))
+        self.db.commit()
+
+    def get_sticky(self, guild_id: int, channel_id: int):
+        c = self.db.cursor()
+        c.execute("SELECT * FROM sticky_msg WHERE guild_id = ? AND channel_id = ?", (guild_id, channel_id))
+        return c.fetchone()
+
+    def clear_stickies(self, guild_id: int) -> list:
+        """Delete every sticky message in a guild, returning the channels they were in"""
+        c = self.db.cursor()
+        c.execute("SELECT channel_id FROM sticky_msg WHERE guild_id = ?", (guild_id,))
+        channels = c.fetchall()
+        
+        c.execute("DELETE FROM sticky_msg WHERE guild_id = ?", (guild_id,))
+        self.db.commit()
+        return channels
+
     @app_commands.command(name="set", description="Set a sticky message")
     @app_commands.checks.has_permissions(administrator=True)
     async def set_sticky_msg(self, interaction: discord.Interaction, channel: discord.TextChannel, message: str):
@@ -48,29 +96,14 @@ class StickyMsg(commands.GroupCog, name="stickymsg"):
         try:
             guild_id = interaction.guild.id
             
-            # Check if this is a new sticky message (not an update to existing one)
-            c = self.db.cursor()
-            c.execute("""
-            SELECT COUNT(*) FROM sticky_msg 
-            WHERE guild_id = ? AND channel_id = ?
-            """, (guild_id, channel.id))
-            is_update = c.fetchone()[0] > 0
-            
-            # Check message limit if not an update and guild is not in unlimited list
-            if not is_update and guild_id not in self.UNLIMITED_STICKY_GUILDS:
-                current_count = self.get_guild_sticky_count(guild_id)
-                if current_count >= self.MAX_STICKY_MESSAGES:
-                    return await interaction.followup.send(
-                        f"You've reached the maximum of {self.MAX_STICKY_MESSAGES} sticky messages for this server. "
-                        "Please remove an existing sticky message before adding a new one."
-                    )
-            
-            # Use INSERT OR REPLACE to handle updates to existing sticky messages
-            c.execute("""
-            INSERT OR REPLACE INTO sticky_msg (guild_id, channel_id, message_content)
-            VALUES (?, ?, ?)
-            """, (guild_id, channel.id, message))
-            self.db.commit()
+            stored = await self.bot.run_db(
+                self.set_sticky, guild_id, channel.id, message, guild_id not in self.UNLIMITED_STICKY_GUILDS
+            )
+            if not stored:
+                return await interaction.followup.send(
+                    f"You've reached the maximum of {self.MAX_STICKY_MESSAGES} sticky messages for this server. "
+                    "Please remove an existing sticky message before adding a new one."
+                )
             
             await interaction.followup.send("Sticky message set successfully.")
         except Exception as e:
@@ -81,12 +114,7 @@ class StickyMsg(commands.GroupCog, name="stickymsg"):
     async def remove_sticky_msg(self, interaction: discord.Interaction, channel: discord.TextChannel):
         await interaction.response.defer(ephemeral=True)
         try:
-            c = self.db.cursor()
-            c.execute("""
-            DELETE FROM sticky_msg
-            WHERE guild_id = ? AND channel_id = ?
-            """, (interaction.guild.id, channel.id))
-            self.db.commit()
+            await self.bot.run_db(self.delete_sticky, interaction.guild.id, channel.id)
             
             # Clear the channel's cache
             if channel.id in self.last_sticky_messages:
@@ -105,14 +133,9 @@ class StickyMsg(commands.GroupCog, name="stickymsg"):
     async def view_sticky_msg(self, interaction: discord.Interaction, channel: discord.TextChannel):
         await interaction.response.defer(ephemeral=True)
         try:
-            c = self.db.cursor()
-            c.execute("""
-            SELECT message_content FROM sticky_msg
-            WHERE guild_id = ? AND channel_id = ?
-            """, (interaction.guild.id, channel.id))
-            result = c.fetchone()
+            result = await self.bot.run_db(self.get_sticky, interaction.guild.id, channel.id)
             if result:
-                await interaction.followup.send(result[0])
+                await interaction.followup.send(result[2])
             else:
                 await interaction.followup.send("No sticky message found for this channel.")
         except Exception as e:
@@ -123,12 +146,7 @@ class StickyMsg(commands.GroupCog, name="stickymsg"):
     async def clear_sticky_msg(self, interaction: discord.Interaction):
         await interaction.response.defer(ephemeral=True)
         try:
-            c = self.db.cursor()
-            c.execute("SELECT channel_id FROM sticky_msg WHERE guild_id = ?", (interaction.guild.id,))
-            channels = c.fetchall()
-            
-            c.execute("DELETE FROM sticky_msg WHERE guild_id = ?", (interaction.guild.id,))
-            self.db.commit()
+            channels = await self.bot.run_db(self.clear_stickies, interaction.guild.id)
             
             # Clear all cached messages and pending tasks for this guild
             for channel_id, in channels:
@@ -167,9 +185,7 @@ class StickyMsg(commands.GroupCog, name="stickymsg"):
             return
             
         # Get the latest sticky message content
-        c = self.db.cursor()
-        c.execute("SELECT * FROM sticky_msg WHERE guild_id = ? AND channel_id = ?", (guild_id, channel_id))
-        result = c.fetchone()
+        result = await self.bot.run_db(self.get_sticky, guild_id, channel_id)
         if not result:
             return
             
@@ -251,13 +267,8 @@ class StickyMsg(commands.GroupCog, name="stickymsg"):
     @commands.Cog.listener()
     async def on_guild_remove(self, guild):
         try:
-            c = self.db.cursor()
-            c.execute("SELECT channel_id FROM sticky_msg WHERE guild_id = ?", (guild.id,))
-            channels = c.fetchall()
-            
             # Clear database entries for this guild
-            c.execute("DELETE FROM sticky_msg WHERE guild_id = ?", (guild.id,))
-            self.db.commit()
+            channels = await self.bot.run_db(self.clear_stickies, guild.id)
             
             # Clear caches for all channels in this guild
             for channel_id, in channels:
@@ -276,10 +287,7 @@ class StickyMsg(commands.GroupCog, name="stickymsg"):
         if message.author.bot:
             return
         
-        c = self.db.cursor()
-        c.execute("SELECT * FROM sticky_msg WHERE guild_id = ? AND channel_id = ?", 
-                 (message.guild.id, message.channel.id))
-        result = c.fetchone()
+        result = await self.bot.run_db(self.get_sticky, message.guild.id, message.channel.id)
         
         if result:
             channel_id = message.channel.id
@@ -75,7 +75,9 @@ class Card(commands.GroupCog, name="titles"):
         self.update_queue = UpdateQueue(self)
         # Locks for guild operations to prevent concurrent modifications
         self.guild_locks = {}
-        self._create_tables()
+    
+    async def cog_load(self):
+        await self.bot.run_db(self._create_tables)
     
     def _get_guild_lock(self, guild_id: int) -> asyncio.Lock:
         """Get or create a lock for a specific guild."""
@@ -338,6 +340,40 @@ class Card(commands.GroupCog, name="titles"):
         ''')
         self.db.commit()
     
+    def _store_prefix_suffix(self, guild_id: int, role_id: int, prefix: Optional[str], suffix: Optional[str]) -> bool:
+        with self.db:
+            cursor = self.db.cursor()
+            cursor.execute('''
+            INSERT OR REPLACE INTO guild_role_prefix_suffix (guild_id, role_id, prefix, suffix)
+            VALUES (?, ?, ?, ?)
+            ''', (guild_id, role_id, prefix, suffix))
+            return cursor.rowcount > 0
+    
+    def _fetch_prefix_suffix(self, guild_id: int, role_id: int):
+        cursor = self.db.cursor()
+        cursor.execute('''
+        SELECT prefix, suffix FROM guild_role_prefix_suffix
+        WHERE guild_id = ? AND role_id = ?
+        ''', (guild_id, role_id))
+        return cursor.fetchone()
+    
+    def _delete_prefix_suffix(self, guild_id: int, role_id: int) -> bool:
+        with self.db:
+            cursor = self.db.cursor()
+            cursor.execute('''
+            DELETE FROM guild_role_prefix_suffix
+            WHERE guild_id = ? AND role_id = ?
+            ''', (guild_id, role_id))
+            return cursor.rowcount > 0
+    
+    def _fetch_guild_prefixes_suffixes(self, guild_id: int) -> list:
+        cursor = self.db.cursor()
+        cursor.execute('''
+        SELECT role_id, prefix, suffix FROM guild_role_prefix_suffix
+        WHERE guild_id = ?
+        ''', (guild_id,))
+        return cursor.fetchall()
+    
     async def set_role_prefix_suffix(self, guild_id: int, role_id: int, 
                                   prefix: Optional[str] = None, 
                                   suffix: Optional[str] = None) -> bool:
@@ -348,26 +384,14 @@ class Card(commands.GroupCog, name="titles"):
         if prefix is None and suffix is None:
             return False
             
-        with self.db:
-            cursor = self.db.cursor()
-            cursor.execute('''
-            INSERT OR REPLACE INTO guild_role_prefix_suffix (guild_id, role_id, prefix, suffix)
-            VALUES (?, ?, ?, ?)
-            ''', (guild_id, role_id, prefix, suffix))
-            return cursor.rowcount > 0
+        return await self.bot.run_db(self._store_prefix_suffix, guild_id, role_id, prefix, suffix)
     
     async def get_role_prefix_suffix(self, guild_id: int, role_id: int) -> Optional[Dict[str, Any]]:
         """Get prefix/suffix for a specific role in a guild.
         
         Any emojis in the prefix or suffix will be transformed to their Unicode equivalents.
         """
-        cursor = self.db.cursor()
-        cursor.execute('''
-        SELECT prefix, suffix FROM guild_role_prefix_suffix
-        WHERE guild_id = ? AND role_id = ?
-        ''', (guild_id, role_id))
-        
-        result = cursor.fetchone()
+        result = await self.bot.run_db(self._fetch_prefix_suffix, guild_id, role_id)
         if result:
             return {
                 'prefix': transform_emoji(result[0]) if result[0] else None,
@@ -377,13 +401,7 @@ class Card(commands.GroupCog, name="titles"):
     
     async def remove_role_prefix_suffix(self, guild_id: int, role_id: int) -> bool:
         """Remove prefix/suffix configuration for a role."""
-        with self.db:
-            cursor = self.db.cursor()
-            cursor.execute('''
-            DELETE FROM guild_role_prefix_suffix
-            WHERE guild_id = ? AND role_id = ?
-            ''', (guild_id, role_id))
-            return cursor.rowcount > 0
+        return await self.bot.run_db(self._delete_prefix_suffix, guild_id, role_id)
     
     async def get_guild_prefixes_suffixes(self, guild_id: int, use_cache: bool = True) -> Dict[int, Tuple[Optional[str], Optional[str]]]:
         """Get all role prefix/suffix configurations for a guild with caching.
@@ -397,15 +415,11 @@ class Card(commands.GroupCog, name="titles"):
                 return cache_entry['roles']
         
         # Not in cache or cache expired, fetch from database
-        cursor = self.db.cursor()
-        cursor.execute('''
-        SELECT role_id, prefix, suffix FROM guild_role_prefix_suffix
-        WHERE guild_id = ?
-        ''', (guild_id,))
+        rows = await self.bot.run_db(self._fetch_guild_prefixes_suffixes, guild_id)
         
         # Transform emojis in prefixes and suffixes
         roles = {}
-        for row in cursor.fetchall():
+        for row in rows:
             role_id, prefix, suffix = row
             # Transform emojis in both prefix and suffix
             roles[role_id] = (
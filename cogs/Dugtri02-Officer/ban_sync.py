@@ -10,10 +10,12 @@ class BanSync(commands.GroupCog, name="sync"):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
         self.db = bot.db
-        self._create_tables()
         self.pending_requests = {}  # Format: {(guild1_id, guild2_id): view}
         self._processing_ban = {}  # Track bans being processed to prevent loops
     
+    async def cog_load(self):
+        await self.bot.run_db(self._create_tables)
+    
     class BanButton(discord.ui.Button):
         def __init__(self, user_id: int, guild_id: int):
             super().__init__(style=discord.ButtonStyle.danger, label="Ban User", custom_id=f"ban_{user_id}_{guild_id}")
@@ -86,10 +88,22 @@ class BanSync(commands.GroupCog, name="sync"):
             
         self.db.commit()
 
+    # Every query runs through bot.run_db with one of these, so the connection is only used from the database thread
+    def _fetchone(self, query: str, params: tuple = ()):
+        return self.db.execute(query, params).fetchone()
+
+    def _fetchall(self, query: str, params: tuple = ()) -> list:
+        return self.db.execute(query, params).fetchall()
+
+    def _write(self, query: str, params: tuple = ()) -> int:
+        """Run a single write and commit it, returns the number of rows it changed"""
+        with self.db:
+            return self.db.execute(query, params).rowcount
+
     async def _get_alert_channel(self, guild_id: int) -> Optional[discord.TextChannel]:
-        cursor = self.db.cursor()
-        cursor.execute("SELECT ban_alert_channel FROM ban_sync_settings WHERE guild_id = ?", (guild_id,))
-        result = cursor.fetchone()
+        result = await self.bot.run_db(
+            self._fetchone, "SELECT ban_alert_channel FROM ban_sync_settings WHERE guild_id = ?", (guild_id,)
+        )
         if result and result[0]:
             channel = self.bot.get_channel(result[0])
             if channel and isinstance(channel, discord.TextChannel):
@@ -125,6 +139,21 @@ class BanSync(commands.GroupCog, name="sync"):
             # Create a consistent key for the request regardless of guild order
             return tuple(sorted((self.source_guild.id, self.target_guild.id)))
 
+        def _blacklist_source(self, guild_id: int):
+            cursor = self.db.cursor()
+            # First check if already blacklisted
+            cursor.execute("""
+                SELECT 1 FROM ban_sync_request_blacklist 
+                WHERE guild_id = ? AND guild_ban_id = ?
+            """, (guild_id, self.source_guild.id))
+            
+            if not cursor.fetchone():
+                cursor.execute("""
+                    INSERT INTO ban_sync_request_blacklist (guild_id, guild_ban_id) 
+                    VALUES (?, ?)
+                """, (guild_id, self.source_guild.id))
+                self.db.commit()
+
         async def update_original_message(self, interaction: discord.Interaction = None):
             if not self.original_message:
                 return
@@ -238,19 +267,7 @@ class BanSync(commands.GroupCog, name="sync"):
             await interaction.response.defer(ephemeral=True)
             
             # Add to blacklist
-            cursor = self.db.cursor()
-            # First check if already blacklisted
-            cursor.execute("""
-                SELECT 1 FROM ban_sync_request_blacklist 
-                WHERE guild_id = ? AND guild_ban_id = ?
-            """, (interaction.guild.id, self.source_guild.id))
-            
-            if not cursor.fetchone():
-                cursor.execute("""
-                    INSERT INTO ban_sync_request_blacklist (guild_id, guild_ban_id) 
-                    VALUES (?, ?)
-                """, (interaction.guild.id, self.source_guild.id))
-                self.db.commit()
+            await interaction.client.run_db(self._blacklist_source, interaction.guild.id)
             
             # Update the request message
             embed = interaction.message.embeds[0]
@@ -279,15 +296,14 @@ class BanSync(commands.GroupCog, name="sync"):
 
     # Check if either guild has reached the maximum number of links (8)
     async def get_link_count(self, guild_id):
-        cursor = self.db.cursor()
-        cursor.execute("""
+        result = await self.bot.run_db(self._fetchone, """
             SELECT COUNT(*) as link_count FROM (
                 SELECT guild_two_id FROM ban_sync_links WHERE guild_one_id = ?
                 UNION
                 SELECT guild_one_id FROM ban_sync_links WHERE guild_two_id = ?
             )
         """, (guild_id, guild_id))
-        return cursor.fetchone()[0]
+        return result[0]
 
     @app_commands.command(name="link_add", description="Link another guild for ban synchronization.")
     @app_commands.describe(guild_id="The ID of the guild to link.")
@@ -333,20 +349,15 @@ class BanSync(commands.GroupCog, name="sync"):
         guild_one = min(interaction.guild.id, target_guild.id)
         guild_two = max(interaction.guild.id, target_guild.id)
 
-        cursor = self.db.cursor()
-        cursor.execute("SELECT 1 FROM ban_sync_links WHERE guild_one_id = ? AND guild_two_id = ?", (guild_one, guild_two))
-        if cursor.fetchone():
+        if await self.bot.run_db(self._fetchone, "SELECT 1 FROM ban_sync_links WHERE guild_one_id = ? AND guild_two_id = ?", (guild_one, guild_two)):
             await interaction.followup.send("✅ These guilds are already linked.", ephemeral=True)
             return
 
         # Check if we're blacklisted by the target guild
-        cursor = self.db.cursor()
-        cursor.execute("""
+        if await self.bot.run_db(self._fetchone, """
             SELECT 1 FROM ban_sync_request_blacklist 
             WHERE guild_id = ? AND guild_ban_id = ?
-        """, (target_guild.id, interaction.guild.id))
-        
-        if cursor.fetchone():
+        """, (target_guild.id, interaction.guild.id)):
             await interaction.followup.send(
                 f"❌ You cannot send a link request to `{target_guild.name}`. "
                 "This server has blacklisted your guild from sending ban sync requests.",
@@ -362,8 +373,7 @@ class BanSync(commands.GroupCog, name="sync"):
 
         if has_admin_in_target:
             # If user has admin in target guild, link directly
-            cursor.execute("INSERT INTO ban_sync_links (guild_one_id, guild_two_id) VALUES (?, ?)", (guild_one, guild_two))
-            self.db.commit()
+            await self.bot.run_db(self._write, "INSERT INTO ban_sync_links (guild_one_id, guild_two_id) VALUES (?, ?)", (guild_one, guild_two))
             await interaction.followup.send(f"✅ Successfully linked with guild `{target_guild.name}`.", ephemeral=True)
         else:
             # If no admin in target guild, send a request to the target guild's alert channel
@@ -427,8 +437,7 @@ class BanSync(commands.GroupCog, name="sync"):
                     await asyncio.wait_for(view.approved.wait(), timeout=86400)  # 24 hours
                     
                     # If we get here, the request was approved
-                    cursor.execute("INSERT INTO ban_sync_links (guild_one_id, guild_two_id) VALUES (?, ?)", (guild_one, guild_two))
-                    self.db.commit()
+                    await self.bot.run_db(self._write, "INSERT INTO ban_sync_links (guild_one_id, guild_two_id) VALUES (?, ?)", (guild_one, guild_two))
                     
                     # Update the request message
                     embed.color = discord.Color.green()
@@ -476,11 +485,7 @@ class BanSync(commands.GroupCog, name="sync"):
         guild_one = min(interaction.guild.id, target_guild_id)
         guild_two = max(interaction.guild.id, target_guild_id)
 
-        cursor = self.db.cursor()
-        cursor.execute("DELETE FROM ban_sync_links WHERE guild_one_id = ? AND guild_two_id = ?", (guild_one, guild_two))
-        deleted_rows = cursor.rowcount
-
-        self.db.commit()
+        deleted_rows = await self.bot.run_db(self._write, "DELETE FROM ban_sync_links WHERE guild_one_id = ? AND guild_two_id = ?", (guild_one, guild_two))
 
         if deleted_rows > 0:
             target_guild = self.bot.get_guild(target_guild_id)
@@ -493,20 +498,17 @@ class BanSync(commands.GroupCog, name="sync"):
     @app_commands.describe(channel="The channel to send ban alerts to")
     @app_commands.check(lambda interaction: interaction.user.guild_permissions.administrator or interaction.user.id == interaction.guild.owner_id)
     async def set_alert_channel(self, interaction: discord.Interaction, channel: discord.TextChannel):
-        cursor = self.db.cursor()
-        cursor.execute(
+        await self.bot.run_db(
+            self._write,
             "INSERT OR REPLACE INTO ban_sync_settings (guild_id, ban_alert_channel) VALUES (?, ?)",
             (interaction.guild.id, channel.id)
         )
-        self.db.commit()
         await interaction.response.send_message(f"✅ Ban alerts will now be sent to {channel.mention}.", ephemeral=True)
     
     @app_commands.command(name="alerts_remove", description="Remove the channel where ban alerts will be sent.")
     @app_commands.check(lambda interaction: interaction.user.guild_permissions.administrator or interaction.user.id == interaction.guild.owner_id)
     async def remove_alert_channel(self, interaction: discord.Interaction):
-        cursor = self.db.cursor()
-        cursor.execute("DELETE FROM ban_sync_settings WHERE guild_id = ?", (interaction.guild.id,))
-        self.db.commit()
+        await self.bot.run_db(self._write, "DELETE FROM ban_sync_settings WHERE guild_id = ?", (interaction.guild.id,))
         await interaction.response.send_message("✅ Ban alerts will no longer be sent.", ephemeral=True)
         
     @app_commands.command(name="blacklist_add", description="Prevent a guild from sending ban sync requests to this server.")
@@ -523,22 +525,18 @@ class BanSync(commands.GroupCog, name="sync"):
             await interaction.response.send_message("❌ You cannot blacklist your own guild.", ephemeral=True)
             return
             
-        cursor = self.db.cursor()
-        
         # Check if already blacklisted
-        cursor.execute("SELECT 1 FROM ban_sync_request_blacklist WHERE guild_id = ? AND guild_ban_id = ?", 
-                      (interaction.guild.id, guild_id_int))
-        if cursor.fetchone():
+        if await self.bot.run_db(self._fetchone, "SELECT 1 FROM ban_sync_request_blacklist WHERE guild_id = ? AND guild_ban_id = ?", 
+                                 (interaction.guild.id, guild_id_int)):
             await interaction.response.send_message(f"❌ Guild `{guild_id}` is already blacklisted.", ephemeral=True)
             return
             
         # Add to blacklist
-        cursor.execute("""
+        await self.bot.run_db(self._write, """
             INSERT INTO ban_sync_request_blacklist (guild_id, guild_ban_id) 
             VALUES (?, ?)
             ON CONFLICT(guild_id, guild_ban_id) DO NOTHING
         """, (interaction.guild.id, guild_id_int))
-        self.db.commit()
         
         await interaction.response.send_message(f"✅ Guild `{guild_id}` has been blacklisted from sending ban sync requests to this server.", ephemeral=True)
     
@@ -552,36 +550,29 @@ class BanSync(commands.GroupCog, name="sync"):
             await interaction.response.send_message("❌ Invalid guild ID format. Please provide a numeric guild ID.", ephemeral=True)
             return
             
-        cursor = self.db.cursor()
-        
         # Check if actually blacklisted
-        cursor.execute("SELECT 1 FROM ban_sync_request_blacklist WHERE guild_id = ? AND guild_ban_id = ?", 
-                      (interaction.guild.id, guild_id_int))
-        if not cursor.fetchone():
+        if not await self.bot.run_db(self._fetchone, "SELECT 1 FROM ban_sync_request_blacklist WHERE guild_id = ? AND guild_ban_id = ?", 
+                                     (interaction.guild.id, guild_id_int)):
             await interaction.response.send_message(f"❌ Guild `{guild_id}` is not in the blacklist.", ephemeral=True)
             return
             
         # Remove from blacklist
-        cursor.execute("""
+        await self.bot.run_db(self._write, """
             DELETE FROM ban_sync_request_blacklist 
             WHERE guild_id = ? AND guild_ban_id = ?
         """, (interaction.guild.id, guild_id_int))
-        self.db.commit()
         
         await interaction.response.send_message(f"✅ Guild `{guild_id}` has been removed from the blacklist and can now send ban sync requests to this server.", ephemeral=True)
     
     @app_commands.command(name="blacklist_list", description="List all guilds blacklisted from sending ban sync requests.")
     @app_commands.check(lambda interaction: interaction.user.guild_permissions.administrator or interaction.user.id == interaction.guild.owner_id)
     async def list_blacklisted_guilds(self, interaction: discord.Interaction):
-        cursor = self.db.cursor()
-        cursor.execute("""
+        blacklisted = await self.bot.run_db(self._fetchall, """
             SELECT guild_ban_id FROM ban_sync_request_blacklist 
             WHERE guild_id = ?
             ORDER BY guild_ban_id
         """, (interaction.guild.id,))
         
-        blacklisted = cursor.fetchall()
-        
         if not blacklisted:
             await interaction.response.send_message("No guilds are currently blacklisted from sending ban sync requests to this server.", ephemeral=True)
             return
@@ -611,9 +602,7 @@ class BanSync(commands.GroupCog, name="sync"):
         await interaction.response.defer(ephemeral=True)
         current_guild_id = interaction.guild.id
 
-        cursor = self.db.cursor()
-        cursor.execute("SELECT guild_one_id, guild_two_id FROM ban_sync_links WHERE guild_one_id = ? OR guild_two_id = ?", (current_guild_id, current_guild_id))
-        links = cursor.fetchall()
+        links = await self.bot.run_db(self._fetchall, "SELECT guild_one_id, guild_two_id FROM ban_sync_links WHERE guild_one_id = ? OR guild_two_id = ?", (current_guild_id, current_guild_id))
 
         if not links:
             await interaction.followup.send("This guild is not linked with any others.", ephemeral=True)
@@ -640,9 +629,7 @@ class BanSync(commands.GroupCog, name="sync"):
         await interaction.followup.send(embed=embed, ephemeral=True)
 
     async def _get_linked_guilds(self, guild_id: int) -> set[int]:
-        cursor = self.db.cursor()
-        cursor.execute("SELECT guild_one_id, guild_two_id FROM ban_sync_links WHERE guild_one_id = ? OR guild_two_id = ?", (guild_id, guild_id))
-        links = cursor.fetchall()
+        links = await self.bot.run_db(self._fetchall, "SELECT guild_one_id, guild_two_id FROM ban_sync_links WHERE guild_one_id = ? OR guild_two_id = ?", (guild_id, guild_id))
         
         linked_ids = set()
         for g1, g2 in links:
@@ -928,9 +915,9 @@ class BanSync(commands.GroupCog, name="sync"):
     async def _send_ban_alert(self, target_guild: discord.Guild, source_guild: discord.Guild, 
                             actor: discord.Member, user: discord.User, reason: str, 
                             alert_reason: str = "No reason provided"):
-        cursor = self.db.cursor()
-        cursor.execute("SELECT ban_alert_channel FROM ban_sync_settings WHERE guild_id = ?", (target_guild.id,))
-        result = cursor.fetchone()
+        result = await self.bot.run_db(
+            self._fetchone, "SELECT ban_alert_channel FROM ban_sync_settings WHERE guild_id = ?", (target_guild.id,)
+        )
         
         if not result or not result[0]:
             return
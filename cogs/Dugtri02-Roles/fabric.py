@@ -7,7 +7,9 @@ class RoleManager(commands.GroupCog, name="role"):
     def __init__(self, bot):
         self.bot = bot
         self.db = bot.db
-        self._create_tables()
+    
+    async def cog_load(self):
+        await self.bot.run_db(self._create_tables)
     
     def _create_tables(self):
         """Create necessary database tables for role management."""
@@ -22,17 +24,19 @@ class RoleManager(commands.GroupCog, name="role"):
         ''')
         self.db.commit()
     
-    async def get_authorized_roles(self, user: discord.Member, guild_id: int) -> List[discord.Role]:
-        """Get all roles that the user is authorized to manage."""
+    def _fetch_authorized_ids(self, guild_id: int, role_ids: List[int]) -> Set[int]:
         cursor = self.db.cursor()
         cursor.execute('''
             SELECT DISTINCT optionid 
             FROM minirole 
             WHERE guild_id = ? AND authorizedid IN ({})
-        '''.format(','.join('?' for _ in user.roles)), 
-        (guild_id, *[role.id for role in user.roles]))
-        
-        role_ids = {row[0] for row in cursor.fetchall()}
+        '''.format(','.join('?' for _ in role_ids)), 
+        (guild_id, *role_ids))
+        return {row[0] for row in cursor.fetchall()}
+    
+    async def get_authorized_roles(self, user: discord.Member, guild_id: int) -> List[discord.Role]:
+        """Get all roles that the user is authorized to manage."""
+        role_ids = await self.bot.run_db(self._fetch_authorized_ids, guild_id, [role.id for role in user.roles])
         return [role for role in user.guild.roles if role.id in role_ids]
 
     async def role_autocomplete(
@@ -187,34 +191,39 @@ class Fabric(commands.GroupCog, name="fabric"):
     def __init__(self, bot):
         self.bot = bot
         self.db = bot.db
-        self._create_tables()
+    
+    async def cog_load(self):
+        await self.bot.run_db(self._create_tables)
     
     @commands.Cog.listener()
     async def on_guild_role_delete(self, role: discord.Role):
         try:
             """Clean up minirole table when a role is deleted"""
-            cursor = self.db.cursor()
-            
-            # Check if the role was even in the database
-            cursor.execute('''
-                SELECT COUNT(*) 
-                FROM minirole 
-                WHERE guild_id = ? AND (authorizedid = ? OR optionid = ?)
-            ''', (role.guild.id, role.id, role.id))
-            
-            if cursor.fetchone()[0] == 0:
-                return  # Role wasn't in the database, nothing to do
-            
-            # Remove any entries where the deleted role was a manager or a managed role
-            cursor.execute('''
-                DELETE FROM minirole 
-                WHERE guild_id = ? AND (authorizedid = ? OR optionid = ?)
-            ''', (role.guild.id, role.id, role.id))
-            
-            self.db.commit()
+            await self.bot.run_db(self._delete_role_entries, role.guild.id, role.id)
         except Exception as e:
             print(f"Error cleaning up minirole table: {e}")
     
+    def _delete_role_entries(self, guild_id: int, role_id: int):
+        cursor = self.db.cursor()
+        
+        # Check if the role was even in the database
+        cursor.execute('''
+            SELECT COUNT(*) 
+            FROM minirole 
+            WHERE guild_id = ? AND (authorizedid = ? OR optionid = ?)
+        ''', (guild_id, role_id, role_id))
+        
+        if cursor.fetchone()[0] == 0:
+            return  # Role wasn't in the database, nothing to do
+        
+        # Remove any entries where the deleted role was a manager or a managed role
+        cursor.execute('''
+            DELETE FROM minirole 
+            WHERE guild_id = ? AND (authorizedid = ? OR optionid = ?)
+        ''', (guild_id, role_id, role_id))
+        
+        self.db.commit()
+    
     def _create_tables(self):
         """Create necessary database tables for role management."""
         cursor = self.db.cursor()
@@ -228,17 +237,19 @@ class Fabric(commands.GroupCog, name="fabric"):
         ''')
         self.db.commit()
     
-    async def get_authorized_roles(self, user: discord.Member, guild_id: int) -> List[discord.Role]:
-        """Get all roles that the user is authorized to manage."""
+    def _fetch_authorized_ids(self, guild_id: int, role_ids: List[int]) -> Set[int]:
         cursor = self.db.cursor()
         cursor.execute('''
             SELECT DISTINCT optionid 
             FROM minirole 
             WHERE guild_id = ? AND authorizedid IN ({})
-        '''.format(','.join('?' for _ in user.roles)), 
-        (guild_id, *[role.id for role in user.roles]))
-        
-        role_ids = {row[0] for row in cursor.fetchall()}
+        '''.format(','.join('?' for _ in role_ids)), 
+        (guild_id, *role_ids))
+        return {row[0] for row in cursor.fetchall()}
+    
+    async def get_authorized_roles(self, user: discord.Member, guild_id: int) -> List[discord.Role]:
+        """Get all roles that the user is authorized to manage."""
+        role_ids = await self.bot.run_db(self._fetch_authorized_ids, guild_id, [role.id for role in user.roles])
         return [role for role in user.guild.roles if role.id in role_ids]
 
     async def role_autocomplete(
@@ -262,6 +273,65 @@ class Fabric(commands.GroupCog, name="fabric"):
                 )
         return role_choices[:25]
     
+    def _clear_manager(self, guild_id: int, manager_id: int):
+        self.db.execute('''
+            DELETE FROM minirole 
+            WHERE guild_id = ? AND authorizedid = ?
+        ''', (guild_id, manager_id))
+        self.db.commit()
+    
+    def _add_managed(self, guild_id: int, manager_id: int, role_id: int, can_edit: bool):
+        cursor = self.db.cursor()
+        # Add management permission
+        cursor.execute('''
+            INSERT OR IGNORE INTO minirole (guild_id, authorizedid, optionid)
+            VALUES (?, ?, ?)
+        ''', (guild_id, manager_id, role_id))
+        
+        # Check if the target role has a wardrobe configuration and can_edit is True
+        if can_edit:
+            cursor.execute('''
+                SELECT 1 FROM wardrobe_roles 
+                WHERE guild_id = ? AND role_id = ?
+            ''', (guild_id, role_id))
+            
+            if cursor.fetchone():
+                # Update the created_by_role_id in wardrobe_roles
+                cursor.execute('''
+                    UPDATE wardrobe_roles 
+                    SET created_by_role_id = ?
+                    WHERE guild_id = ? AND role_id = ?
+                ''', (manager_id, guild_id, role_id))
+        
+        self.db.commit()
+    
+    def _remove_managed(self, guild_id: int, manager_id: int, role_id: int):
+        self.db.execute('''
+            DELETE FROM minirole 
+            WHERE guild_id = ? AND authorizedid = ? AND optionid = ?
+        ''', (guild_id, manager_id, role_id))
+        self.db.commit()
+    
+    def _fetch_managed_ids(self, guild_id: int, manager_id: int) -> List[int]:
+        cursor = self.db.execute('''
+            SELECT optionid 
+            FROM minirole 
+            WHERE guild_id = ? AND authorizedid = ?
+            ORDER BY optionid
+        ''', (guild_id, manager_id))
+        return [row[0] for row in cursor.fetchall()]
+    
+    def _fetch_manager_counts(self, guild_id: int) -> List[tuple]:
+        """Every manager role id in the guild with how many roles it manages"""
+        cursor = self.db.execute('''
+            SELECT authorizedid, COUNT(*)
+            FROM minirole 
+            WHERE guild_id = ?
+            GROUP BY authorizedid
+            ORDER BY authorizedid
+        ''', (guild_id,))
+        return [tuple(row) for row in cursor.fetchall()]
+    
     @app_commands.command(name="setup", description="Manage role permissions. (for: /role add|remove)")
     @app_commands.describe(
         manager="The role that can manage other roles",
@@ -287,15 +357,9 @@ class Fabric(commands.GroupCog, name="fabric"):
         - /role-setup manager:@Role delete:True - Remove all permissions for manager
         """
         try:
-            cursor = self.db.cursor()
-            
             if delete:
                 # Remove all permissions for the manager
-                cursor.execute('''
-                    DELETE FROM minirole 
-                    WHERE guild_id = ? AND authorizedid = ?
-                ''', (interaction.guild_id, manager.id))
-                self.db.commit()
+                await self.bot.run_db(self._clear_manager, interaction.guild_id, manager.id)
                 return await interaction.response.send_message(
                     f"✅ Removed all role management permissions for {manager.mention}",
                     ephemeral=True
@@ -315,28 +379,8 @@ class Fabric(commands.GroupCog, name="fabric"):
                         ephemeral=True
                     )
                     
-                # Add management permission
-                cursor.execute('''
-                    INSERT OR IGNORE INTO minirole (guild_id, authorizedid, optionid)
-                    VALUES (?, ?, ?)
-                ''', (interaction.guild_id, manager.id, add.id))
-                
-                # Check if the target role has a wardrobe configuration and can_edit is True
-                if can_edit:
-                    cursor.execute('''
-                        SELECT 1 FROM wardrobe_roles 
-                        WHERE guild_id = ? AND role_id = ?
-                    ''', (interaction.guild_id, add.id))
-                    
-                    if cursor.fetchone():
-                        # Update the created_by_role_id in wardrobe_roles
-                        cursor.execute('''
-                            UPDATE wardrobe_roles 
-                            SET created_by_role_id = ?
-                            WHERE guild_id = ? AND role_id = ?
-                        ''', (manager.id, interaction.guild_id, add.id))
-                
-                self.db.commit()
+                # Add management permission, and hand it the role's wardrobe config if can_edit is True
+                await self.bot.run_db(self._add_managed, interaction.guild_id, manager.id, add.id, can_edit)
                 return await interaction.response.send_message(
                     f"✅ {manager.mention} can now manage {add.mention}",
                     ephemeral=True
@@ -351,26 +395,17 @@ class Fabric(commands.GroupCog, name="fabric"):
                     )
                     
                 # Remove specific management permission
-                cursor.execute('''
-                    DELETE FROM minirole 
-                    WHERE guild_id = ? AND authorizedid = ? AND optionid = ?
-                ''', (interaction.guild_id, manager.id, remove.id))
-                self.db.commit()
+                await self.bot.run_db(self._remove_managed, interaction.guild_id, manager.id, remove.id)
                 return await interaction.response.send_message(
                     f"✅ Removed permission for {manager.mention} to manage {remove.mention}",
                     ephemeral=True
                 )
                 
             # If no action specified, show current permissions
-            cursor.execute('''
-                SELECT optionid FROM minirole 
-                WHERE guild_id = ? AND authorizedid = ?
-            ''', (interaction.guild_id, manager.id))
-            
             managed_roles = [
-                interaction.guild.get_role(row[0])
-                for row in cursor.fetchall()
-                if interaction.guild.get_role(row[0])  # Only include valid roles
+                interaction.guild.get_role(role_id)
+                for role_id in await self.bot.run_db(self._fetch_managed_ids, interaction.guild_id, manager.id)
+                if interaction.guild.get_role(role_id)  # Only include valid roles
             ]
             
             if not managed_roles:
@@ -404,21 +439,12 @@ class Fabric(commands.GroupCog, name="fabric"):
     @app_commands.checks.has_permissions(administrator=True)
     async def role_list(self, interaction: discord.Interaction, role: discord.Role = None, page: int = 1):
         """View role management permissions. Shows all roles with permissions if no role is specified."""
-        cursor = self.db.cursor()
-        
         if role:
             # Show detailed permissions for a specific role
-            cursor.execute('''
-                SELECT optionid 
-                FROM minirole 
-                WHERE guild_id = ? AND authorizedid = ?
-                ORDER BY optionid
-            ''', (interaction.guild_id, role.id))
-            
             managed_roles = [
-                interaction.guild.get_role(row[0])
-                for row in cursor.fetchall()
-                if interaction.guild.get_role(row[0])  # Only include valid roles
+                interaction.guild.get_role(role_id)
+                for role_id in await self.bot.run_db(self._fetch_managed_ids, interaction.guild_id, role.id)
+                if interaction.guild.get_role(role_id)  # Only include valid roles
             ]
             
             if not managed_roles:
@@ -457,18 +483,13 @@ class Fabric(commands.GroupCog, name="fabric"):
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
         
-        # If no role specified, show all roles with management options
-        cursor.execute('''
-            SELECT DISTINCT authorizedid
-            FROM minirole 
-            WHERE guild_id = ?
-            ORDER BY authorizedid
-        ''', (interaction.guild_id,))
+        # If no role specified, show all roles with management options, counted in the same query
+        role_counts = dict(await self.bot.run_db(self._fetch_manager_counts, interaction.guild_id))
         
         managers = [
-            interaction.guild.get_role(row[0])
-            for row in cursor.fetchall()
-            if interaction.guild.get_role(row[0])  # Only include valid roles
+            interaction.guild.get_role(manager_id)
+            for manager_id in role_counts
+            if interaction.guild.get_role(manager_id)  # Only include valid roles
         ]
         
         if not managers:
@@ -495,12 +516,7 @@ class Fabric(commands.GroupCog, name="fabric"):
         
         # Add roles for current page with role counts
         for manager in page_roles:
-            cursor.execute('''
-                SELECT COUNT(*) 
-                FROM minirole 
-                WHERE guild_id = ? AND authorizedid = ?
-            ''', (interaction.guild_id, manager.id))
-            role_count = cursor.fetchone()[0]
+            role_count = role_counts[manager.id]
             
             # Use role ID in the name and mention in the value for proper display
             embed.add_field(
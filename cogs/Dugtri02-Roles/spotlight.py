@@ -2,76 +2,156 @@
 # decently customizable! current implementation maxes out at 8 users but that can be changed
 
 import discord; from discord import app_commands; from discord.ext import commands, tasks
-from datetime import datetime, timedelta, timezone; import pytz
-import random, logging, asyncio, sqlite3; from optparse import Option
-from typing import Dict, List, Optional, Set, Tuple, Deque
-from collections import deque; from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone, time as dt_time; from zoneinfo import ZoneInfo
+import random, logging, asyncio, json, re
+from time import monotonic
+from typing import Dict, List, Optional, Set, Tuple
+from dataclasses import dataclass, field
+from functools import partial
+
+# dateutil is optional, set_spotlight_time falls back to its own parsing without it
+try:
+    from dateutil import parser as _dateparser
+except ImportError:
+    _dateparser = None
 
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Hours, optional minutes and optional am/pm of a time string, read in one match by set_spotlight_time
+_TIME_RE = re.compile(r'^\s*(\d{1,2})(?:\s*:\s*(\d{1,2}))?\s*([ap]m)?\s*$', re.IGNORECASE)
+
+# Hours an am/pm period adds once 12 has been folded to 0
+_PERIOD_OFFSET = {'am': 0, 'pm': 12}
+
+# Zone the list and time commands show and read times in
+EASTERN = ZoneInfo('US/Eastern')
+
+# Blacklist slots a configuration has, stored as one JSON list of role ids with 0 for an empty slot
+BLACKLIST_SLOTS = 4
+
+# Locks SpotlightCache spreads guilds over, so writes for different guilds rarely wait on each other
+LOCK_STRIPES = 16
+
+# Seconds a guild's config list is reused by autocomplete before it is read again
+CONFIGS_LIST_TTL = 60
+
+# Slotted so the many cached instances carry no per-instance __dict__
+@dataclass(slots=True)
 class SpotlightConfig:
     guild_id: int
     initial_role_id: int
     target_role_id: int
     max_users: int
     id: Optional[int] = None  # Will be set when loaded from DB
+    rotation_interval_hours: int = 1
     last_rotation: Optional[datetime] = None
     cache_expiry: Optional[datetime] = None
     remove_when_offline: bool = False  # Whether to remove users when they go offline
     prioritize_active: bool = False  # Whether to prioritize active users in rotation
     ignore_timed_out: bool = False  # Whether to ignore timed out users in rotation
-    blacklisted_role_id: Optional[int] = None  # Role ID to exclude from rotation
     always_replace_current: bool = False  # Whether to always replace current spotlight members
-    blacklisted_role_id_2: Optional[int] = None  # Role ID to exclude from rotation
-    blacklisted_role_id_3: Optional[int] = None  # Role ID to exclude from rotation
-    blacklisted_role_id_4: Optional[int] = None  # Role ID to exclude from rotation
+    blacklisted_role_ids: List[int] = field(default_factory=lambda: [0] * BLACKLIST_SLOTS)  # Role IDs to exclude from rotation, one per slot
+    label: Optional[str] = None  # "initial → target" autocomplete label, filled in on first use
+    label_lower: Optional[str] = None
+
+def _load_blacklist(raw: Optional[str]) -> List[int]:
+    """Parse a blacklisted_role_ids column into one role id per slot, 0 for an empty slot."""
+    slots = [int(role_id or 0) for role_id in json.loads(raw or '[]')[:BLACKLIST_SLOTS]]
+    return slots + [0] * (BLACKLIST_SLOTS - len(slots))
 
 class SpotlightCache:
     def __init__(self):
         self._cache: Dict[int, SpotlightConfig] = {}
         self._role_mapping: Dict[int, Set[Tuple[int, int]]] = {}
-        self._lock = asyncio.Lock()
+        # guild_id -> role ids it put in _role_mapping, so a cleanup only visits that guild's roles
+        self._guild_roles: Dict[int, Set[int]] = {}
+        # guild_id -> (monotonic expiry, configs) for autocomplete, dropped by delete() on every change
+        self._configs_lists: Dict[int, Tuple[float, List[SpotlightConfig]]] = {}
+        # guild_id -> rotation rows for each of its configs, loaded once and re-read per guild after delete()
+        self._rotation_rows: Dict[int, List[tuple]] = {}
+        self._stale_guilds: Set[int] = set()
+        self._locks = [asyncio.Lock() for _ in range(LOCK_STRIPES)]
+    
+    def _lock_for(self, guild_id: int) -> asyncio.Lock:
+        # The low bits of a snowflake are a per-process counter that is usually small,
+        # the timestamp bits above them spread guilds evenly
+        return self._locks[(guild_id >> 22) % LOCK_STRIPES]
     
     async def get(self, guild_id: int) -> Optional[SpotlightConfig]:
-        async with self._lock:
-            config = self._cache.get(guild_id)
-            if config and config.cache_expiry and datetime.utcnow() > config.cache_expiry:
-                del self._cache[guild_id]
-                self._cleanup_mapping(guild_id)
-                return None
-            return config
+        # Reads never touch the lock, an expired entry is dropped inline since nothing here awaits
+        config = self._cache.get(guild_id)
+        if config and config.cache_expiry and datetime.now(timezone.utc) > config.cache_expiry:
+            del self._cache[guild_id]
+            self._cleanup_mapping(guild_id)
+            return None
+        return config
     
     async def set(self, config: SpotlightConfig, expiry_hours: int = 24):
-        async with self._lock:
+        async with self._lock_for(config.guild_id):
             self._cleanup_mapping(config.guild_id)
-            config.cache_expiry = datetime.utcnow() + timedelta(hours=expiry_hours)
+            config.cache_expiry = datetime.now(timezone.utc) + timedelta(hours=expiry_hours)
             self._cache[config.guild_id] = config
             
             for role_id in [config.initial_role_id, config.target_role_id]:
                 if role_id not in self._role_mapping:
                     self._role_mapping[role_id] = set()
                 self._role_mapping[role_id].add((config.guild_id, config.initial_role_id, config.target_role_id))
+                self._guild_roles.setdefault(config.guild_id, set()).add(role_id)
     
     async def delete(self, guild_id: int):
-        async with self._lock:
+        async with self._lock_for(guild_id):
+            self._configs_lists.pop(guild_id, None)
+            self._stale_guilds.add(guild_id)
             if guild_id in self._cache:
                 self._cleanup_mapping(guild_id)
                 del self._cache[guild_id]
     
     def _cleanup_mapping(self, guild_id: int):
-        for role_id in list(self._role_mapping.keys()):
-            mappings = self._role_mapping[role_id]
+        # Never awaits, so the shared _role_mapping is only touched by one task at a time
+        for role_id in self._guild_roles.pop(guild_id, ()):
+            mappings = self._role_mapping.get(role_id)
+            if mappings is None:
+                continue
             to_remove = {m for m in mappings if m[0] == guild_id}
             for m in to_remove:
                 mappings.discard(m)
             if not mappings:
                 del self._role_mapping[role_id]
     
-    async def get_affected_configs(self, role_id: int) -> List[Tuple[int, int, int]]:
-        async with self._lock:
-            return list(self._role_mapping.get(role_id, set()))
+    def get_configs_list(self, guild_id: int) -> Optional[List[SpotlightConfig]]:
+        entry = self._configs_lists.get(guild_id)
+        if entry and monotonic() < entry[0]:
+            return entry[1]
+        return None
+    
+    def set_configs_list(self, guild_id: int, configs: List[SpotlightConfig]):
+        self._configs_lists[guild_id] = (monotonic() + CONFIGS_LIST_TTL, configs)
+    
+    def forget_configs_list(self, guild_id: int):
+        self._configs_lists.pop(guild_id, None)
+    
+    def load_rotation_rows(self, rows: List[tuple], guild_ids=()):
+        """Replace the rotation rows of the given guilds (every guild when none are given) with rows."""
+        if guild_ids:
+            for guild_id in guild_ids:
+                self._rotation_rows.pop(guild_id, None)
+        else:
+            self._rotation_rows.clear()
+        for row in rows:
+            self._rotation_rows.setdefault(row[1], []).append(row)
+    
+    def take_stale_guilds(self) -> Set[int]:
+        stale, self._stale_guilds = self._stale_guilds, set()
+        return stale
+    
+    def rotation_rows(self) -> List[tuple]:
+        return [row for rows in self._rotation_rows.values() for row in rows]
+    
+    def get_affected_configs(self, role_id: int) -> List[Tuple[int, int, int]]:
+        # A plain copy of the bucket, nothing here can yield so no lock is needed
+        mappings = self._role_mapping.get(role_id)
+        return list(mappings) if mappings else []
 
 class RoleOperation:
     def __init__(self, member: discord.Member, role: discord.Role, add: bool):
@@ -82,130 +162,298 @@ class RoleOperation:
         self.last_attempt: Optional[datetime] = None
 
 class Spotlight(commands.GroupCog, name="spotlight"):
+    # Statements run on every rotation, presence change and autocomplete, kept as constants so the
+    # connection's statement cache hands back the already-compiled program
+    _SQL_GET_MAX = 'SELECT max_configs FROM spotlight_guild_settings WHERE guild_id = ?'
+    _SQL_SET_MAX = 'INSERT OR REPLACE INTO spotlight_guild_settings (guild_id, max_configs) VALUES (?, ?)'
+    _SQL_GET_CONFIGS = (
+        'SELECT id, initial_role_id, target_role_id, max_users, last_rotation, remove_when_offline '
+        'FROM spotlight WHERE guild_id = ?'
+    )
+    _SQL_PRESENCE_CONFIGS = '''SELECT id, initial_role_id, target_role_id, rotation_interval_hours, 
+                      remove_when_offline, ignore_timed_out, prioritize_active,
+                      blacklisted_role_ids
+               FROM spotlight 
+               WHERE guild_id = ?'''
+    _SQL_GET_BLACKLIST = 'SELECT blacklisted_role_ids FROM spotlight WHERE id = ? AND guild_id = ?'
+    _SQL_SET_BLACKLIST = 'UPDATE spotlight SET blacklisted_role_ids = ? WHERE id = ?'
+    _SQL_ROTATION_CONFIGS = '''
+                SELECT id, guild_id, initial_role_id, target_role_id, max_users,
+                    COALESCE(rotation_interval_hours, 1) as rotation_interval_hours,
+                    last_rotation,
+                    prioritize_active,
+                    ignore_timed_out,
+                    always_replace_current,
+                    blacklisted_role_ids
+                FROM spotlight
+                WHERE guild_id IS NOT NULL'''
+
     def __init__(self, bot):
         self.bot = bot
         self.db = bot.db
         self.cache = SpotlightCache()
-        self.role_queue: Deque[RoleOperation] = deque()
-        self.role_queue_lock = asyncio.Lock()
-        self.role_processing = False
-        self.rotation_task = self.rotate_spotlight.start()
+        # guild_id -> max configs, only the smc command changes it
+        self._max_configs_cache: Dict[int, int] = {}
+        # SET clause fields -> edit_spotlight's UPDATE, so the same text reaches the statement cache every time
+        self._edit_sql_cache: Dict[Tuple[str, ...], str] = {}
+        # The processor blocks on get() until an operation is queued instead of polling
+        self.role_queue: asyncio.Queue[RoleOperation] = asyncio.Queue()
         self.role_processor_task = self.bot.loop.create_task(self.process_role_queue())
-        self._create_tables()
         self._last_config_index = 0  # Track the last processed config index
     
+    async def cog_load(self):
+        await self.bot.run_db(self._create_tables)
+        # Load every configuration for the rotation loop with one query, before the loop first runs
+        self.cache.load_rotation_rows(await self.bot.run_db(self._fetch_rotation_rows))
+        self.rotation_task = self.rotate_spotlight.start()
+    
     def cog_unload(self):
         self.rotation_task.cancel()
         if hasattr(self, 'role_processor_task'):
             self.role_processor_task.cancel()
     
     def _create_tables(self):
-        cursor = self.db.cursor()
-        # Create guild settings table if it doesn't exist
-        cursor.execute('''
-        CREATE TABLE IF NOT EXISTS spotlight_guild_settings (
-            guild_id INTEGER PRIMARY KEY,
-            max_configs INTEGER NOT NULL DEFAULT 1
-        )
-        ''')
-        # Drop the backup table if it exists
-        cursor.execute("DROP TABLE IF EXISTS spotlight_backup")
-        
-        # Check if the old table exists and has data
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='spotlight'")
-        old_table_exists = cursor.fetchone() is not None
-        
-        if old_table_exists:
-            # Check if the old table has the remove_when_offline column
-            cursor.execute("PRAGMA table_info(spotlight)")
-            columns = [col[1] for col in cursor.fetchall()]
-            has_new_column = 'blacklisted_role_id_2' in columns
+        # One look at the table decides what is missing, and the whole upgrade commits or rolls back together
+        columns = {col[1] for col in self.db.execute("PRAGMA table_info(spotlight)")}
+        with self.db:
+            if not self.db.in_transaction:
+                # sqlite3 runs DDL in autocommit mode unless a transaction is already open
+                self.db.execute("BEGIN")
             
-            if not has_new_column:                
-                # Add the new columns to the old table with default values, one at a time
-                try:
-                    cursor.execute('''
-                    ALTER TABLE spotlight 
-                    ADD COLUMN blacklisted_role_id_2 BOOLEAN NOT NULL DEFAULT 0
-                    ''')
-                    
-                    cursor.execute('''
-                    ALTER TABLE spotlight 
-                    ADD COLUMN blacklisted_role_id_3 BOOLEAN NOT NULL DEFAULT 0
-                    ''')
-
-                    cursor.execute('''
-                    ALTER TABLE spotlight 
-                    ADD COLUMN blacklisted_role_id_4 BOOLEAN NOT NULL DEFAULT 0
-                    ''')
-                    
-                    # If there was a backup table with the new schema, drop it
-                    cursor.execute("DROP TABLE IF EXISTS spotlight_new")
-                    logger.info("Successfully added new columns to spotlight table")
-                except sqlite3.OperationalError as e:
-                    logger.error(f"Error adding columns to spotlight table: {e}")
-                    # If the columns already exist, we can continue
-                    if "duplicate column" not in str(e).lower():
-                        raise
-                
-                # Commit the changes
-                self.db.commit()
-                logger.info("Added blacklisted_role_id_3, blacklisted_role_id_4 columns to spotlight table")
-        else:
-            # Create the table from scratch with the new schema
-            cursor.execute('''
-            CREATE TABLE IF NOT EXISTS spotlight (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                guild_id INTEGER NOT NULL,
-                initial_role_id INTEGER NOT NULL,
-                target_role_id INTEGER NOT NULL,
-                max_users INTEGER NOT NULL,
-                rotation_interval_hours INTEGER NOT NULL DEFAULT 1,
-                last_rotation TIMESTAMP,
-                remove_when_offline BOOLEAN NOT NULL DEFAULT 0,
-                prioritize_active BOOLEAN NOT NULL DEFAULT 0,
-                blacklisted_role_id INTEGER,
-                ignore_timed_out BOOLEAN NOT NULL DEFAULT 0,
-                always_replace_current BOOLEAN NOT NULL DEFAULT 0,
-                blacklisted_role_id_2 INTEGER,
-                blacklisted_role_id_3 INTEGER,
-                blacklisted_role_id_4 INTEGER,
-                UNIQUE(guild_id, initial_role_id, target_role_id)
+            # Create guild settings table if it doesn't exist
+            self.db.execute('''
+            CREATE TABLE IF NOT EXISTS spotlight_guild_settings (
+                guild_id INTEGER PRIMARY KEY,
+                max_configs INTEGER NOT NULL DEFAULT 1
             )
             ''')
+            # Drop tables left behind by earlier migrations
+            self.db.execute("DROP TABLE IF EXISTS spotlight_backup")
+            self.db.execute("DROP TABLE IF EXISTS spotlight_new")
+            
+            if not columns:
+                # Create the table from scratch with the new schema
+                self.db.execute('''
+                CREATE TABLE spotlight (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    guild_id INTEGER NOT NULL,
+                    initial_role_id INTEGER NOT NULL,
+                    target_role_id INTEGER NOT NULL,
+                    max_users INTEGER NOT NULL,
+                    rotation_interval_hours INTEGER NOT NULL DEFAULT 1,
+                    last_rotation TIMESTAMP,
+                    remove_when_offline BOOLEAN NOT NULL DEFAULT 0,
+                    prioritize_active BOOLEAN NOT NULL DEFAULT 0,
+                    ignore_timed_out BOOLEAN NOT NULL DEFAULT 0,
+                    always_replace_current BOOLEAN NOT NULL DEFAULT 0,
+                    blacklisted_role_ids TEXT NOT NULL DEFAULT '[]',
+                    UNIQUE(guild_id, initial_role_id, target_role_id)
+                )
+                ''')
+            elif 'blacklisted_role_ids' not in columns:
+                # Fold the old slot columns into one JSON list, they are left in place but unused.
+                # Tables from before slots 2-4 existed only have the first one
+                slot_columns = [
+                    column for column in ('blacklisted_role_id', 'blacklisted_role_id_2', 'blacklisted_role_id_3', 'blacklisted_role_id_4')
+                    if column in columns
+                ]
+                self.db.execute("ALTER TABLE spotlight ADD COLUMN blacklisted_role_ids TEXT NOT NULL DEFAULT '[]'")
+                if slot_columns:
+                    rows = self.db.execute(f"SELECT id, {', '.join(slot_columns)} FROM spotlight").fetchall()
+                    self.db.executemany(
+                        'UPDATE spotlight SET blacklisted_role_ids = ? WHERE id = ?',
+                        [(json.dumps([role_id or 0 for role_id in slots]), config_id) for config_id, *slots in rows]
+                    )
+                logger.info("Moved blacklisted roles into the blacklisted_role_ids column")
+            
+            # The UNIQUE index already serves lookups by guild_id alone, this one serves the target role checks
+            self.db.execute('CREATE INDEX IF NOT EXISTS idx_spotlight_guild_target ON spotlight(guild_id, target_role_id)')
+    
+    def _fetch_rotation_rows(self, guild_ids=()) -> List[tuple]:
+        """Read the rotation rows of the given guilds, or of every guild when none are given."""
+        if not guild_ids:
+            return self.db.execute(self._SQL_ROTATION_CONFIGS).fetchall()
+        placeholders = ",".join("?" * len(guild_ids))
+        return self.db.execute(
+            f'{self._SQL_ROTATION_CONFIGS} AND guild_id IN ({placeholders})', tuple(guild_ids)
+        ).fetchall()
+    
+    async def _refresh_rotation_rows(self):
+        """Re-read the configurations of guilds whose cache entry was deleted since the last rotation."""
+        stale = self.cache.take_stale_guilds()
+        if stale:
+            self.cache.load_rotation_rows(await self.bot.run_db(self._fetch_rotation_rows, stale), stale)
+    
+    def _fetch_max_configs(self, guild_id: int) -> int:
+        result = self.db.execute(self._SQL_GET_MAX, (guild_id,)).fetchone()
+        return result[0] if result else 1  # Default to 1 if not set
+
+    def _store_max_configs(self, guild_id: int, max_configs: int):
+        with self.db:
+            self.db.execute(self._SQL_SET_MAX, (guild_id, max_configs))
+
+    def _fetch_configs(self, guild_id: int) -> List[tuple]:
+        return self.db.execute(self._SQL_GET_CONFIGS, (guild_id,)).fetchall()
+
+    def _edit_blacklist(self, config_id: int, guild_id: int, option: int,
+                        role_id: Optional[int], slot: Optional[int]) -> str:
+        """Read, check and rewrite a configuration's blacklist slots, all in one call so nothing runs in between.
+
+        Returns 'updated' after a write, 'missing' when the configuration does not exist,
+        'not_in_slot' when removing a role the slot does not hold and 'duplicate' when adding a role
+        that is already blacklisted.
+        """
+        with self.db:
+            row = self.db.execute(self._SQL_GET_BLACKLIST, (config_id, guild_id)).fetchone()
+            if not row:
+                return 'missing'
             
-        self.db.commit()
+            slots = _load_blacklist(row[0])
+            if option == 0:
+                slots = [0] * BLACKLIST_SLOTS
+            elif option == 2:
+                if slots[slot - 1] != role_id:
+                    return 'not_in_slot'
+                slots[slot - 1] = 0
+            else:
+                if role_id in slots:
+                    return 'duplicate'
+                slots[slot - 1] = role_id
+            
+            self.db.execute(self._SQL_SET_BLACKLIST, (json.dumps(slots), config_id))
+            return 'updated'
+    
+    def _fetch_edit_config(self, config_id: int, guild_id: int, new_target_id: Optional[int]) -> Optional[tuple]:
+        """Load a configuration plus whether another one of the guild already targets new_target_id."""
+        return self.db.execute(
+            'SELECT id, initial_role_id, target_role_id, max_users, rotation_interval_hours, '
+            'remove_when_offline, prioritize_active, ignore_timed_out, always_replace_current, '
+            'EXISTS(SELECT 1 FROM spotlight other WHERE other.guild_id = spotlight.guild_id '
+            'AND other.target_role_id = ? AND other.id != spotlight.id) '
+            'FROM spotlight WHERE id = ? AND guild_id = ?',
+            (new_target_id, config_id, guild_id)
+        ).fetchone()
+
+    def _save_config(self, guild_id: int, initial_role_id: int, target_role_id: int, settings: tuple,
+                     max_configs: int, allow_update: bool) -> Tuple[Optional[str], Optional[int]]:
+        """Check a configuration against the guild's others and write it, all in one call so nothing runs in between.
+
+        Returns (action, existing_initial_id), action is 'updated' or 'configured' after a write,
+        'conflict' when another initial role already targets the role and 'limit' when the guild is full.
+        """
+        with self.db:
+            # One query answers both checks: which initial role already targets this role (if any),
+            # and how many configurations the guild has
+            count, existing_initial_id = self.db.execute(
+                'SELECT COUNT(*), MAX(CASE WHEN target_role_id = ? THEN initial_role_id END) '
+                'FROM spotlight WHERE guild_id = ?',
+                (target_role_id, guild_id)
+            ).fetchone()
+
+            # Check if this target role is already being used in any other config
+            if existing_initial_id is not None and (existing_initial_id != initial_role_id or not allow_update):
+                return 'conflict', existing_initial_id
+
+            # Check if we've reached the maximum configurations for this guild, only a new configuration counts
+            if existing_initial_id is None and count >= max_configs:
+                return 'limit', None
+
+            if existing_initial_id is not None:
+                # Update existing configuration (the same initial and target roles, as checked above)
+                self.db.execute('''
+                    UPDATE spotlight 
+                    SET max_users = ?, rotation_interval_hours = ?, remove_when_offline = ?, prioritize_active = ?, ignore_timed_out = ?, always_replace_current = ?
+                    WHERE guild_id = ? AND initial_role_id = ? AND target_role_id = ?
+                ''', (*settings, guild_id, initial_role_id, target_role_id))
+                return 'updated', existing_initial_id
+
+            # Insert new configuration, last_rotation is set on the first rotation
+            max_users, rotation_interval, *flags = settings
+            self.db.execute('''
+                INSERT INTO spotlight 
+                (guild_id, initial_role_id, target_role_id, max_users, rotation_interval_hours, last_rotation, remove_when_offline, prioritize_active, ignore_timed_out, always_replace_current)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', (guild_id, initial_role_id, target_role_id, max_users, rotation_interval, None, *flags))
+            return 'configured', None
+
+    def _store_next_rotation(self, last_rotation: str, guild_id: int, config_id: Optional[int]) -> int:
+        """Set last_rotation for one of the guild's configs, or all of them when config_id is None."""
+        with self.db:
+            if config_id is not None:
+                return self.db.execute(
+                    'UPDATE spotlight SET last_rotation = ? WHERE id = ? AND guild_id = ?',
+                    (last_rotation, config_id, guild_id)
+                ).rowcount
+            return self.db.execute(
+                'UPDATE spotlight SET last_rotation = ? WHERE guild_id = ?', (last_rotation, guild_id)
+            ).rowcount
+
+    def _fetch_presence_configs(self, guild_id: int) -> List[tuple]:
+        return self.db.execute(self._SQL_PRESENCE_CONFIGS, (guild_id,)).fetchall()
+
+    def _delete_role_configs(self, guild_id: int, role_id: int) -> List[tuple]:
+        """Delete the guild's configurations that use role_id, returning their (id, guild_id, initial_role_id, target_role_id)."""
+        with self.db:
+            rows = self.db.execute(
+                'SELECT id, guild_id, initial_role_id, target_role_id FROM spotlight '
+                'WHERE guild_id = ? AND (initial_role_id = ? OR target_role_id = ?)',
+                (guild_id, role_id, role_id)
+            ).fetchall()
+            if rows:
+                self.db.executemany('DELETE FROM spotlight WHERE id = ?', [(row[0],) for row in rows])
+        return rows
+
+    def _update_config(self, query: str, params: list, new_target_id: Optional[int] = None) -> Optional[int]:
+        """Apply an edit, returning the rowcount, or None if another config took new_target_id since it was checked."""
+        config_id, guild_id = params[-2:]
+        with self.db:
+            if new_target_id is not None and self.db.execute(
+                'SELECT 1 FROM spotlight WHERE guild_id = ? AND target_role_id = ? AND id != ?',
+                (guild_id, new_target_id, config_id)
+            ).fetchone():
+                return None
+            return self.db.execute(query, params).rowcount
+
+    def _store_rotations(self, rotations: List[Tuple[str, int]]):
+        """Set last_rotation for several configs with one statement and one commit."""
+        # Runs through bot.run_db like every other use of bot.db, so no other statement lands inside this transaction
+        with self.db:
+            self.db.executemany('UPDATE spotlight SET last_rotation = ? WHERE id = ?', rotations)
+
+    def _fetch_list_configs(self, guild_id: int) -> List[tuple]:
+        return self.db.execute('''
+            SELECT id, initial_role_id, target_role_id, max_users, rotation_interval_hours, last_rotation, remove_when_offline, prioritize_active, ignore_timed_out, always_replace_current, blacklisted_role_ids
+            FROM spotlight 
+            WHERE guild_id = ?
+        ''', (guild_id,)).fetchall()
+
+    def _delete_config(self, config_id: int, guild_id: int) -> Optional[tuple]:
+        """Delete a guild's configuration, returning its (id, initial_role_id, target_role_id) or None if missing."""
+        with self.db:
+            row = self.db.execute(
+                'SELECT id, initial_role_id, target_role_id FROM spotlight WHERE id = ? AND guild_id = ?',
+                (config_id, guild_id)
+            ).fetchone()
+            if row:
+                self.db.execute('DELETE FROM spotlight WHERE id = ?', (config_id,))
+        return row
     
     async def get_guild_max_configs(self, guild_id: int) -> int:
         """Get the maximum number of spotlight configurations allowed for a guild"""
-        cursor = self.db.cursor()
-        cursor.execute(
-            'SELECT max_configs FROM spotlight_guild_settings WHERE guild_id = ?',
-            (guild_id,)
-        )
-        result = cursor.fetchone()
-        return result[0] if result else 1  # Default to 1 if not set
+        max_configs = self._max_configs_cache.get(guild_id)
+        if max_configs is None:
+            max_configs = self._max_configs_cache[guild_id] = await self.bot.run_db(self._fetch_max_configs, guild_id)
+        return max_configs
     
     async def set_guild_max_configs(self, guild_id: int, max_configs: int) -> None:
         """Set the maximum number of spotlight configurations for a guild"""
-        cursor = self.db.cursor()
-        cursor.execute(
-            'INSERT OR REPLACE INTO spotlight_guild_settings (guild_id, max_configs) VALUES (?, ?)',
-            (guild_id, max_configs)
-        )
-        self.db.commit()
+        await self.bot.run_db(self._store_max_configs, guild_id, max_configs)
+        self._max_configs_cache[guild_id] = max_configs
     
     async def get_configs(self, guild_id: int) -> List[SpotlightConfig]:
         """Get all spotlight configurations for a guild"""
-        cursor = self.db.cursor()
-        cursor.execute(
-            'SELECT id, initial_role_id, target_role_id, max_users, last_rotation, remove_when_offline '
-            'FROM spotlight WHERE guild_id = ?',
-            (guild_id,)
-        )
-        
         configs = []
-        for row in cursor.fetchall():
+        for row in await self.bot.run_db(self._fetch_configs, guild_id):
             config = SpotlightConfig(
                 guild_id=guild_id,
                 initial_role_id=row[1],
@@ -279,104 +527,61 @@ class Spotlight(commands.GroupCog, name="spotlight"):
             await interaction.response.send_message("❌ Maximum users must be at most 8.", ephemeral=True)
             return
         
-        if initial_role.position >= interaction.guild.me.top_role.position:
-            await interaction.response.send_message(
-                "❌ I can't manage the initial role because it's higher than my highest role.",
-                ephemeral=True
-            )
-            return
-            
-        if target_role.position >= interaction.guild.me.top_role.position:
-            await interaction.response.send_message(
-                "❌ I can't manage the target role because it's higher than my highest role.",
-                ephemeral=True
-            )
-            return
-        
         if initial_role.id == target_role.id:
             await interaction.response.send_message("❌ Initial role and target role must be different.", ephemeral=True)
             return
-            
-        # Initialize cursor for database operations
-        cursor = self.db.cursor()
-            
-        # Check if this target role is already being used in any other config
-        cursor.execute(
-            'SELECT initial_role_id FROM spotlight WHERE guild_id = ? AND target_role_id = ?',
-            (interaction.guild_id, target_role.id)
-        )
-        existing = cursor.fetchone()
-        if existing and (existing[0] != initial_role.id or not interaction.data.get('options')):
-            existing_initial_role = interaction.guild.get_role(existing[0])
-            role_mention = existing_initial_role.mention if existing_initial_role else f'Role ID: {existing[0]}'
+        
+        # Resolve the bot's top role once for both hierarchy checks
+        top_pos = interaction.guild.me.top_role.position
+        too_high = next((name for name, role in (("initial", initial_role), ("target", target_role)) if role.position >= top_pos), None)
+        if too_high:
             await interaction.response.send_message(
-                f"❌ {target_role.mention} is already being targeted by {role_mention}. "
-                "Each target role can only be assigned by one initial role.",
+                f"❌ I can't manage the {too_high} role because it's higher than my highest role.",
                 ephemeral=True
             )
             return
-        
-        # Check if this exact configuration already exists
-        cursor = self.db.cursor()
-        cursor.execute(
-            'SELECT id, remove_when_offline FROM spotlight WHERE guild_id = ? AND initial_role_id = ? AND target_role_id = ?',
-            (interaction.guild_id, initial_role.id, target_role.id)
-        )
-        
-        if cursor.fetchone():
-            # Update existing configuration
-            cursor.execute('''
-                UPDATE spotlight 
-                SET max_users = ?, rotation_interval_hours = ?, remove_when_offline = ?, prioritize_active = ?, ignore_timed_out = ?, always_replace_current = ?
-                WHERE guild_id = ? AND initial_role_id = ? AND target_role_id = ?
-            ''', (
-                max_users,
-                rotation_interval,
-                int(remove_when_offline),
-                int(prioritize_active),
-                int(ignore_timed_out),
-                int(always_replace_current),
-                interaction.guild_id,
-                initial_role.id,
-                target_role.id
-            ))
-            action = "updated"
-        else:
-            # Check if we've reached the maximum configurations for this guild
-            cursor.execute('SELECT COUNT(*) FROM spotlight WHERE guild_id = ?', (interaction.guild_id,))
-            count = cursor.fetchone()[0]
-            max_configs = await self.get_guild_max_configs(interaction.guild_id)
             
-            if count >= max_configs:
-                embed = discord.Embed(
-                    title="❌ Spotlight Configuration Limit Reached",
-                    description=f"You can only have up to {max_configs} spotlight configurations per server.\n"
-                                "Please remove an existing configuration before adding a new one or request a higher limit in the support server: https://discord.gg/exwPCtMEsD",
-                    color=discord.Color.red()
-                )
-                await interaction.response.send_message(embed=embed, ephemeral=True)
-                return
-                
-            # Insert new configuration
-            cursor.execute('''
-                INSERT INTO spotlight 
-                (guild_id, initial_role_id, target_role_id, max_users, rotation_interval_hours, last_rotation, remove_when_offline, prioritize_active, ignore_timed_out, always_replace_current)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                interaction.guild_id,
-                initial_role.id,
-                target_role.id,
+        max_configs = await self.get_guild_max_configs(interaction.guild_id)
+
+        # The checks and the write run together on the database thread
+        action, existing_initial_id = await self.bot.run_db(
+            self._save_config,
+            interaction.guild_id,
+            initial_role.id,
+            target_role.id,
+            (
                 max_users,
                 rotation_interval,
-                None,  # Will be set on first rotation
                 int(remove_when_offline),
                 int(prioritize_active),
                 int(ignore_timed_out),
                 int(always_replace_current),
-            ))
-            action = "configured"
-            
-        self.db.commit()
+            ),
+            max_configs,
+            bool(interaction.data.get('options'))
+        )
+
+        # Check if this target role is already being used in any other config
+        if action == 'conflict':
+            existing_initial_role = interaction.guild.get_role(existing_initial_id)
+            role_mention = existing_initial_role.mention if existing_initial_role else f'Role ID: {existing_initial_id}'
+            await interaction.response.send_message(
+                f"❌ {target_role.mention} is already being targeted by {role_mention}. "
+                "Each target role can only be assigned by one initial role.",
+                ephemeral=True
+            )
+            return
+
+        # Check if we've reached the maximum configurations for this guild, only a new configuration counts
+        if action == 'limit':
+            embed = discord.Embed(
+                title="❌ Spotlight Configuration Limit Reached",
+                description=f"You can only have up to {max_configs} spotlight configurations per server.\n"
+                            "Please remove an existing configuration before adding a new one or request a higher limit in the support server: https://discord.gg/exwPCtMEsD",
+                color=discord.Color.red()
+            )
+            await interaction.response.send_message(embed=embed, ephemeral=True)
+            return
         
         # Invalidate cache for this guild
         await self.cache.delete(interaction.guild_id)
@@ -400,24 +605,32 @@ class Spotlight(commands.GroupCog, name="spotlight"):
         
     async def config_autocomplete(self, interaction: discord.Interaction, current: str) -> list[app_commands.Choice[str]]:
         """Autocomplete for spotlight configurations"""
-        configs = await self.get_configs(interaction.guild_id)
+        # Runs on every keystroke, so only the first one in a while reads the database
+        configs = self.cache.get_configs_list(interaction.guild_id)
+        if configs is None:
+            configs = await self.get_configs(interaction.guild_id)
+            self.cache.set_configs_list(interaction.guild_id, configs)
         if not configs:
             return []
             
         guild = interaction.guild
+        current = current.lower()
         choices = []
         
         for config in configs:
-            initial_role = guild.get_role(config.initial_role_id)
-            target_role = guild.get_role(config.target_role_id)
-            
-            if not all([initial_role, target_role]):
-                continue
+            # Labels are built once per cached list, a role rename drops the list
+            if config.label_lower is None:
+                initial_role = guild.get_role(config.initial_role_id)
+                target_role = guild.get_role(config.target_role_id)
                 
-            label = f"{initial_role.name} → {target_role.name}"
-            if current.lower() in label.lower():
+                if not all([initial_role, target_role]):
+                    continue
+                    
+                config.label = f"{initial_role.name} → {target_role.name}"
+                config.label_lower = config.label.lower()
+            if current in config.label_lower:
                 choices.append(app_commands.Choice(
-                    name=label,
+                    name=config.label,
                     value=str(config.id)
                 ))
         
@@ -457,135 +670,63 @@ class Spotlight(commands.GroupCog, name="spotlight"):
         
         try:
             # Get the config from database
-            cursor = self.db.cursor()
             try:
                 config_id = int(config)
             except ValueError:
-                cursor.close()
                 return await interaction.followup.send("❌ Invalid configuration ID. Please select a valid configuration.", ephemeral=True)
                 
-            cursor.execute(
-                """
-                SELECT id, guild_id, initial_role_id, target_role_id, 
-                       blacklisted_role_id, blacklisted_role_id_2, 
-                       blacklisted_role_id_3, blacklisted_role_id_4
-                FROM spotlight 
-                WHERE id = ? AND guild_id = ?
-                """,
-                (config_id, interaction.guild_id)
-            )
-            row = cursor.fetchone()
-            
-            if not row:
-                cursor.close()
-                return await interaction.followup.send("❌ Configuration not found.", ephemeral=True)
-                
-            config_id, guild_id, initial_role_id, target_role_id, \
-            blacklisted_role_id, blacklisted_role_id_2, \
-            blacklisted_role_id_3, blacklisted_role_id_4 = row
-            
             # Clear all blacklisted roles if option is 0 (Clear All)
             if option == 0:
-                try:
-                    # Instead of setting to NULL, we'll remove the entries by not including them in the UPDATE
-                    cursor.execute(
-                        """
-                        UPDATE spotlight 
-                        SET blacklisted_role_id = 0,
-                            blacklisted_role_id_2 = 0,
-                            blacklisted_role_id_3 = 0,
-                            blacklisted_role_id_4 = 0
-                        WHERE id = ?
-                        """,
-                        (config_id,)
-                    )
-                    self.db.commit()
-                    # Update cache
-                    await self.cache.delete(interaction.guild_id)
-                    cursor.close()
-                    return await interaction.followup.send("✅ Cleared all blacklisted roles.", ephemeral=True)
-                except Exception as e:
-                    cursor.close()
-                    logger.error(f"Error clearing blacklisted roles: {str(e)}")
-                    return await interaction.followup.send("❌ An error occurred while clearing blacklisted roles.", ephemeral=True)
+                success = "✅ Cleared all blacklisted roles."
+                failure = "❌ An error occurred while clearing blacklisted roles."
             
             # If removing a specific role
-            if option == 2:
+            elif option == 2:
                 if not role:
-                    cursor.close()
                     return await interaction.followup.send("❌ Please specify a role to remove from the blacklist.", ephemeral=True)
-                if not slot or slot < 1 or slot > 4:
-                    cursor.close()
+                if not slot or slot < 1 or slot > BLACKLIST_SLOTS:
                     return await interaction.followup.send("❌ Please specify a valid slot (1-4) when removing a blacklisted role.", ephemeral=True)
-                
-                # Check if the role is blacklisted in the specified slot
-                if (slot == 1 and blacklisted_role_id == role.id) or \
-                   (slot == 2 and blacklisted_role_id_2 == role.id) or \
-                   (slot == 3 and blacklisted_role_id_3 == role.id) or \
-                   (slot == 4 and blacklisted_role_id_4 == role.id):
-                    
-                    try:
-                        # Clear the specific slot by setting it to 0
-                        column_name = f"blacklisted_role_id{'_' + str(slot) if slot > 1 else ''}"
-                        update_query = f"""
-                        UPDATE spotlight 
-                        SET {column_name} = 0
-                        WHERE id = ?
-                        """
-                        cursor.execute(update_query, (config_id,))
-                        self.db.commit()
-                        # Update cache
-                        await self.cache.delete(interaction.guild_id)
-                        cursor.close()
-                        return await interaction.followup.send(f"✅ Removed <@&{role.id}> from blacklist slot {slot}.", ephemeral=True)
-                    except Exception as e:
-                        cursor.close()
-                        logger.error(f"Error removing blacklisted role: {str(e)}")
-                        return await interaction.followup.send("❌ An error occurred while removing the blacklisted role.", ephemeral=True)
-                else:
-                    cursor.close()
-                    return await interaction.followup.send(f"❌ Role <@&{role.id}> is not in blacklist slot {slot}.", ephemeral=True)
+                success = f"✅ Removed <@&{role.id}> from blacklist slot {slot}."
+                failure = "❌ An error occurred while removing the blacklisted role."
             
             # If adding a role
             elif option == 1:
                 if not role:
-                    cursor.close()
                     return await interaction.followup.send("❌ Please specify a role to add to the blacklist.", ephemeral=True)
-                if not slot or slot < 1 or slot > 4:
-                    cursor.close()
+                if not slot or slot < 1 or slot > BLACKLIST_SLOTS:
                     return await interaction.followup.send("❌ Please specify a valid slot (1-4) when adding a blacklisted role.", ephemeral=True)
-                
-                # Check if role is already blacklisted in any slot
-                if role.id in [blacklisted_role_id, blacklisted_role_id_2, blacklisted_role_id_3, blacklisted_role_id_4]:
-                    cursor.close()
-                    return await interaction.followup.send(f"❌ Role <@&{role.id}> is already blacklisted.", ephemeral=True)
-                
-                try:
-                    # Add role to the specified slot using a parameterized query
-                    column_name = f"blacklisted_role_id{'_' + str(slot) if slot > 1 else ''}"
-                    update_query = f"""
-                    UPDATE spotlight 
-                    SET {column_name} = ?
-                    WHERE id = ?
-                    """
-                    cursor.execute(update_query, (role.id, config_id))
-                    self.db.commit()
-                    # Update cache
-                    await self.cache.delete(interaction.guild_id)
-                    cursor.close()
-                    return await interaction.followup.send(f"✅ Added <@&{role.id}> to blacklist slot {slot}.", ephemeral=True)
-                except Exception as e:
-                    cursor.close()
-                    logger.error(f"Error adding blacklisted role: {str(e)}")
-                    return await interaction.followup.send("❌ An error occurred while adding the blacklisted role.", ephemeral=True)
+                success = f"✅ Added <@&{role.id}> to blacklist slot {slot}."
+                failure = "❌ An error occurred while adding the blacklisted role."
             
             else:
-                cursor.close()
                 return await interaction.followup.send("❌ Invalid option selected.", ephemeral=True)
+            
+            try:
+                # The slot checks run in the same transaction as the write, so concurrent edits cannot overwrite each other
+                status = await self.bot.run_db(
+                    self._edit_blacklist,
+                    config_id,
+                    interaction.guild_id,
+                    option,
+                    role.id if role else None,
+                    slot
+                )
+            except Exception as e:
+                logger.error(f"Error updating blacklisted roles: {str(e)}")
+                return await interaction.followup.send(failure, ephemeral=True)
+            
+            if status == 'missing':
+                return await interaction.followup.send("❌ Configuration not found.", ephemeral=True)
+            if status == 'not_in_slot':
+                return await interaction.followup.send(f"❌ Role <@&{role.id}> is not in blacklist slot {slot}.", ephemeral=True)
+            if status == 'duplicate':
+                return await interaction.followup.send(f"❌ Role <@&{role.id}> is already blacklisted.", ephemeral=True)
+            
+            # Update cache
+            await self.cache.delete(interaction.guild_id)
+            return await interaction.followup.send(success, ephemeral=True)
                 
         except Exception as e:
-            if 'cursor' in locals() and cursor:
-                cursor.close()
             logger.error(f"Error in blacklist_role: {str(e)}")
             await interaction.followup.send("❌ An error occurred while updating the blacklist.", ephemeral=True)
     
@@ -639,20 +780,16 @@ class Spotlight(commands.GroupCog, name="spotlight"):
         await interaction.response.defer(ephemeral=True)
         
         # Get the existing configuration
-        cursor = self.db.cursor()
         try:
             config_id = int(config)
         except ValueError:
             await interaction.followup.send("❌ Invalid configuration ID. Please select a valid configuration.", ephemeral=True)
             return
             
-        cursor.execute(
-            'SELECT id, initial_role_id, target_role_id, max_users, rotation_interval_hours, '
-            'remove_when_offline, prioritize_active, ignore_timed_out, always_replace_current '
-            'FROM spotlight WHERE id = ? AND guild_id = ?',
-            (config_id, interaction.guild_id)
+        # The target conflict check rides along, a NULL target (none given) never conflicts
+        existing = await self.bot.run_db(
+            self._fetch_edit_config, config_id, interaction.guild_id, target_role.id if target_role else None
         )
-        existing = cursor.fetchone()
         
         if not existing:
             await interaction.followup.send("❌ Could not find the specified configuration.", ephemeral=True)
@@ -660,7 +797,7 @@ class Spotlight(commands.GroupCog, name="spotlight"):
             
         # Unpack the existing values
         (config_id, old_initial_id, old_target_id, old_max_users, old_interval,
-         old_remove_offline, old_prioritize, old_ignore_timeout, old_always_replace) = existing
+         old_remove_offline, old_prioritize, old_ignore_timeout, old_always_replace, target_in_use) = existing
         
         # Use existing values if no new value is provided
         if initial_role is None:
@@ -689,31 +826,23 @@ class Spotlight(commands.GroupCog, name="spotlight"):
             await interaction.followup.send("❌ Maximum users must be at most 8.", ephemeral=True)
             return
         
-        if initial_role.position >= interaction.guild.me.top_role.position:
-            await interaction.followup.send(
-                "❌ I can't manage the initial role because it's higher than my highest role.",
-                ephemeral=True
-            )
+        if initial_role.id == target_role.id:
+            await interaction.followup.send("❌ Initial role and target role must be different.", ephemeral=True)
             return
-            
-        if target_role.position >= interaction.guild.me.top_role.position:
+        
+        # Resolve the bot's top role once for both hierarchy checks
+        top_pos = interaction.guild.me.top_role.position
+        too_high = next((name for name, role in (("initial", initial_role), ("target", target_role)) if role.position >= top_pos), None)
+        if too_high:
             await interaction.followup.send(
-                "❌ I can't manage the target role because it's higher than my highest role.",
+                f"❌ I can't manage the {too_high} role because it's higher than my highest role.",
                 ephemeral=True
             )
             return
         
-        if initial_role.id == target_role.id:
-            await interaction.followup.send("❌ Initial role and target role must be different.", ephemeral=True)
-            return
-        
         # Check if the new target role is already used in another config
         if target_role.id != old_target_id:
-            cursor.execute(
-                'SELECT id FROM spotlight WHERE guild_id = ? AND target_role_id = ? AND id != ?',
-                (interaction.guild_id, target_role.id, config_id)
-            )
-            if cursor.fetchone():
+            if target_in_use:
                 await interaction.followup.send(
                     f"❌ {target_role.mention} is already being used as a target role in another configuration.",
                     ephemeral=True
@@ -724,56 +853,75 @@ class Spotlight(commands.GroupCog, name="spotlight"):
         update_fields = []
         params = []
         
-        # Add fields to update if they were provided
-        if initial_role is not None:
+        # Add fields to update if they differ from what is stored
+        if initial_role is not None and initial_role.id != old_initial_id:
             update_fields.append("initial_role_id = ?")
             params.append(initial_role.id)
             
-        if target_role is not None:
+        if target_role is not None and target_role.id != old_target_id:
             update_fields.append("target_role_id = ?")
             params.append(target_role.id)
             
-        if max_users is not None:
+        if max_users is not None and max_users != old_max_users:
             update_fields.append("max_users = ?")
             params.append(max_users)
             
-        if rotation_interval is not None:
+        if rotation_interval is not None and rotation_interval != old_interval:
             update_fields.append("rotation_interval_hours = ?")
             params.append(rotation_interval)
             
-        if remove_when_offline is not None:
+        if remove_when_offline is not None and int(remove_when_offline) != old_remove_offline:
             update_fields.append("remove_when_offline = ?")
             params.append(int(remove_when_offline))
             
-        if prioritize_active is not None:
+        if prioritize_active is not None and int(prioritize_active) != old_prioritize:
             update_fields.append("prioritize_active = ?")
             params.append(int(prioritize_active))
             
-        if ignore_timed_out is not None:
+        if ignore_timed_out is not None and int(ignore_timed_out) != old_ignore_timeout:
             update_fields.append("ignore_timed_out = ?")
             params.append(int(ignore_timed_out))
             
-        if always_replace_current is not None:
+        if always_replace_current is not None and int(always_replace_current) != old_always_replace:
             update_fields.append("always_replace_current = ?")
             params.append(int(always_replace_current))
         
-        # If no fields to update, return early
+        # If nothing actually changes, skip the write and keep the cache
         if not update_fields:
-            await interaction.followup.send("❌ No changes provided.", ephemeral=True)
+            await interaction.followup.send("ℹ️ No changes to apply, the configuration already has these values.", ephemeral=True)
             return
         
         # Add the WHERE clause parameters
         params.extend([config_id, interaction.guild_id])
         
-        # Build and execute the update query
-        update_query = f"""
+        # Build and execute the update query, each combination of fields is only built once
+        update_key = tuple(update_fields)
+        update_query = self._edit_sql_cache.get(update_key)
+        if update_query is None:
+            update_query = self._edit_sql_cache[update_key] = f"""
             UPDATE spotlight 
             SET {', '.join(update_fields)}
             WHERE id = ? AND guild_id = ?
         """
         
-        cursor.execute(update_query, params)
-        self.db.commit()
+        # Other commands can write between the read above and this call, so the target check is repeated with the write
+        updated = await self.bot.run_db(
+            self._update_config,
+            update_query,
+            params,
+            target_role.id if target_role.id != old_target_id else None
+        )
+        
+        if updated is None:
+            await interaction.followup.send(
+                f"❌ {target_role.mention} is already being used as a target role in another configuration.",
+                ephemeral=True
+            )
+            return
+        
+        if not updated:
+            await interaction.followup.send("❌ Could not find the specified configuration.", ephemeral=True)
+            return
         
         # Invalidate cache for this guild
         await self.cache.delete(interaction.guild_id)
@@ -852,7 +1000,10 @@ class Spotlight(commands.GroupCog, name="spotlight"):
         
         success_count = 0
         guild = interaction.guild
-        cursor = self.db.cursor()
+        offline_status = discord.Status.offline
+        streaming_type = discord.ActivityType.streaming
+        # (last_rotation, config_id) pairs, written together once every config is handled
+        pending_rotations = []
         
         for config in configs:
             try:
@@ -864,7 +1015,7 @@ class Spotlight(commands.GroupCog, name="spotlight"):
                     continue
                 
                 # Get all members with the initial role and group by status
-                members_with_initial = [m for m in guild.members if initial_role in m.roles]
+                members_with_initial = initial_role.members
                 
                 if not members_with_initial:
                     logger.info(f"No members with initial role {initial_role.name} for config {config.id}")
@@ -876,23 +1027,21 @@ class Spotlight(commands.GroupCog, name="spotlight"):
                     'offline': []
                 }
                 
+                active_group = status_groups['active']
+                offline_group = status_groups['offline']
                 for member in members_with_initial:
-                    # Check if user is streaming (purple status)
-                    is_streaming = any(
-                        activity.type == discord.ActivityType.streaming 
-                        for activity in member.activities 
-                        if hasattr(activity, 'type')
-                    )
-                    
                     # All non-offline statuses go into the active group
-                    if is_streaming or member.status != discord.Status.offline:
-                        status_groups['active'].append(member)
+                    if member.status is not offline_status:
+                        active_group.append(member)
+                        continue
+                    
+                    # Offline members still count as active while streaming (purple status)
+                    for activity in member.activities:
+                        if activity.type is streaming_type:
+                            active_group.append(member)
+                            break
                     else:
-                        status_groups['offline'].append(member)
-                
-                # Shuffle each status group to ensure randomness within groups
-                for status in status_groups:
-                    random.shuffle(status_groups[status])
+                        offline_group.append(member)
                 
                 # Select members in priority order (active first, then offline)
                 selected_members = []
@@ -903,33 +1052,28 @@ class Spotlight(commands.GroupCog, name="spotlight"):
                     if len(selected_members) >= config.max_users:
                         break
                         
-                    # Take as many as we can from this status group
+                    # Take as many as we can from this status group, picked at random without shuffling all of it
                     available = status_groups[status]
                     remaining_slots = config.max_users - len(selected_members)
-                    selected_members.extend(available[:remaining_slots])
+                    selected_members.extend(random.sample(available, min(remaining_slots, len(available))))
                 
-                # Get current spotlight members for this specific configuration
-                current_spotlight = [m for m in guild.members 
-                                  if target_role in m.roles 
-                                  and initial_role in m.roles]
-
-                # Queue role removals for all current spotlight members
-                for member in current_spotlight:
-                    # Only remove if they're not in the new selection
-                    if member not in selected_members:
-                        await self.queue_role_operation(member, target_role, False)
+                # Get current spotlight members for this specific configuration, starting from the small target role
+                current_spotlight = [m for m in target_role.members if initial_role in m.roles]
+
+                # Membership checks below go through ids instead of scanning the lists
+                selected_ids = {m.id for m in selected_members}
+                current_ids = {m.id for m in current_spotlight}
                 
-                # Queue role additions for new spotlight members
-                for member in selected_members:
-                    if member not in current_spotlight:
-                        await self.queue_role_operation(member, target_role, True)
+                # Queue role removals for current spotlight members not in the new selection,
+                # then additions for new spotlight members, all in one call
+                await self.queue_role_operations(
+                    [(member, target_role, False) for member in current_spotlight if member.id not in selected_ids]
+                    + [(member, target_role, True) for member in selected_members if member.id not in current_ids]
+                )
                 
                 # Update last rotation time for this config
                 now = datetime.now(timezone.utc)
-                cursor.execute(
-                    'UPDATE spotlight SET last_rotation = ? WHERE id = ?',
-                    (now.isoformat(), config.id)
-                )
+                pending_rotations.append((now.isoformat(), config.id))
                 
                 success_count += 1
                 
@@ -943,7 +1087,7 @@ class Spotlight(commands.GroupCog, name="spotlight"):
         
         try:
             # Commit all database changes at once
-            self.db.commit()
+            await self.bot.run_db(self._store_rotations, pending_rotations)
             
             # Invalidate cache for this guild
             await self.cache.delete(interaction.guild_id)
@@ -975,15 +1119,8 @@ class Spotlight(commands.GroupCog, name="spotlight"):
         await interaction.response.defer(ephemeral=True)
         
         # Get configs with rotation_interval_hours and remove_when_offline
-        cursor = self.db.cursor()
-        cursor.execute('''
-            SELECT id, initial_role_id, target_role_id, max_users, rotation_interval_hours, last_rotation, remove_when_offline, prioritize_active, ignore_timed_out, blacklisted_role_id, always_replace_current, blacklisted_role_id_2, blacklisted_role_id_3, blacklisted_role_id_4
-            FROM spotlight 
-            WHERE guild_id = ?
-        ''', (interaction.guild_id,))
-        
         configs = []
-        for row in cursor.fetchall():
+        for row in await self.bot.run_db(self._fetch_list_configs, interaction.guild_id):
             config = SpotlightConfig(
                 guild_id=interaction.guild_id,
                 initial_role_id=row[1],
@@ -994,13 +1131,10 @@ class Spotlight(commands.GroupCog, name="spotlight"):
                 remove_when_offline=row[6],
                 prioritize_active=row[7],
                 ignore_timed_out=row[8],
-                blacklisted_role_id=row[9],
-                always_replace_current=row[10],
-                blacklisted_role_id_2=row[11],
-                blacklisted_role_id_3=row[12],
-                blacklisted_role_id_4=row[13]
+                always_replace_current=row[9],
+                blacklisted_role_ids=_load_blacklist(row[10]),
+                rotation_interval_hours=row[4] or 1  # Default to 1 if None
             )
-            config.rotation_interval_hours = row[4] or 1  # Default to 1 if None
             configs.append(config)
         
         if not configs:
@@ -1018,6 +1152,7 @@ class Spotlight(commands.GroupCog, name="spotlight"):
         )
         embed.set_footer(text=f"Configurations: {current_configs}/{max_configs}")
         
+        # One clock reading for every configuration, aware datetimes compare correctly across zones
         current_time = datetime.now(timezone.utc)
         
         for i, config in enumerate(configs, 1):
@@ -1027,17 +1162,12 @@ class Spotlight(commands.GroupCog, name="spotlight"):
             initial_role_name = initial_role.mention if initial_role else f"<@&{config.initial_role_id}> (Deleted)"
             target_role_name = target_role.mention if target_role else f"<@&{config.target_role_id}> (Deleted)"
             
-            blacklisted_role = interaction.guild.get_role(config.blacklisted_role_id)
-            blacklisted_role_name = blacklisted_role.mention if blacklisted_role else f"<@&{config.blacklisted_role_id}> (Deleted)"
-
-            blacklisted_role_2 = interaction.guild.get_role(config.blacklisted_role_id_2)
-            blacklisted_role_2_name = blacklisted_role_2.mention if blacklisted_role_2 else f"<@&{config.blacklisted_role_id_2}> (Deleted)"
-
-            blacklisted_role_3 = interaction.guild.get_role(config.blacklisted_role_id_3)
-            blacklisted_role_3_name = blacklisted_role_3.mention if blacklisted_role_3 else f"<@&{config.blacklisted_role_id_3}> (Deleted)"
-
-            blacklisted_role_4 = interaction.guild.get_role(config.blacklisted_role_id_4)
-            blacklisted_role_4_name = blacklisted_role_4.mention if blacklisted_role_4 else f"<@&{config.blacklisted_role_id_4}> (Deleted)"
+            # Only slots holding a role that still exists are listed
+            blacklisted_lines = "".join(
+                f"• **Blacklisted Role {slot}:** {blacklisted_role.mention}\n"
+                for slot, blacklisted_role in enumerate(map(interaction.guild.get_role, config.blacklisted_role_ids), 1)
+                if blacklisted_role
+            )
             
             # Format rotation interval
             rotation_interval = config.rotation_interval_hours or 1
@@ -1051,11 +1181,9 @@ class Spotlight(commands.GroupCog, name="spotlight"):
                 if isinstance(last_rotation_dt, str):
                     last_rotation_dt = datetime.fromisoformat(last_rotation_dt)
                 
-                est = pytz.timezone('US/Eastern')
-                last_rotation_dt = last_rotation_dt.astimezone(est)
+                last_rotation_dt = last_rotation_dt.astimezone(EASTERN)
                 
-                current_time_est = datetime.now(est)
-                if last_rotation_dt > current_time_est:
+                if last_rotation_dt > current_time:
                     next_rotation_dt = last_rotation_dt
                     last_rotation = "*Not rotated yet*"
                     next_rotation = f"🟢 <t:{int(next_rotation_dt.timestamp())}:R>"
@@ -1068,7 +1196,7 @@ class Spotlight(commands.GroupCog, name="spotlight"):
                         next_rotation_dt = last_rotation_dt + timedelta(hours=rotation_interval)
                     
                     next_rotation = f"<t:{int(next_rotation_dt.timestamp())}:R>"
-                    if next_rotation_dt < current_time_est:
+                    if next_rotation_dt < current_time:
                         next_rotation = f"🔴 {next_rotation} (Overdue!)"
                     else:
                         next_rotation = f"🟢 {next_rotation}"
@@ -1088,10 +1216,7 @@ class Spotlight(commands.GroupCog, name="spotlight"):
                     + (f"• **Prioritize Active:** `True`\n" if config.prioritize_active else '')
                     + (f"• **Ignore Timed Out:** `True`\n" if config.ignore_timed_out else '')
                     + (f"• **Always Replace Current:** `True`\n" if config.always_replace_current else '')
-                    + (f"• **Blacklisted Role 1:** {blacklisted_role_name}\n" if blacklisted_role else '')
-                    + (f"• **Blacklisted Role 2:** {blacklisted_role_2_name}\n" if blacklisted_role_2 else '')
-                    + (f"• **Blacklisted Role 3:** {blacklisted_role_3_name}\n" if blacklisted_role_3 else '')
-                    + (f"• **Blacklisted Role 4:** {blacklisted_role_4_name}\n" if blacklisted_role_4 else '')
+                    + blacklisted_lines
                 ),
                 inline=False
             )
@@ -1121,14 +1246,8 @@ class Spotlight(commands.GroupCog, name="spotlight"):
             )
             return
 
-        # Check if the config exists and belongs to this guild
-        cursor = self.db.cursor()
-        cursor.execute(
-            'SELECT id, initial_role_id, target_role_id FROM spotlight WHERE id = ? AND guild_id = ?',
-            (config_id, interaction.guild_id)
-        )
-        
-        config_data = cursor.fetchone()
+        # Delete the configuration if it exists and belongs to this guild
+        config_data = await self.bot.run_db(self._delete_config, config_id, interaction.guild_id)
         if not config_data:
             await interaction.response.send_message(
                 "❌ Configuration not found or you don't have permission to remove it.",
@@ -1140,15 +1259,11 @@ class Spotlight(commands.GroupCog, name="spotlight"):
         initial_role = interaction.guild.get_role(config_data[1])
         target_role = interaction.guild.get_role(config_data[2])
         
-        # Delete the configuration
-        cursor.execute('DELETE FROM spotlight WHERE id = ?', (config_id,))
-        self.db.commit()
         await self.cache.delete(interaction.guild_id)
         
         # Queue role removal for all members with the target role
         if target_role:
-            for member in target_role.members:
-                await self.queue_role_operation(member, target_role, False)
+            await self.queue_role_operations([(member, target_role, False) for member in target_role.members])
         
         # Prepare response message
         initial_role_mention = initial_role.mention if initial_role else f"<@&{config_data[1]}> (Deleted)"
@@ -1190,54 +1305,36 @@ class Spotlight(commands.GroupCog, name="spotlight"):
         """
         try:
             # Set the timezone to EST
-            est = pytz.timezone('US/Eastern')
+            est = EASTERN
             
-            # First try to parse with dateutil.parser for maximum flexibility
+            # First try to parse with dateutil.parser for maximum flexibility,
+            # its fuzzy parse is slow pure Python so it runs in a worker thread
             try:
-                from dateutil import parser
-                dt = parser.parse(time, fuzzy=True)
+                if _dateparser is None:
+                    raise ImportError
+                dt = await asyncio.get_running_loop().run_in_executor(
+                    None, partial(_dateparser.parse, time, fuzzy=True)
+                )
                 time_obj = dt.time()
             except (ImportError, ValueError):
                 # Fallback to manual parsing if dateutil is not available
-                time_lower = time.lower().strip()
+                match = _TIME_RE.match(time)
+                if match is None:
+                    raise ValueError("Invalid time format")
                 
-                # Initialize default values
-                hours = 0
-                minutes = 0
+                hours = int(match[1])
+                minutes = int(match[2]) if match[2] else 0
                 
-                # Check for AM/PM
-                if 'am' in time_lower or 'pm' in time_lower:
-                    # Extract period and clean time part
-                    if 'am' in time_lower:
-                        period = 'am'
-                        time_part = time_lower.replace('am', '').strip()
-                    else:
-                        period = 'pm'
-                        time_part = time_lower.replace('pm', '').strip()
-                    
-                    # Parse hours and minutes
-                    if ':' in time_part:
-                        hours, minutes = map(int, time_part.split(':'))
-                    else:
-                        hours = int(time_part)
-                    
-                    # Convert to 24-hour format
-                    if period == 'pm' and hours < 12:
-                        hours += 12
-                    elif period == 'am' and hours == 12:
-                        hours = 0
-                else:
-                    # Parse as 24-hour format
-                    if ':' in time:
-                        hours, minutes = map(int, time.split(':'))
-                    else:
-                        hours = int(time)
+                # Convert 12-hour times to 24-hour format
+                period = match[3]
+                if period and hours <= 12:
+                    hours = hours % 12 + _PERIOD_OFFSET[period.lower()]
                 
                 # Validate hours and minutes
                 if not (0 <= hours <= 23 and 0 <= minutes <= 59):
                     raise ValueError("Invalid time values")
                     
-                time_obj = datetime.strptime(f"{hours:02d}:{minutes:02d}", '%H:%M').time()
+                time_obj = dt_time(hours, minutes)
             
             # Parse date if provided
             if date is not None:
@@ -1265,7 +1362,7 @@ class Spotlight(commands.GroupCog, name="spotlight"):
                     
                     # Create datetime for the specified date and time in EST
                     naive_dt = datetime.combine(target_date, time_obj)
-                    next_rotation = est.localize(naive_dt)
+                    next_rotation = naive_dt.replace(tzinfo=est)
                     
                     # Allow past dates - they'll be treated as the next occurrence
                     pass
@@ -1284,7 +1381,7 @@ class Spotlight(commands.GroupCog, name="spotlight"):
                 # Create a datetime with today's date and the specified time in EST
                 target_date = now_est.date()
                 naive_dt = datetime.combine(target_date, time_obj)
-                next_rotation = est.localize(naive_dt)
+                next_rotation = naive_dt.replace(tzinfo=est)
                 
             # Convert to UTC for storage
             next_rotation_utc = next_rotation.astimezone(timezone.utc)
@@ -1296,34 +1393,18 @@ class Spotlight(commands.GroupCog, name="spotlight"):
             )
             return
             
-        # If we get here, time was parsed successfully
-        cursor = self.db.cursor()
-        
-        # Update the database
-        if config:
-            # Update a specific config
-            config_id = int(config.split(':')[0])
-            cursor.execute('''
-                UPDATE spotlight 
-                SET last_rotation = ? 
-                WHERE id = ? AND guild_id = ?
-            ''', (next_rotation_utc.isoformat(), config_id, interaction.guild_id))
-            
-            if cursor.rowcount == 0:
-                await interaction.response.send_message(
-                    "❌ Error: Could not find the specified configuration.",
-                    ephemeral=True
-                )
-                return
-        else:
-            # Update all configs for this guild
-            cursor.execute('''
-                UPDATE spotlight 
-                SET last_rotation = ? 
-                WHERE guild_id = ?
-            ''', (next_rotation_utc.isoformat(), interaction.guild_id))
+        # If we get here, time was parsed successfully, update a specific config or all configs for this guild
+        config_id = int(config.split(':')[0]) if config else None
+        updated = await self.bot.run_db(
+            self._store_next_rotation, next_rotation_utc.isoformat(), interaction.guild_id, config_id
+        )
         
-        self.db.commit()
+        if config and updated == 0:
+            await interaction.response.send_message(
+                "❌ Error: Could not find the specified configuration.",
+                ephemeral=True
+            )
+            return
         
         # Invalidate cache
         await self.cache.delete(interaction.guild_id)
@@ -1354,8 +1435,12 @@ class Spotlight(commands.GroupCog, name="spotlight"):
         
     async def queue_role_operation(self, member: discord.Member, role: discord.Role, add: bool):
         """Add a role operation to the queue"""
-        async with self.role_queue_lock:
-            self.role_queue.append(RoleOperation(member, role, add))
+        self.role_queue.put_nowait(RoleOperation(member, role, add))
+
+    async def queue_role_operations(self, operations: List[Tuple[discord.Member, discord.Role, bool]]):
+        """Add several (member, role, add) operations to the queue in order"""
+        for member, role, add in operations:
+            self.role_queue.put_nowait(RoleOperation(member, role, add))
 
     async def process_role_queue(self):
         """Process the role operation queue with rate limiting"""
@@ -1364,47 +1449,44 @@ class Spotlight(commands.GroupCog, name="spotlight"):
         while not self.bot.is_closed():
             try:
                 # Process one operation at a time with a small delay
-                operation = None
-                async with self.role_queue_lock:
-                    if self.role_queue:
-                        operation = self.role_queue.popleft()
-                
-                if operation:
-                    try:
-                        if operation.add:
-                            await operation.member.add_roles(
-                                operation.role, 
-                                reason="Spotlight rotation"
-                            )
-                        else:
-                            await operation.member.remove_roles(
-                                operation.role,
-                                reason="Spotlight rotation"
-                            )
-                        # Small delay between operations to avoid rate limits
-                        await asyncio.sleep(0.5)
-                    except discord.HTTPException as e:
-                        operation.attempts += 1
-                        operation.last_attempt = datetime.utcnow()
-                        
-                        if operation.attempts < 3:  # Retry up to 3 times
-                            logger.warning(
-                                f"Failed to update role for {operation.member} (attempt {operation.attempts}): {e}"
-                            )
-                            async with self.role_queue_lock:
-                                self.role_queue.appendleft(operation)
-                            # Longer delay after a failure
-                            await asyncio.sleep(5)
-                        else:
-                            logger.error(
-                                f"Failed to update role for {operation.member} after 3 attempts: {e}"
-                            )
-                    except Exception as e:
-                        logger.error(f"Unexpected error processing role operation: {e}")
-                        await asyncio.sleep(5)  # Prevent tight loop on unexpected errors
-                else:
-                    # No operations to process, sleep briefly
-                    await asyncio.sleep(1)
+                operation = await self.role_queue.get()
+                try:
+                    # A failed operation is retried right away so it keeps its place ahead of the rest
+                    while True:
+                        try:
+                            if operation.add:
+                                await operation.member.add_roles(
+                                    operation.role, 
+                                    reason="Spotlight rotation"
+                                )
+                            else:
+                                await operation.member.remove_roles(
+                                    operation.role,
+                                    reason="Spotlight rotation"
+                                )
+                            # Small delay between operations to avoid rate limits
+                            await asyncio.sleep(0.5)
+                            break
+                        except discord.HTTPException as e:
+                            operation.attempts += 1
+                            operation.last_attempt = datetime.now(timezone.utc)
+                            
+                            if operation.attempts < 3:  # Retry up to 3 times
+                                logger.warning(
+                                    f"Failed to update role for {operation.member} (attempt {operation.attempts}): {e}"
+                                )
+                                # Longer delay after a failure
+                                await asyncio.sleep(5)
+                            else:
+                                logger.error(
+                                    f"Failed to update role for {operation.member} after 3 attempts: {e}"
+                                )
+                                break
+                except Exception as e:
+                    logger.error(f"Unexpected error processing role operation: {e}")
+                    await asyncio.sleep(5)  # Prevent tight loop on unexpected errors
+                finally:
+                    self.role_queue.task_done()
 
             except Exception as e:
                 logger.error(f"Error in role queue processor: {e}", exc_info=True)
@@ -1413,31 +1495,16 @@ class Spotlight(commands.GroupCog, name="spotlight"):
     @tasks.loop(seconds=10, reconnect=True)  # Run every 10 seconds to check for configs to process
     async def rotate_spotlight(self):
         """Rotate spotlight users for configurations that are due for rotation"""
-        cursor = self.db.cursor()
         current_time = datetime.now(timezone.utc)
 
-        # Get all configs that need processing
-        cursor.execute('''
-                SELECT id, guild_id, initial_role_id, target_role_id, max_users,
-                    COALESCE(rotation_interval_hours, 1) as rotation_interval_hours,
-                    last_rotation,
-                    prioritize_active,
-                    ignore_timed_out,
-                    blacklisted_role_id,
-                    always_replace_current,
-                    blacklisted_role_id_2,
-                    blacklisted_role_id_3,
-                    blacklisted_role_id_4
-                FROM spotlight
-                WHERE guild_id IS NOT NULL
-            ''')
-
-        all_configs = cursor.fetchall()
+        # Get all configs that need processing, only guilds changed since the last tick are read again
+        await self._refresh_rotation_rows()
+        all_configs = self.cache.rotation_rows()
 
         # Only fetch configs that are due for rotation
         due_configs = []
         for row in all_configs:
-            config_id, guild_id, initial_role_id, target_role_id, max_users, interval, last_rotation, prioritize_active, ignore_timed_out, blacklisted_role_id, always_replace_current, blacklisted_role_id_2, blacklisted_role_id_3, blacklisted_role_id_4 = row
+            config_id, guild_id, initial_role_id, target_role_id, max_users, interval, last_rotation, prioritize_active, ignore_timed_out, always_replace_current, blacklisted_role_ids = row
 
             if last_rotation is None:
                 # Never rotated, needs rotation
@@ -1496,7 +1563,7 @@ class Spotlight(commands.GroupCog, name="spotlight"):
 
         # Process all due configs
         for row in due_configs:
-            config_id, guild_id, initial_role_id, target_role_id, max_users, rotation_interval, last_rotation, prioritize_active, ignore_timed_out, blacklisted_role_id, always_replace_current, blacklisted_role_id_2, blacklisted_role_id_3, blacklisted_role_id_4 = row
+            config_id, guild_id, initial_role_id, target_role_id, max_users, rotation_interval, last_rotation, prioritize_active, ignore_timed_out, always_replace_current, blacklisted_role_ids = row
 
             logger.info(f"[ROTATION] Processing config {config_id} (Guild: {guild_id})")
 
@@ -1518,26 +1585,21 @@ class Spotlight(commands.GroupCog, name="spotlight"):
                 if not guild:
                     logger.warning(f"[ROTATION] Guild {guild_id} not found for config {config_id} - removing configuration")
                     # Remove the configuration since the bot is no longer in this guild
-                    cursor.execute('DELETE FROM spotlight WHERE id = ?', (config_id,))
-                    self.db.commit()
+                    await self.bot.run_db(self._delete_config, config_id, guild_id)
+                    await self.cache.delete(guild_id)
                     logger.info(f"[ROTATION] Removed configuration {config_id} for guild {guild_id} (bot not in guild)")
                     continue
 
                 initial_role = guild.get_role(initial_role_id)
                 target_role = guild.get_role(target_role_id)
-                # Get all blacklisted roles
-                blacklisted_roles = []
-                for role_id in [blacklisted_role_id, blacklisted_role_id_2, blacklisted_role_id_3, blacklisted_role_id_4]:
-                    if role_id:
-                        role = guild.get_role(role_id)
-                        if role:
-                            blacklisted_roles.append(role)
+                # Get all blacklisted roles, as a set so each member is checked with one pass over their roles
+                blacklisted_roles = {role for role in map(guild.get_role, _load_blacklist(blacklisted_role_ids)) if role}
 
                 if not initial_role:
                     logger.error(f"[ROTATION] Initial role {initial_role_id} not found in guild {guild_id}")
                     # Remove the configuration since the initial role doesn't exist
-                    cursor.execute('DELETE FROM spotlight WHERE id = ?', (config_id,))
-                    self.db.commit()
+                    await self.bot.run_db(self._delete_config, config_id, guild_id)
+                    await self.cache.delete(guild_id)
                     logger.info(
                         f"[ROTATION] Removed configuration {config_id} for guild {guild_id} (initial role not found)")
                     continue
@@ -1545,8 +1607,8 @@ class Spotlight(commands.GroupCog, name="spotlight"):
                 if not target_role:
                     logger.error(f"[ROTATION] Target role {target_role_id} not found in guild {guild_id}")
                     # Remove the configuration since the target role doesn't exist
-                    cursor.execute('DELETE FROM spotlight WHERE id = ?', (config_id,))
-                    self.db.commit()
+                    await self.bot.run_db(self._delete_config, config_id, guild_id)
+                    await self.cache.delete(guild_id)
                     logger.info(
                         f"[ROTATION] Removed configuration {config_id} for guild {guild_id} (target role not found)")
                     continue
@@ -1566,7 +1628,7 @@ class Spotlight(commands.GroupCog, name="spotlight"):
                 for member in guild.members:
                     try:
                         if (initial_role in member.roles and 
-                            not any(role in member.roles for role in blacklisted_roles)):
+                            blacklisted_roles.isdisjoint(member.roles)):
                             all_eligible.append(member)
                     except Exception as e:
                         logger.warning(f"[ROTATION] Error processing member {member.id}: {e}")
@@ -1613,7 +1675,7 @@ class Spotlight(commands.GroupCog, name="spotlight"):
                         active_members = []
                         for member in all_eligible:
                             try:
-                                if not any(role in member.roles for role in blacklisted_roles):
+                                if blacklisted_roles.isdisjoint(member.roles):
                                     active_members.append(member)
                             except Exception as e:
                                 logger.warning(f"[ROTATION] Error checking member {member.id} blacklisted roles: {e}")
@@ -1624,7 +1686,7 @@ class Spotlight(commands.GroupCog, name="spotlight"):
                             try:
                                 is_timed_out = getattr(member, 'timed_out_until', None) is not None
                                 if (not is_timed_out and 
-                                    not any(role in member.roles for role in blacklisted_roles)):
+                                    blacklisted_roles.isdisjoint(member.roles)):
                                     active_members.append(member)
                             except Exception as e:
                                 logger.warning(f"[ROTATION] Error checking member {member.id} timeout/blacklist: {e}")
@@ -1811,11 +1873,8 @@ class Spotlight(commands.GroupCog, name="spotlight"):
                             # Make sure we don't set a future time (shouldn't happen, but just in case)
                             scheduled_rotation = min(scheduled_rotation, now)
 
-                    # Update last_rotation to the exact scheduled time
-                    cursor.execute(
-                        'UPDATE spotlight SET last_rotation = ? WHERE id = ?',
-                        (scheduled_rotation.isoformat(), config_id)
-                    )
+                    # Update last_rotation to the exact scheduled time, committed on the database thread
+                    await self.bot.run_db(self._store_rotations, [(scheduled_rotation.isoformat(), config_id)])
 
                     # Calculate and log when the next rotation will be
                     next_rotation_time = scheduled_rotation + timedelta(hours=rotation_interval)
@@ -1826,9 +1885,6 @@ class Spotlight(commands.GroupCog, name="spotlight"):
                         f"(in {rotation_interval} hours)"
                     )
 
-                    # Commit the transaction
-                    self.db.commit()
-
                     # Invalidate cache for this guild
                     await self.cache.delete(guild_id)
                 else:
@@ -1842,11 +1898,8 @@ class Spotlight(commands.GroupCog, name="spotlight"):
             except Exception as e:
                 # Log the full error with traceback
                 logger.error(f"Error in rotate_spotlight for config {config_id}: {e}", exc_info=True)
-                # Don't update last_rotation on error, so we'll retry next time
-                try:
-                    self.db.rollback()  # Rollback any partial changes
-                except Exception as rollback_error:
-                    logger.error(f"Error rolling back transaction: {rollback_error}")
+                # Don't update last_rotation on error, so we'll retry next time.
+                # Every write above commits in its own call, so there is nothing to roll back
 
                 # Log additional context about the error
                 logger.error(
@@ -1867,24 +1920,14 @@ class Spotlight(commands.GroupCog, name="spotlight"):
             
             
         # Get all spotlight configurations for this guild with all necessary fields
-        cursor = self.db.cursor()
-        cursor.execute(
-            '''SELECT id, initial_role_id, target_role_id, rotation_interval_hours, 
-                      remove_when_offline, ignore_timed_out, prioritize_active,
-                      blacklisted_role_id, blacklisted_role_id_2, 
-                      blacklisted_role_id_3, blacklisted_role_id_4
-               FROM spotlight 
-               WHERE guild_id = ?''',
-            (after.guild.id,)
-        )
+        rows = await self.bot.run_db(self._fetch_presence_configs, after.guild.id)
         
         # Find all target roles the member has
         member_target_roles = []
-        for row in cursor.fetchall():
+        for row in rows:
             (config_id, initial_role_id, target_role_id, rotation_interval, 
              remove_when_offline, ignore_timed_out, prioritize_active,
-             blacklisted_role_id, blacklisted_role_id_2, 
-             blacklisted_role_id_3, blacklisted_role_id_4) = row
+             blacklisted_role_ids) = row
             
             # Skip if remove_when_offline is False for this config
             if not remove_when_offline:
@@ -1895,13 +1938,9 @@ class Spotlight(commands.GroupCog, name="spotlight"):
                 initial_role = after.guild.get_role(initial_role_id)
                 if initial_role:
                     # Get all blacklisted roles for this config
-                    blacklisted_roles = []
-                    for role_id in [blacklisted_role_id, blacklisted_role_id_2, 
-                                  blacklisted_role_id_3, blacklisted_role_id_4]:
-                        if role_id:
-                            role = after.guild.get_role(role_id)
-                            if role:
-                                blacklisted_roles.append(role)
+                    blacklisted_roles = {
+                        role for role in map(after.guild.get_role, _load_blacklist(blacklisted_role_ids)) if role
+                    }
                     
                     member_target_roles.append((
                         initial_role, 
@@ -1918,7 +1957,7 @@ class Spotlight(commands.GroupCog, name="spotlight"):
                 initial_role, target_role, rotation_interval = config_data
                 ignore_timed_out = False
                 prioritize_active = False
-                blacklisted_roles = []
+                blacklisted_roles = set()
             else:
                 (initial_role, target_role, rotation_interval, 
                  ignore_timed_out, prioritize_active, blacklisted_roles) = config_data
@@ -1929,7 +1968,7 @@ class Spotlight(commands.GroupCog, name="spotlight"):
                               and initial_role in m.roles 
                               and target_role not in m.roles
                               and not m.bot  # Exclude bots
-                              and not any(role in m.roles for role in blacklisted_roles)]  # Exclude blacklisted roles
+                              and blacklisted_roles.isdisjoint(m.roles)]  # Exclude blacklisted roles
             
             # Initialize active_members for logging purposes
             active_members = []
@@ -1979,24 +2018,19 @@ class Spotlight(commands.GroupCog, name="spotlight"):
                     f"blacklisted_roles={[r.name for r in blacklisted_roles]})"
                 )
     
+    @commands.Cog.listener()
+    async def on_guild_role_update(self, before: discord.Role, after: discord.Role):
+        """Drop the guild's autocomplete labels when a role is renamed."""
+        if before.name != after.name:
+            self.cache.forget_configs_list(after.guild.id)
+
     @commands.Cog.listener()
     async def on_guild_role_delete(self, role: discord.Role):
         """Handle role deletion to remove affected configurations"""
-        cursor = self.db.cursor()
-        
-        # Find all configurations that use the deleted role
-        cursor.execute(
-            'SELECT id, guild_id, initial_role_id, target_role_id FROM spotlight '
-            'WHERE guild_id = ? AND (initial_role_id = ? OR target_role_id = ?)',
-            (role.guild.id, role.id, role.id)
-        )
-        
-        affected_configs = cursor.fetchall()
+        # Find and delete all configurations that use the deleted role
+        affected_configs = await self.bot.run_db(self._delete_role_configs, role.guild.id, role.id)
         
         for config_id, guild_id, initial_role_id, target_role_id in affected_configs:
-            # Delete the affected configuration
-            cursor.execute('DELETE FROM spotlight WHERE id = ?', (config_id,))
-            
             # Invalidate cache for this guild
             await self.cache.delete(guild_id)
             
@@ -2017,8 +2051,12 @@ class Spotlight(commands.GroupCog, name="spotlight"):
                         )
                     except Exception as e:
                         logger.error(f"Failed to send role deletion notification in {guild_id}: {e}")
-        
-        self.db.commit()
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild):
+        """Forget the guild's cached limit and configs, its rows are cleaned up by the bot."""
+        self._max_configs_cache.pop(guild.id, None)
+        await self.cache.delete(guild.id)
 
 class SpotlightCommands(commands.Cog):
     def __init__(self, bot, spotlight_instance):
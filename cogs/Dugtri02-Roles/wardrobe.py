@@ -13,7 +13,9 @@ class Wardrobe_cog(commands.Cog):
         # Cache structure: {guild_id: {'data': role_data, 'expires': timestamp}}
         self._cache = {}
         self._cache_timeout = 3600  # 1 hour in seconds
-        self._create_tables()
+    
+    async def cog_load(self):
+        await self.bot.run_db(self._create_tables)
     
     def _get_cache_key(self, guild_id: int) -> str:
         """Generate a consistent cache key for a guild."""
@@ -39,22 +41,14 @@ class Wardrobe_cog(commands.Cog):
                 return cache_entry['data']
         
         # Fetch from database if not in cache or expired
-        with self.db:
-            cursor = self.db.cursor()
-            cursor.execute('''
-                SELECT role_id, can_name, can_colour, can_icon
-                FROM wardrobe_roles
-                WHERE guild_id = ?
-            ''', (guild_id,))
-            
-            roles = {}
-            for row in cursor.fetchall():
-                role_id, can_name, can_colour, can_icon = row
-                roles[role_id] = {
-                    'can_name': bool(can_name),
-                    'can_colour': bool(can_colour),
-                    'can_icon': bool(can_icon)
-                }
+        roles = {}
+        for row in await self.bot.run_db(self._fetch_wardrobe_rows, guild_id):
+            role_id, can_name, can_colour, can_icon = row
+            roles[role_id] = {
+                'can_name': bool(can_name),
+                'can_colour': bool(can_colour),
+                'can_icon': bool(can_icon)
+            }
         
         # Update cache
         self._cache[cache_key] = {
@@ -64,6 +58,15 @@ class Wardrobe_cog(commands.Cog):
         
         return roles
     
+    def _fetch_wardrobe_rows(self, guild_id: int) -> list:
+        cursor = self.db.cursor()
+        cursor.execute('''
+            SELECT role_id, can_name, can_colour, can_icon
+            FROM wardrobe_roles
+            WHERE guild_id = ?
+        ''', (guild_id,))
+        return cursor.fetchall()
+    
     def invalidate_wardrobe_cache(self, guild_id: int):
         """
         Invalidate the cache for a specific guild.
@@ -102,6 +105,81 @@ class Wardrobe_cog(commands.Cog):
                 ON wardrobe_roles (role_id)
             ''')
     
+    def _clear_creator_user(self, guild_id: int, user_id: int) -> int:
+        with self.db:
+            cursor = self.db.cursor()
+            # Remove any entries where this member was a creator of a wardrobe role
+            cursor.execute('''
+                UPDATE wardrobe_roles 
+                SET created_by_user_id = NULL 
+                WHERE guild_id = ? AND created_by_user_id = ?
+            ''', (guild_id, user_id))
+            return cursor.rowcount
+    
+    def _delete_role(self, role_id: int) -> int:
+        with self.db:
+            cursor = self.db.cursor()
+            cursor.execute('''
+                DELETE FROM wardrobe_roles 
+                WHERE role_id = ?
+            ''', (role_id,))
+            return cursor.rowcount
+    
+    def _delete_guild_role(self, guild_id: int, role_id: int) -> bool:
+        """Remove a configured role, returns False if it wasn't configured"""
+        cursor = self.db.cursor()
+        cursor.execute('''
+            SELECT 1 FROM wardrobe_roles 
+            WHERE guild_id = ? AND role_id = ?
+        ''', (guild_id, role_id))
+        
+        if not cursor.fetchone():
+            return False
+        
+        cursor.execute('''
+            DELETE FROM wardrobe_roles 
+            WHERE guild_id = ? AND role_id = ?
+        ''', (guild_id, role_id))
+        
+        self.db.commit()
+        return True
+    
+    def _fetch_role_config(self, guild_id: int, role_id: int):
+        cursor = self.db.cursor()
+        cursor.execute('''
+            SELECT can_name, can_colour, can_icon, created_by_role_id, created_by_user_id
+            FROM wardrobe_roles
+            WHERE guild_id = ? AND role_id = ?
+        ''', (guild_id, role_id))
+        return cursor.fetchone()
+    
+    def _fetch_role_configs(self, guild_id: int) -> list:
+        cursor = self.db.cursor()
+        cursor.execute('''
+            SELECT role_id, can_name, can_colour, can_icon, created_by_role_id, created_by_user_id
+            FROM wardrobe_roles
+            WHERE guild_id = ?
+            ORDER BY role_id
+        ''', (guild_id,))
+        return cursor.fetchall()
+    
+    def _store_role(self, params: tuple):
+        with self.db:
+            self.db.execute('''
+                INSERT OR REPLACE INTO wardrobe_roles (
+                    guild_id, role_id, can_name, can_colour, can_icon, created_by_role_id, created_by_user_id
+                ) VALUES (?, ?, ?, ?, ?, ?, ?)
+            ''', params)
+    
+    def _fetch_role_creators(self, guild_id: int) -> list:
+        cursor = self.db.cursor()
+        cursor.execute('''
+            SELECT role_id, created_by_role_id, created_by_user_id
+            FROM wardrobe_roles
+            WHERE guild_id = ?
+        ''', (guild_id,))
+        return cursor.fetchall()
+    
     async def cog_check(self, ctx):
         """Global check for all commands in this cog."""
         # Add any global permission checks here
@@ -111,18 +189,9 @@ class Wardrobe_cog(commands.Cog):
     async def on_member_remove(self, member):
         """Clean up member's wardrobe role assignments when they leave the server."""
         try:
-            with self.db:
-                cursor = self.db.cursor()
-                # Remove any entries where this member was a creator of a wardrobe role
-                cursor.execute('''
-                    UPDATE wardrobe_roles 
-                    SET created_by_user_id = NULL 
-                    WHERE guild_id = ? AND created_by_user_id = ?
-                ''', (member.guild.id, member.id))
-                
-                # Invalidate cache if any changes were made
-                if cursor.rowcount > 0:
-                    self.invalidate_wardrobe_cache(member.guild.id)
+            # Invalidate cache if any changes were made
+            if await self.bot.run_db(self._clear_creator_user, member.guild.id, member.id) > 0:
+                self.invalidate_wardrobe_cache(member.guild.id)
                     
         except Exception as e:
             print(f"Error in on_member_remove for {member.id}: {e}")
@@ -131,17 +200,9 @@ class Wardrobe_cog(commands.Cog):
     async def on_guild_role_delete(self, role):
         """Remove deleted roles from the wardrobe system."""
         try:
-            # Remove the role from the database if it exists
-            with self.db:
-                cursor = self.db.cursor()
-                cursor.execute('''
-                    DELETE FROM wardrobe_roles 
-                    WHERE role_id = ?
-                ''', (role.id,))
-                
-                # If any rows were affected, invalidate the cache
-                if cursor.rowcount > 0:
-                    self.invalidate_wardrobe_cache(role.guild.id)
+            # Remove the role from the database if it exists, invalidating the cache if any rows were affected
+            if await self.bot.run_db(self._delete_role, role.id) > 0:
+                self.invalidate_wardrobe_cache(role.guild.id)
                     
         except Exception as e:
             print(f"Error in on_guild_role_delete for role {role.id}: {e}")
@@ -161,27 +222,13 @@ class Wardrobe_cog(commands.Cog):
             return await interaction.response.send_message("❌ This command can only be used in a server.", ephemeral=True)
         
         try:
-            # Verify the role exists in the wardrobe system
-            cursor = self.db.cursor()
-            cursor.execute('''
-                SELECT 1 FROM wardrobe_roles 
-                WHERE guild_id = ? AND role_id = ?
-            ''', (interaction.guild.id, role.id))
-            
-            if not cursor.fetchone():
+            # Verify the role exists in the wardrobe system, then remove it
+            if not await self.bot.run_db(self._delete_guild_role, interaction.guild.id, role.id):
                 return await interaction.response.send_message(
                     f"❌ {role.mention} is not configured in the wardrobe system.",
                     ephemeral=True
                 )
             
-            # Remove the role from the wardrobe system
-            cursor.execute('''
-                DELETE FROM wardrobe_roles 
-                WHERE guild_id = ? AND role_id = ?
-            ''', (interaction.guild.id, role.id))
-            
-            self.db.commit()
-            
             # Invalidate the cache for this guild
             self.invalidate_wardrobe_cache(interaction.guild.id)
             
@@ -213,17 +260,9 @@ class Wardrobe_cog(commands.Cog):
             return await interaction.response.send_message("❌ This command can only be used in a server.", ephemeral=True)
         
         try:
-            cursor = self.db.cursor()
-            
             if role:
                 # Show configuration for a specific role
-                cursor.execute('''
-                    SELECT can_name, can_colour, can_icon, created_by_role_id, created_by_user_id
-                    FROM wardrobe_roles
-                    WHERE guild_id = ? AND role_id = ?
-                ''', (interaction.guild.id, role.id))
-                
-                config = cursor.fetchone()
+                config = await self.bot.run_db(self._fetch_role_config, interaction.guild.id, role.id)
                 if not config:
                     return await interaction.response.send_message(
                         f"❌ {role.mention} is not configured in the wardrobe system.",
@@ -271,14 +310,7 @@ class Wardrobe_cog(commands.Cog):
                 await interaction.response.send_message(embed=embed, ephemeral=True)
             else:
                 # List all configured roles with pagination
-                cursor.execute('''
-                    SELECT role_id, can_name, can_colour, can_icon, created_by_role_id, created_by_user_id
-                    FROM wardrobe_roles
-                    WHERE guild_id = ?
-                    ORDER BY role_id
-                ''', (interaction.guild.id,))
-                
-                all_roles = cursor.fetchall()
+                all_roles = await self.bot.run_db(self._fetch_role_configs, interaction.guild.id)
                 if not all_roles:
                     return await interaction.response.send_message(
                         "❌ No roles are configured in the wardrobe system.",
@@ -409,21 +441,15 @@ class Wardrobe_cog(commands.Cog):
             )
         
         try:
-            with self.db:
-                cursor = self.db.cursor()
-                cursor.execute('''
-                    INSERT OR REPLACE INTO wardrobe_roles (
-                        guild_id, role_id, can_name, can_colour, can_icon, created_by_role_id, created_by_user_id
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    interaction.guild.id,
-                    role.id,
-                    int(can_name),
-                    int(can_colour),
-                    int(can_icon),
-                    editor_role.id if editor_role else None,
-                    editor_user.id if editor_user else None,
-                ))
+            await self.bot.run_db(self._store_role, (
+                interaction.guild.id,
+                role.id,
+                int(can_name),
+                int(can_colour),
+                int(can_icon),
+                editor_role.id if editor_role else None,
+                editor_user.id if editor_user else None,
+            ))
             
             # Invalidate the cache for this guild
             self.invalidate_wardrobe_cache(interaction.guild.id)
@@ -476,14 +502,7 @@ class Wardrobe_cog(commands.Cog):
             return []
         
         # Get all configured roles for the guild with creator information
-        with self.db:
-            cursor = self.db.cursor()
-            cursor.execute('''
-                SELECT role_id, created_by_role_id, created_by_user_id
-                FROM wardrobe_roles
-                WHERE guild_id = ?
-            ''', (interaction.guild.id,))
-            roles_config = cursor.fetchall()
+        roles_config = await self.bot.run_db(self._fetch_role_creators, interaction.guild.id)
         
         if not roles_config:
             return []
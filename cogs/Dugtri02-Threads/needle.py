@@ -11,11 +11,13 @@ class ThreadMonitor(commands.GroupCog, group_name="needle"):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
         self.THREAD_EMOJI = '🪡'  # Needle emoji for thread creation
-        self._create_tables()
         # Cache for channel requirements with TTL
         self._channel_cache: Dict[int, Dict[str, Any]] = {}
         # Lock for thread-safe cache operations
         self._cache_lock = asyncio.Lock()
+    
+    async def cog_load(self) -> None:
+        await self.bot.run_db(self._create_tables)
         
     def _create_tables(self) -> None:
         """Create necessary database tables for thread requirements."""
@@ -32,6 +34,88 @@ class ThreadMonitor(commands.GroupCog, group_name="needle"):
         )
         ''')
         self.bot.db.commit()
+    
+    def _store_requirements(self, channel_id: int, guild_id: int, min_length: Optional[int],
+                            required_keyword: Optional[str], auto_react: Optional[bool]) -> None:
+        # Update or insert requirements
+        self.bot.db.execute('''
+            INSERT INTO thread_requirements (channel_id, guild_id, min_length, required_keyword, auto_react)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(channel_id) DO UPDATE SET
+                guild_id = excluded.guild_id,
+                min_length = COALESCE(?, min_length),
+                required_keyword = COALESCE(?, required_keyword),
+                auto_react = COALESCE(?, auto_react)
+        ''', (
+            channel_id,
+            guild_id,
+            min_length,
+            required_keyword,
+            auto_react,
+            min_length,
+            required_keyword,
+            auto_react
+        ))
+        self.bot.db.commit()
+    
+    def _delete_requirements(self, channel_id: int, min_length: bool = False, keyword: bool = False) -> None:
+        """Clear the given rules for a channel, deleting its row when no rule would be left."""
+        cursor = self.bot.db.cursor()
+        
+        if min_length or keyword:
+            # Update only specified fields to NULL
+            updates = []
+            
+            if min_length:
+                updates.append("min_length = NULL")
+            if keyword:
+                updates.append("required_keyword = NULL")
+            
+            # If all fields would be NULL, delete the entire row
+            cursor.execute(
+                'SELECT min_length, required_keyword FROM thread_requirements WHERE channel_id = ?',
+                (channel_id,)
+            )
+            current = cursor.fetchone()
+            
+            if current:
+                current_min, current_keyword = current
+                will_be_null = (
+                    (min_length or current_min is None) and
+                    (keyword or current_keyword is None)
+                )
+                
+                if will_be_null:
+                    # Delete the entire row if all fields would be NULL
+                    cursor.execute(
+                        'DELETE FROM thread_requirements WHERE channel_id = ?',
+                        (channel_id,)
+                    )
+                else:
+                    # Update only the specified fields
+                    set_clause = ", ".join(updates)
+                    query = f"""
+                        UPDATE thread_requirements 
+                        SET {set_clause}
+                        WHERE channel_id = ?
+                    """
+                    cursor.execute(query, (channel_id,))
+        else:
+            # Delete all rules if no specific ones specified
+            cursor.execute(
+                'DELETE FROM thread_requirements WHERE channel_id = ?',
+                (channel_id,)
+            )
+        
+        self.bot.db.commit()
+    
+    def _fetch_requirements(self, channel_id: int):
+        cursor = self.bot.db.cursor()
+        cursor.execute(
+            'SELECT min_length, required_keyword, auto_react FROM thread_requirements WHERE channel_id = ?',
+            (channel_id,)
+        )
+        return cursor.fetchone()
         
     @commands.Cog.listener()
     async def on_message(self, message: discord.Message) -> None:
@@ -133,41 +217,23 @@ class ThreadMonitor(commands.GroupCog, group_name="needle"):
         auto_react: Optional[bool] = None
     ) -> None:
         """Set thread creation requirements for a channel and update cache."""
-        cursor = self.bot.db.cursor()
-        
         if min_length is None and required_keyword is None and auto_react is None:
             # Remove requirements if all are None
-            cursor.execute(
-                'DELETE FROM thread_requirements WHERE channel_id = ?',
-                (channel.id,)
-            )
+            await self.bot.run_db(self._delete_requirements, channel.id)
             # Invalidate cache
             await self._update_cache(channel.id, None)
         else:
-            # Update or insert requirements
-            cursor.execute('''
-                INSERT INTO thread_requirements (channel_id, guild_id, min_length, required_keyword, auto_react)
-                VALUES (?, ?, ?, ?, ?)
-                ON CONFLICT(channel_id) DO UPDATE SET
-                    guild_id = excluded.guild_id,
-                    min_length = COALESCE(?, min_length),
-                    required_keyword = COALESCE(?, required_keyword),
-                    auto_react = COALESCE(?, auto_react)
-            ''', (
+            await self.bot.run_db(
+                self._store_requirements,
                 channel.id,
                 channel.guild.id,
                 min_length,
                 required_keyword.lower() if required_keyword else None,
-                auto_react,
-                min_length,
-                required_keyword.lower() if required_keyword else None,
                 auto_react
-            ))
+            )
             # Update cache with new values
             requirements = await self.get_thread_requirements(channel.id, use_cache=False)
             await self._update_cache(channel.id, requirements)
-        
-        self.bot.db.commit()
     
     async def _get_cached_requirements(self, channel_id: int) -> Optional[dict]:
         """Get requirements from cache if valid, otherwise fetch from DB."""
@@ -197,12 +263,7 @@ class ThreadMonitor(commands.GroupCog, group_name="needle"):
                 return cached
 
         # Not in cache or cache disabled, fetch from DB
-        cursor = self.bot.db.cursor()
-        cursor.execute(
-            'SELECT min_length, required_keyword, auto_react FROM thread_requirements WHERE channel_id = ?',
-            (channel_id,)
-        )
-        result = cursor.fetchone()
+        result = await self.bot.run_db(self._fetch_requirements, channel_id)
         
         requirements = None
         if result:
@@ -214,7 +275,6 @@ class ThreadMonitor(commands.GroupCog, group_name="needle"):
         
         # Update cache
         await self._update_cache(channel_id, requirements)
-        self.bot.db.commit()
         return requirements
     
     @app_commands.command(name="setup", description="Setup thread requirements for a channel.")
@@ -367,55 +427,7 @@ class ThreadMonitor(commands.GroupCog, group_name="needle"):
             await interaction.response.send_message("❌ This command can only be used in text channels.", ephemeral=True)
             return
         
-        cursor = self.bot.db.cursor()
-        
-        if min_length or keyword:
-            # Update only specified fields to NULL
-            updates = []
-            params = []
-            
-            if min_length:
-                updates.append("min_length = NULL")
-            if keyword:
-                updates.append("required_keyword = NULL")
-            
-            # If all fields would be NULL, delete the entire row
-            cursor.execute(
-                'SELECT min_length, required_keyword FROM thread_requirements WHERE channel_id = ?',
-                (target_channel.id,)
-            )
-            current = cursor.fetchone()
-            
-            if current:
-                current_min, current_keyword = current
-                will_be_null = (
-                    (min_length or current_min is None) and
-                    (keyword or current_keyword is None)
-                )
-                
-                if will_be_null:
-                    # Delete the entire row if all fields would be NULL
-                    cursor.execute(
-                        'DELETE FROM thread_requirements WHERE channel_id = ?',
-                        (target_channel.id,)
-                    )
-                else:
-                    # Update only the specified fields
-                    set_clause = ", ".join(updates)
-                    query = f"""
-                        UPDATE thread_requirements 
-                        SET {set_clause}
-                        WHERE channel_id = ?
-                    """
-                    cursor.execute(query, (target_channel.id,))
-        else:
-            # Delete all rules if no specific ones specified
-            cursor.execute(
-                'DELETE FROM thread_requirements WHERE channel_id = ?',
-                (target_channel.id,)
-            )
-        
-        self.bot.db.commit()
+        await self.bot.run_db(self._delete_requirements, target_channel.id, min_length, keyword)
         
         # Invalidate cache
         await self._update_cache(target_channel.id, None)
@@ -1,26 +1,70 @@
-import discord
+import discord, logging, sqlite3
+from collections import defaultdict
 from discord.ext import commands
 from discord import app_commands
 
+logger = logging.getLogger(__name__)
+
+_EMPTY = frozenset()
+
 class DoorstopCog(commands.GroupCog, name="watcher"):
     def __init__(self, bot):
         self.bot = bot
         self.db = bot.db
-        self._create_tables()
+        # guild_id -> doorstop thread ids, loaded once and kept in step with the table by the commands and delete listeners
+        self._doorstop: defaultdict[int, set[int]] = defaultdict(set)
+    
+    async def cog_load(self):
+        await self.bot.run_db(self._create_tables)
     
     def _create_tables(self):
-        cursor = self.db.cursor()
-        # If table does not exist, create it
-        cursor.execute('''
-        CREATE TABLE IF NOT EXISTS doorstop_threads (
-            guild_id INTEGER NOT NULL,
-            channel_id INTEGER NOT NULL,
-            thread_id INTEGER NOT NULL,
-            PRIMARY KEY (guild_id, thread_id)
-        )
-        ''')
+        with self.db:
+            # If table does not exist, create it
+            self.db.execute('''
+            CREATE TABLE IF NOT EXISTS doorstop_threads (
+                guild_id INTEGER NOT NULL,
+                channel_id INTEGER NOT NULL,
+                thread_id INTEGER NOT NULL,
+                PRIMARY KEY (guild_id, thread_id)
+            )
+            ''')
+
+        for guild_id, thread_id in self.db.execute('SELECT guild_id, thread_id FROM doorstop_threads'):
+            self._doorstop[guild_id].add(thread_id)
+
+    def _insert_thread(self, guild_id: int, channel_id: int, thread_id: int):
+        self.db.execute('''
+        INSERT OR IGNORE INTO doorstop_threads (guild_id, channel_id, thread_id)
+        VALUES (?, ?, ?)
+        ''', (guild_id, channel_id, thread_id))
         self.db.commit()
 
+    def _delete_thread(self, guild_id: int, thread_id: int):
+        self.db.execute('''
+        DELETE FROM doorstop_threads
+        WHERE guild_id = ? AND thread_id = ?
+        ''', (guild_id, thread_id))
+        self.db.commit()
+
+    def _delete_threads(self, guild_id: int, thread_ids):
+        """Delete several threads with one statement."""
+        placeholders = ",".join("?" * len(thread_ids))
+        self.db.execute(f'''
+        DELETE FROM doorstop_threads
+        WHERE guild_id = ? AND thread_id IN ({placeholders})
+        ''', (guild_id, *thread_ids))
+        self.db.commit()
+
+    def _channel_thread_ids(self, guild_id: int, channel_id: int) -> list[int]:
+        return [row[0] for row in self.db.execute('''
+        SELECT thread_id FROM doorstop_threads WHERE guild_id = ? AND channel_id = ?
+        ''', (guild_id, channel_id))]
+
+    def _clear_threads(self, guild_id: int):
+        self.db.execute('''
+        DELETE FROM doorstop_threads WHERE guild_id = ?
+        ''', (guild_id,))
+        self.db.commit()
 
     @app_commands.command(name="add", description="Add a thread to the doorstop list")
     @app_commands.checks.has_permissions(manage_threads=True)
@@ -28,56 +72,50 @@ class DoorstopCog(commands.GroupCog, name="watcher"):
         thread="The thread to add to the doorstop list",
     )
     async def add(self, interaction: discord.Interaction, thread: discord.Thread):
+        await interaction.response.defer(ephemeral=True)
+        guild_threads = self._doorstop[interaction.guild.id]
         try:
             # Get the parent channel
             parent_channel = thread.parent
             if not parent_channel:
-                await interaction.response.send_message("Could not determine the parent channel of this thread.", ephemeral=True)
+                await interaction.followup.send("Could not determine the parent channel of this thread.", ephemeral=True)
                 return
             
-            cursor = self.db.cursor()
-            
             # Check if this thread is already in the doorstop list
-            cursor.execute('''
-            SELECT thread_id FROM doorstop_threads 
-            WHERE guild_id = ? AND thread_id = ?
-            ''', (interaction.guild.id, thread.id))
-            
-            if cursor.fetchone() is not None:
-                await interaction.response.send_message(
+            if thread.id in guild_threads:
+                await interaction.followup.send(
                     "This thread is already in the doorstop list.",
                     ephemeral=True
                 )
                 return
             
             # Check current thread count for this guild
-            cursor.execute('''
-            SELECT COUNT(*) FROM doorstop_threads WHERE guild_id = ?
-            ''', (interaction.guild.id,))
-            thread_count = cursor.fetchone()[0]
+            thread_count = len(guild_threads)
 
             max_threads = 10
             
             if thread_count >= max_threads:
-                await interaction.response.send_message(
+                await interaction.followup.send(
                     f"Maximum of {max_threads} doorstop threads reached for this server. Please remove some before adding more.",
                     ephemeral=True
                 )
                 return
                 
-            cursor.execute('''
-            INSERT OR REPLACE INTO doorstop_threads (guild_id, channel_id, thread_id)
-            VALUES (?, ?, ?)
-            ''', (interaction.guild.id, parent_channel.id, thread.id))
-            self.db.commit()
-            await interaction.response.send_message(
+            # Claim the slot before awaiting so a concurrent add can't go over the limit
+            guild_threads.add(thread.id)
+            try:
+                await self.bot.run_db(self._insert_thread, interaction.guild.id, parent_channel.id, thread.id)
+            except Exception:
+                guild_threads.discard(thread.id)
+                raise
+            await interaction.followup.send(
                 f"Thread '{thread.mention}' in {parent_channel.mention} added to the doorstop list. "
                 f"({thread_count + 1}/{max_threads} threads used)", 
                 ephemeral=True
             )
-        except Exception as e:
-            print(f"Error adding thread: {e}")
-            await interaction.response.send_message("Failed to add thread to the doorstop list.", ephemeral=True)
+        except sqlite3.Error:
+            logger.exception(f"Error adding thread {thread.id} to the doorstop list")
+            await interaction.followup.send("Failed to add thread to the doorstop list.", ephemeral=True)
 
     @app_commands.command(name="remove", description="Remove a thread from the doorstop list.")
     @app_commands.checks.has_permissions(manage_threads=True)
@@ -86,64 +124,36 @@ class DoorstopCog(commands.GroupCog, name="watcher"):
     )
     async def remove(self, interaction: discord.Interaction, thread: discord.Thread):
         """Remove a thread from the doorstop list."""
+        await interaction.response.defer(ephemeral=True)
         try:
-                
-            cursor = self.db.cursor()
-            cursor.execute('''
-            DELETE FROM doorstop_threads
-            WHERE guild_id = ? AND thread_id = ?
-            ''', (interaction.guild.id, thread.id))
-            
-            if cursor.rowcount > 0:
-                self.db.commit()
-                await interaction.response.send_message(
+            guild_threads = self._doorstop.get(interaction.guild.id)
+            if guild_threads and thread.id in guild_threads:
+                await self.bot.run_db(self._delete_thread, interaction.guild.id, thread.id)
+                guild_threads.discard(thread.id)
+                await interaction.followup.send(
                     f"Thread '{thread.mention}' removed from the doorstop list.", 
                     ephemeral=True
                 )
             else:
-                await interaction.response.send_message(
+                await interaction.followup.send(
                     "This thread is not in the doorstop list.",
                     ephemeral=True
                 )
                 
-        except Exception as e:
-            print(f"Error removing thread: {e}")
-            await interaction.response.send_message("Failed to remove thread from the doorstop list.", ephemeral=True)
+        except sqlite3.Error:
+            logger.exception(f"Error removing thread {thread.id} from the doorstop list")
+            await interaction.followup.send("Failed to remove thread from the doorstop list.", ephemeral=True)
     
     @app_commands.command(name="list", description="List all threads in the doorstop list.")
     @app_commands.checks.has_permissions(manage_threads=True)
     async def list(self, interaction: discord.Interaction):
         """List all threads in the doorstop list."""
-        cursor = self.db.cursor()
-        cursor.execute('''
-        SELECT thread_id FROM doorstop_threads WHERE guild_id = ?
-        ''', (interaction.guild.id,))
-        thread_ids = [row[0] for row in cursor.fetchall()]
-        
-        # Check current thread count for this guild
-        cursor.execute('''
-        SELECT COUNT(*) FROM doorstop_threads WHERE guild_id = ?
-        ''', (interaction.guild.id,))
-        thread_count = cursor.fetchone()[0]
+        await interaction.response.defer(ephemeral=True)
+        thread_ids = self._doorstop.get(interaction.guild.id, set())
+        thread_count = len(thread_ids)
         
         if not thread_ids:
-            await interaction.response.send_message("No threads found in the doorstop list.", ephemeral=True)
-            return
-        
-        # Fetch all threads from all channels
-        all_threads = []
-        for channel in interaction.guild.text_channels:
-            if isinstance(channel, (discord.TextChannel, discord.ForumChannel)):
-                try:
-                    all_threads.extend(channel.threads)
-                except Exception:
-                    continue
-        
-        # Find threads that are in our list
-        thread_objects = [t for t in all_threads if t.id in thread_ids]
-        
-        if not thread_objects:
-            await interaction.response.send_message("No active threads found in the doorstop list.", ephemeral=True)
+            await interaction.followup.send("No threads found in the doorstop list.", ephemeral=True)
             return
         
         # Create an embed with the list of threads
@@ -157,7 +167,12 @@ class DoorstopCog(commands.GroupCog, name="watcher"):
         
         embed.set_footer(text=f"{thread_count}/{max_threads} threads")
         
-        for thread in thread_objects:
+        # Listing only reads the cache, threads missing from it (e.g. archived) are shown by mention alone
+        for thread_id in thread_ids:
+            thread = interaction.guild.get_thread(thread_id)
+            if thread is None:
+                embed.add_field(name="Archived or uncached thread", value=f"<#{thread_id}>", inline=False)
+                continue
             channel_name = f" in {thread.parent.mention}" if thread.parent else ""
             embed.add_field(
                 name=thread.name,
@@ -165,18 +180,16 @@ class DoorstopCog(commands.GroupCog, name="watcher"):
                 inline=False
             )
         
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        await interaction.followup.send(embed=embed, ephemeral=True)
     
     @app_commands.command(name="clear", description="Clear all threads from the doorstop list.")
     @app_commands.checks.has_permissions(manage_threads=True)
     async def clear(self, interaction: discord.Interaction):
         """Clear all threads from the doorstop list."""
-        cursor = self.db.cursor()
-        cursor.execute('''
-        DELETE FROM doorstop_threads WHERE guild_id = ?
-        ''', (interaction.guild.id,))
-        self.db.commit()
-        await interaction.response.send_message("All threads removed from the doorstop list.", ephemeral=True)
+        await interaction.response.defer(ephemeral=True)
+        await self.bot.run_db(self._clear_threads, interaction.guild.id)
+        self._doorstop.pop(interaction.guild.id, None)
+        await interaction.followup.send("All threads removed from the doorstop list.", ephemeral=True)
     
     @commands.Cog.listener()
     async def on_thread_update(self, before: discord.Thread, after: discord.Thread):
@@ -186,17 +199,43 @@ class DoorstopCog(commands.GroupCog, name="watcher"):
             return  # No change in archived state
             
         if after.archived:  # Thread was just archived/closed
-            cursor = self.db.cursor()
-            cursor.execute('''
-            SELECT 1 FROM doorstop_threads 
-            WHERE guild_id = ? AND thread_id = ?
-            ''', (after.guild.id, after.id))
-            
-            if cursor.fetchone():  # Thread is in the doorstop list
+            guild_id = after.guild.id
+            thread_id = after.id
+            if thread_id in self._doorstop.get(guild_id, _EMPTY):  # Thread is in the doorstop list
                 try:
                     await after.edit(archived=False, reason="Opened by '/doorstop' configuration.")
                 except discord.HTTPException as e:
-                    print(f"Failed to reopen thread {after.id}: {e}")
+                    logger.warning(f"Failed to reopen thread {thread_id}: {e}")
+
+    async def _forget_threads(self, guild_id: int, thread_ids):
+        """Drop deleted threads from the cache and the table, freeing their slots."""
+        guild_threads = self._doorstop.get(guild_id, _EMPTY)
+        deleted_ids = [thread_id for thread_id in thread_ids if thread_id in guild_threads]
+        if not deleted_ids:
+            return
+        guild_threads.difference_update(deleted_ids)
+        try:
+            await self.bot.run_db(self._delete_threads, guild_id, deleted_ids)
+        except sqlite3.Error:
+            logger.exception(f"Error removing deleted threads {deleted_ids} from the doorstop list")
+
+    @commands.Cog.listener()
+    async def on_raw_thread_delete(self, payload: discord.RawThreadDeleteEvent):
+        """Remove a deleted thread from the doorstop list."""
+        await self._forget_threads(payload.guild_id, (payload.thread_id,))
+
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel):
+        """Remove the threads of a deleted channel, Discord sends no delete event for each of them."""
+        if not self._doorstop.get(channel.guild.id):
+            return
+        thread_ids = await self.bot.run_db(self._channel_thread_ids, channel.guild.id, channel.id)
+        await self._forget_threads(channel.guild.id, thread_ids)
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild):
+        """Forget the guild's threads, its rows are cleaned up by the bot."""
+        self._doorstop.pop(guild.id, None)
 
 async def setup(bot):
     await bot.add_cog(DoorstopCog(bot))
@@ -3,10 +3,10 @@ REM Launch the Mini-Tool Discord bot
 
 REM Check Python version
 python --version > pyver.txt 2>&1
-findstr /R /C:"Python 3\.1[01]\.[0-9]" pyver.txt >nul
+findstr /R /C:"Python 3\.11\.[0-9]" pyver.txt >nul
 if errorlevel 1 (
     echo.
-    echo [ERROR] Python 3.10.x or 3.11.x is required. Please install Python 3.10/3.11 and make sure it's in your PATH.
+    echo [ERROR] Python 3.11.x is required. Please install Python 3.11 and make sure it's in your PATH.
     echo Detected version:
     type pyver.txt
     del pyver.txt